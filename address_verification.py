@@ -6,32 +6,213 @@ is missing) we gracefully degrade to a no-op verifier that returns the
 original address as 'standardized'.
 """
 
+import functools
 import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.cache import TTLCache
+from utils.rate_limit import RateLimiter
 
 USPS_USER_ID = os.environ.get('USPS_USER_ID')
 
-_usps_client = None
-try:
-    if USPS_USER_ID:
+# Retry policy for throttled (429) and transient server (5xx) USPS responses.
+# Verification runs inside signup requests, so the time spent waiting for
+# quota and backing off is capped at _USPS_RETRY_BUDGET seconds per address.
+_USPS_RETRY_ATTEMPTS = 3
+_USPS_RETRY_MAX_DELAY = 60
+_USPS_RETRY_BUDGET = 5.0
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# USPS quotas are ~5 requests/minute and ~60/hour per application. Requests
+# that would have to wait longer than _USPS_MAX_WAIT skip USPS entirely.
+_usps_limiter = RateLimiter((5, 60), (60, 3600))
+_USPS_MAX_WAIT = 2.0
+
+
+# Shared keep-alive connection pool for USPS so each verification reuses an
+# open TLS connection. urllib3 retries are off; _call_usps handles retries.
+_session = requests.Session()
+_session.headers['Connection'] = 'keep-alive'
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+
+
+class _RaisingTransport:
+    """Stand-in for the `requests` module used inside the usps package.
+
+    The package never checks HTTP status codes, so a 429 surfaces as an
+    unparseable body. Raising HTTPError lets `_call_usps` tell throttling
+    apart from genuine address errors. Requests go through the pooled
+    `_session`.
+    """
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', 10)
+        response = _session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+
+@functools.lru_cache(maxsize=1)
+def _get_usps_client():
+    """Import and construct the USPS client on first use.
+
+    Deferred so processes that never verify an address (migrations, CLI
+    scripts) don't pay for the import. Returns None when USPS is not
+    configured or the package is missing.
+    """
+    if not USPS_USER_ID:
+        return None
+    try:
         from usps import USPSApi  # type: ignore
-        _usps_client = USPSApi(USPS_USER_ID)
-except Exception as e:  # pragma: no cover
-    # Log and continue without USPS capabilities
-    print(f"USPS integration disabled: {e}")
+        usps_module = sys.modules.get(USPSApi.__module__)
+        if hasattr(usps_module, 'requests'):
+            usps_module.requests = _RaisingTransport()
+        return USPSApi(USPS_USER_ID)
+    except Exception as e:  # pragma: no cover
+        # Log and continue without USPS capabilities
+        print(f"USPS integration disabled: {e}")
+        return None
+
+
+# USPS results keyed on normalized input; users frequently resubmit the same
+# address (form retries, re-edits), so a hit skips the network round-trip.
+_verify_cache = TTLCache(maxsize=50_000, ttl=86400)
 
-def verify_address(street_address, city, state, zipcode, apt_unit=None):
+# Inputs USPS would reject anyway; checked before spending a request on them
+_ZIP_RE = re.compile(r'^\d{5}(-?\d{4})?$')
+_STATE_RE = re.compile(r'^[A-Za-z]{2}$')
+
+
+def _normalize(value):
+    """Lowercase and collapse whitespace so trivial variants share a key."""
+    return ' '.join((value or '').split()).lower()
+
+
+def _cache_key(street_address, city, state, zipcode, apt_unit=None):
+    """Build the verification cache key (ZIP is reduced to its 5-digit part)."""
+    return (
+        _normalize(street_address),
+        _normalize(apt_unit),
+        _normalize(city),
+        _normalize(state),
+        _normalize(zipcode)[:5],
+    )
+
+
+def _retry_delay(attempt, response=None):
+    """Seconds to wait before retry `attempt`, honouring Retry-After."""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.strip().isdigit():
+        return min(_USPS_RETRY_MAX_DELAY, int(retry_after))
+    return min(_USPS_RETRY_MAX_DELAY, 0.5 * 2 ** attempt) + random.uniform(0, 0.5)
+
+
+class _USPSThrottled(Exception):
+    """No USPS quota was available in time, or USPS kept answering 429."""
+
+
+def _acquire_usps_slot(max_wait=_USPS_MAX_WAIT):
+    """Reserve a USPS request slot, waiting up to `max_wait` seconds for one.
+
+    Returns the seconds spent waiting, or None if no slot came free in time.
+    """
+    waited = 0.0
+    while True:
+        wait = _usps_limiter.try_acquire()
+        if not wait:
+            return waited
+        if waited + wait > max_wait:
+            return None
+        time.sleep(wait)
+        waited += wait
+
+
+def _local_standardize(street_address, city, state, zipcode, apt_unit=None):
+    """Basic whitespace/case normalization used when USPS is unavailable."""
+    return {
+        'street_address': street_address.strip(),
+        'apt_unit': apt_unit.strip() if apt_unit else None,
+        'city': city.strip(),
+        'state': state.strip().upper(),
+        'zipcode': zipcode.strip()
+    }
+
+
+def _call_usps(client, address, quota_wait=_USPS_MAX_WAIT, budget=_USPS_RETRY_BUDGET):
+    """Validate `address` with USPS, backing off on 429/5xx responses.
+
+    Every attempt, retries included, first takes a slot from the USPS rate
+    limiter, waiting up to `quota_wait` seconds. Retrying stops after
+    _USPS_RETRY_ATTEMPTS attempts, or once the quota waits and backoff
+    sleeps would pass `budget` seconds.
+
+    Raises _USPSThrottled when no slot is free in time or the last failure
+    was a 429. Other HTTP errors (bad requests, or 5xx retries used up)
+    are raised as-is.
+    """
+    spent = 0.0
+    for attempt in range(_USPS_RETRY_ATTEMPTS):
+        waited = _acquire_usps_slot(min(quota_wait, budget - spent))
+        if waited is None:
+            raise _USPSThrottled()
+        spent += waited
+        try:
+            return client.validate_address(address)
+        except requests.HTTPError as e:
+            response = e.response
+            status = response.status_code if response is not None else None
+            if status not in _RETRYABLE_STATUS:
+                raise
+            delay = _retry_delay(attempt, response)
+            if attempt == _USPS_RETRY_ATTEMPTS - 1 or spent + delay > budget:
+                if status == 429:
+                    raise _USPSThrottled() from e
+                raise
+            time.sleep(delay)
+            spent += delay
+
+
+def verify_address(street_address, city, state, zipcode, apt_unit=None, wait_for_quota=False):
     """Verify an address.
 
+    By default this gives up on USPS after a few seconds of waiting for
+    quota or backing off, since it runs inside web requests. With
+    `wait_for_quota=True` (offline backfills) it blocks until quota is free.
+
     Returns: (is_valid: bool, standardized_address: dict|None)
     - If USPS is configured and succeeds, returns standardized components.
+      Malformed ZIP codes or states are rejected without calling USPS.
     - If USPS not available, returns True with a basic normalized structure.
+    - If the USPS quota is exhausted or USPS keeps answering 429, returns
+      True with the basic normalized structure marked `_rate_limited=True`;
+      callers should not treat such an address as verified.
     - On error, returns False, None.
     """
     if not street_address or not city or not state or not zipcode:
         return False, None
 
     # Attempt USPS validation if client present
-    if _usps_client:
+    client = _get_usps_client()
+    if client:
+        key = _cache_key(street_address, city, state, zipcode, apt_unit)
+        cached = _verify_cache.get(key)
+        if cached is not None:
+            is_valid, standardized = cached
+            return is_valid, dict(standardized) if standardized else None
+        if not _ZIP_RE.match(zipcode.strip()) or not _STATE_RE.match(state.strip()):
+            return False, None
+        if wait_for_quota:
+            quota_wait = budget = float('inf')
+        else:
+            quota_wait, budget = _USPS_MAX_WAIT, _USPS_RETRY_BUDGET
         try:
             address = {
                 'address_1': street_address,
@@ -40,11 +221,17 @@ def verify_address(street_address, city, state, zipcode, apt_unit=None):
                 'state': state,
                 'zipcode': zipcode
             }
-            validation = _usps_client.validate_address(address)
+            try:
+                validation = _call_usps(client, address, quota_wait, budget)
+            except _USPSThrottled:
+                standardized = _local_standardize(street_address, city, state, zipcode, apt_unit)
+                standardized['_rate_limited'] = True
+                return True, standardized
             resp = validation.result.get('AddressValidateResponse')
             if resp and 'Address' in resp:
                 addr = resp['Address']
                 if addr.get('Error'):
+                    _verify_cache.set(key, (False, None))
                     return False, None
                 standardized = {
                     'street_address': addr.get('Address2', addr.get('Address1', '')),
@@ -53,27 +240,64 @@ def verify_address(street_address, city, state, zipcode, apt_unit=None):
                     'state': addr.get('State', state),
                     'zipcode': addr.get('Zip5', '') + (('-' + addr.get('Zip4')) if addr.get('Zip4') else '')
                 }
-                return True, standardized
+                _verify_cache.set(key, (True, standardized))
+                return True, dict(standardized)
+            _verify_cache.set(key, (False, None))
             return False, None
         except Exception as e:  # pragma: no cover
             print(f"Address verification error (USPS fallback): {e}")
             # fall through to local normalization
 
     # Fallback normalization (non-USPS)
-    standardized = {
-        'street_address': street_address.strip(),
-        'apt_unit': apt_unit.strip() if apt_unit else None,
-        'city': city.strip(),
-        'state': state.strip().upper(),
-        'zipcode': zipcode.strip()
-    }
-    return True, standardized
+    return True, _local_standardize(street_address, city, state, zipcode, apt_unit)
+
+
+verify_address.cache_clear = _verify_cache.clear
+
+
+def verify_addresses_bulk(rows, max_concurrency=10, chunk_size=100):
+    """Verify many addresses concurrently (for backfills and imports).
+
+    Each verification blocks until USPS quota is free (see verify_address's
+    `wait_for_quota`) instead of giving up after a couple of seconds, so a
+    large run is paced by the USPS quota rather than flagging most rows.
+    Cached and malformed addresses never wait.
+
+    Args:
+        rows: Iterable of dicts with street_address, city, state, zipcode
+            and optional apt_unit keys (e.g. built from User rows).
+        max_concurrency: Maximum number of verifications in flight.
+        chunk_size: Rows processed per batch; bounds memory for large runs.
+
+    Yields:
+        (row, is_valid, standardized) tuples in input order, one chunk at a
+        time so callers can persist results as they arrive. A row whose
+        `standardized` has `_rate_limited=True` was not checked by USPS
+        (USPS kept answering 429 through every retry); treat it as
+        unverified and submit it again later.
+    """
+    def _verify(row):
+        return verify_address(
+            row.get('street_address'),
+            row.get('city'),
+            row.get('state'),
+            row.get('zipcode'),
+            row.get('apt_unit'),
+            wait_for_quota=True,
+        )
+
+    rows = iter(rows)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            for row, (is_valid, standardized) in zip(chunk, executor.map(_verify, chunk)):
+                yield row, is_valid, standardized
 
 
 def format_address(street_address, city, state, zipcode, apt_unit=None):
     """Format address components into a single string."""
-    parts = [street_address]
     if apt_unit:
-        parts.append(f"Unit {apt_unit}")
-    parts.extend([f"{city}, {state} {zipcode}"])
-    return ", ".join(parts)
\ No newline at end of file
+        return f"{street_address}, Unit {apt_unit}, {city}, {state} {zipcode}"
+    return f"{street_address}, {city}, {state} {zipcode}"
\ No newline at end of file
@@ -1,26 +1,146 @@
 
-from flask import Blueprint, render_template, request, redirect, url_for, session, flash
-from werkzeug.security import generate_password_hash, check_password_hash
+import math
+import threading
+from flask import Blueprint, render_template, request, redirect, url_for, session, flash, g, current_app
+from sqlalchemy.exc import IntegrityError
+from config import Config
 from extensions import db
 from models import User
 from address_verification import verify_address, format_address
 from rep_lookup import RepresentativeLookup
-from utils.data_fetcher import get_data_fetcher
+from utils.data_fetcher import get_data_fetcher, DataFetcher
+from utils.cache import TTLCache, shared_incr
+from utils.passwords import dummy_verify
+from utils.rate_limit import FixedWindowLimiter
 from functools import wraps
 from utils.validators import (
     validate_username, 
     validate_password, 
     validate_address, 
     validate_apt_unit,
+    validate_zip_state,
     sanitize_input
 )
 
 auth_bp = Blueprint('auth', __name__)
 
+# Representative lookups keyed on normalized address; reps for an address
+# change only after redistricting or an election.
+_reps_cache = TTLCache(maxsize=10_000, ttl=Config.REPS_CACHE_TTL)
 
-def login_required(f):
-    from functools import wraps
 
+def get_current_user():
+    """Return the logged-in User (or None), loaded at most once per request."""
+    if '_current_user' not in g:
+        user_id = session.get('user_id')
+        g._current_user = db.session.get(User, user_id) if user_id else None
+    return g._current_user
+
+
+def get_session_user():
+    """Return the logged-in user's id, username and role from the session.
+    
+    Login stores these in the signed session cookie, so this never touches
+    the database. Use get_current_user() when other columns are needed.
+    """
+    if 'user_id' not in session:
+        return None
+    return {
+        'id': session['user_id'],
+        'username': session.get('username'),
+        'role': session.get('role'),
+    }
+
+
+@auth_bp.before_request
+def _load_current_user():
+    get_current_user()
+
+
+# Text fields shared by the auth forms and their maximum lengths
+_FORM_LIMITS = {
+    'username': 150,
+    'street_address': 255,
+    'apt_unit': 50,
+    'city': 100,
+    'state': 2,
+    'zipcode': 10,
+}
+
+
+@auth_bp.before_request
+def _parse_form():
+    """Sanitize the auth forms' text fields once per POST into `g.form`.
+
+    Passwords are never sanitized and stay in `request.form`.
+    """
+    if request.method == 'POST':
+        g.form = {
+            field: sanitize_input(request.form.get(field, ''), limit)
+            for field, limit in _FORM_LIMITS.items()
+        }
+
+
+def _address_data(user):
+    """Address dict in the shape DataFetcher.fetch_representatives expects.
+
+    The unit number is left out: districts follow the building, and a
+    single shape lets signup and profile share _reps_cache entries.
+    """
+    return {
+        'street': user.street_address,
+        'city': user.city,
+        'state': 'MO',
+        'zip': user.zipcode
+    }
+
+
+def _lookup_reps(address_data):
+    """Fetch representatives for an address, reusing recent results.
+
+    Uses the data fetcher, which handles production vs development.
+    """
+    key = DataFetcher.address_key(address_data)
+    rep_info = _reps_cache.get(key)
+    if rep_info is None:
+        rep_info = get_data_fetcher().fetch_representatives(address_data)
+        if rep_info:
+            _reps_cache.set(key, rep_info)
+    return rep_info
+
+
+def _lookup_reps_for_user(app, user_id):
+    """Look up and store representatives for a user (runs off the request)."""
+    with app.app_context():
+        try:
+            user = db.session.get(User, user_id)
+            if not user:
+                return
+            rep_info = _lookup_reps(_address_data(user))
+            if rep_info:
+                user.update_representatives(rep_info)
+                db.session.commit()
+        except Exception:
+            # Don't fail signup if rep lookup fails
+            db.session.rollback()
+            app.logger.exception("Error looking up representatives for user %s", user_id)
+        finally:
+            db.session.remove()
+
+
+def _enqueue_rep_lookup(user_id):
+    """Run the representative lookup for a new user in a background thread.
+
+    Runs inline when REP_LOOKUP_ASYNC is disabled (e.g. under tests).
+    """
+    app = current_app._get_current_object()
+    if not app.config.get('REP_LOOKUP_ASYNC', True):
+        _lookup_reps_for_user(app, user_id)
+        return
+    threading.Thread(target=_lookup_reps_for_user, args=(app, user_id), daemon=True).start()
+
+
+def login_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         if 'user_id' not in session:
@@ -32,8 +152,6 @@ def login_required(f):
 
 
 def role_required(role_name):
-    from functools import wraps
-
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
@@ -54,84 +172,144 @@ def role_required(role_name):
     return decorator
 
 
-@auth_bp.route('/register', methods=['GET', 'POST'])
-def register():
-    if request.method == 'POST':
-        # Get and sanitize form data
-        username = sanitize_input(request.form.get('username', ''), 150)
-        password = request.form.get('password', '')
-        verify_password = request.form.get('verify_password', '')
-        street_address = sanitize_input(request.form.get('street_address', ''), 255)
-        apt_unit = sanitize_input(request.form.get('apt_unit', ''), 50) or None
-        city = sanitize_input(request.form.get('city', ''), 100)
-        state = sanitize_input(request.form.get('state', ''), 2).upper()
-        zipcode = sanitize_input(request.form.get('zipcode', ''), 10)
-
-        # Validate username
-        valid, error = validate_username(username)
-        if not valid:
-            flash(error)
-            return redirect(url_for('auth.register'))
+# Per-IP throttles on credential and account-creation POSTs. They bound the
+# password hashing and USPS quota a single client can consume.
+_login_limiter = FixedWindowLimiter((5, 60), (50, 3600), name='login')
+_signup_limiter = FixedWindowLimiter((3, 3600), name='signup')
 
-        # Validate password
-        valid, error = validate_password(password)
-        if not valid:
-            flash(error)
-            return redirect(url_for('auth.register'))
-        
-        # Verify passwords match
-        if password != verify_password:
-            flash('Passwords do not match.')
-            return redirect(url_for('auth.register'))
 
-        # Validate address
-        valid, error = validate_address(street_address, city, state, zipcode)
-        if not valid:
-            flash(error)
-            return redirect(url_for('auth.register'))
-        
-        # Validate apt_unit if provided
-        if apt_unit:
-            valid, error = validate_apt_unit(apt_unit)
-            if not valid:
-                flash(error)
-                return redirect(url_for('auth.register'))
+def rate_limited(limiter):
+    """Reject POSTs from a client IP over `limiter`'s rate with HTTP 429.
 
-        # Check if username exists
-        if User.query.filter_by(username=username).first():
-            flash('Username already exists.')
-            return redirect(url_for('auth.register'))
+    The client IP is request.remote_addr, which ProxyFix sets from nginx's
+    X-Forwarded-For. With Redis configured the counts are shared by every
+    worker; otherwise each worker counts on its own.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            if request.method == 'POST' and current_app.config.get('RATELIMIT_ENABLED', True):
+                if current_app.config.get('CACHE_REDIS_URL'):
+                    retry_after = limiter.hit_shared(request.remote_addr, shared_incr)
+                else:
+                    retry_after = limiter.hit(request.remote_addr)
+                if retry_after:
+                    return (
+                        'Too many attempts. Please try again later.',
+                        429,
+                        {'Retry-After': str(math.ceil(retry_after))},
+                    )
+            return f(*args, **kwargs)
 
-        # Verify address
-        is_valid, standardized = verify_address(
-            street_address, city, state, zipcode, apt_unit
-        )
+        return decorated
 
-        if not is_valid:
-            flash('Invalid address. Please check and try again.')
-            return redirect(url_for('auth.register'))
-
-        # Create new user with verified address
-        new_user = User(
-            username=username,
-            street_address=standardized['street_address'],
-            apt_unit=standardized['apt_unit'],
-            city=standardized['city'],
-            state=standardized['state'],
-            zipcode=standardized['zipcode'],
-            address_verified=True
-        )
-        new_user.set_password(password)
+    return decorator
+
+
+_SIGNUP_ROLES = ('regular', 'power', 'admin', 'candidate')
+
+
+def _process_signup_form(form, fields, allow_role=True, mark_verified=False):
+    """Validate a registration form and build the new User.
+
+    Shared by `register` and `signup`. `form` is the raw form (passwords,
+    role) and `fields` the sanitized text fields from `_parse_form`. The
+    returned user is not added to the session; duplicate usernames surface
+    as an IntegrityError on commit.
+
+    The address is always standardized through verify_address, but the
+    user is only marked address_verified when `mark_verified` is set
+    (register). Signup users prove their address by uploading a document.
+
+    Returns:
+        (user, errors): the unsaved User and an empty list on success,
+        otherwise (None, [error messages]).
+    """
+    username = fields['username']
+    password = form.get('password', '')
+    verify_password = form.get('verify_password', '')
+    street_address = fields['street_address']
+    apt_unit = fields['apt_unit'] or None
+    city = fields['city']
+    state = fields['state'].upper()
+    zipcode = fields['zipcode']
+
+    # Run every field check in one pass so all problems are reported at once
+    checks = (
+        validate_username(username),
+        validate_password(password),
+        (password == verify_password, 'Passwords do not match.'),
+        validate_address(street_address, city, state, zipcode),
+        validate_zip_state(zipcode, state),
+        validate_apt_unit(apt_unit),
+    )
+    errors = [error for valid, error in checks if not valid]
+    if errors:
+        return None, errors
+
+    # Verify address
+    is_valid, standardized = verify_address(
+        street_address, city, state, zipcode, apt_unit
+    )
+    if not is_valid:
+        return None, ['Invalid address. Please check and try again.']
+
+    # Validate role
+    role = form.get('role', 'regular') if allow_role else 'regular'
+    if role not in _SIGNUP_ROLES:
+        role = 'regular'
+
+    # For candidate users, find the Candidate Representative placeholder
+    candidate_rep_id = None
+    if role == 'candidate':
+        from models import Representative
+        candidate_rep = Representative.query.filter_by(
+            last_name='Candidate',
+            first_name='Campaign'
+        ).first()
+        if candidate_rep:
+            candidate_rep_id = candidate_rep.id
+
+    user = User(
+        username=username,
+        role=role,
+        street_address=standardized['street_address'],
+        apt_unit=standardized['apt_unit'],
+        city=standardized['city'],
+        state=standardized['state'],
+        zipcode=standardized['zipcode'],
+        address_verified=mark_verified and not standardized.get('_rate_limited'),
+        representative_id=candidate_rep_id
+    )
+    user.set_password(password)
+    return user, []
+
+
+@auth_bp.route('/register', methods=['GET', 'POST'])
+@rate_limited(_signup_limiter)
+def register():
+    if request.method == 'POST':
+        new_user, errors = _process_signup_form(request.form, g.form, allow_role=False,
+                                                   mark_verified=True)
+        if errors:
+            for error in errors:
+                flash(error)
+            return render_template('auth/register.html', form=request.form)
 
         try:
             db.session.add(new_user)
             db.session.commit()
             flash('Registration successful! Please login.')
             return redirect(url_for('auth.login'))
+        except IntegrityError:
+            # Username taken (ix_users_username_lower)
+            db.session.rollback()
+            flash('Username already exists. Please choose another.')
+            return render_template('auth/register.html', form=request.form)
         except Exception as e:
             db.session.rollback()
             flash('Error creating account. Please try again.')
-            return redirect(url_for('auth.register'))
+            return render_template('auth/register.html', form=request.form)
 
     return render_template('auth/register.html')
 
@@ -139,7 +317,7 @@ def register():
 @login_required
 def profile():
     # Get the current user
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('User not found.')
         return redirect(url_for('auth.login'))
@@ -147,36 +325,38 @@ def profile():
     # Look up representatives for the user's address
     rep_info = None
     if user.address_verified:
-        # Use data fetcher - handles production vs development automatically
-        data_fetcher = get_data_fetcher()
-        address_data = {
-            'street': user.street_address,
-            'city': user.city,
-            'state': 'MO',
-            'zip': user.zipcode
-        }
-        rep_info = data_fetcher.fetch_representatives(address_data)
+        rep_info = user.get_cached_reps()
+        if rep_info is None:
+            rep_info = _lookup_reps(_address_data(user))
+            if rep_info:
+                user.set_cached_reps(rep_info)
+                db.session.commit()
     
     return render_template('auth/profile.html', user=user, rep_info=rep_info)
 
 @auth_bp.route('/edit-address', methods=['GET', 'POST'])
 @login_required
 def edit_address():
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('User not found.')
         return redirect(url_for('auth.login'))
     
     if request.method == 'POST':
-        street_address = request.form.get('street_address', '').strip()
-        apt_unit = request.form.get('apt_unit', '').strip() or None
-        city = request.form.get('city', '').strip()
-        state = request.form.get('state', '').strip()
-        zipcode = request.form.get('zipcode', '').strip()
+        street_address = g.form['street_address']
+        apt_unit = g.form['apt_unit'] or None
+        city = g.form['city']
+        state = g.form['state']
+        zipcode = g.form['zipcode']
         
         if not all([street_address, city, state, zipcode]):
             flash('All fields except apartment/unit are required.')
-            return redirect(url_for('auth.edit_address'))
+            return render_template('auth/edit_address.html', user=user)
+        
+        valid, error = validate_zip_state(zipcode, state)
+        if not valid:
+            flash(error)
+            return render_template('auth/edit_address.html', user=user)
         
         # Verify new address
         is_valid, standardized = verify_address(
@@ -185,7 +365,7 @@ def edit_address():
         
         if not is_valid:
             flash('Invalid address. Please check and try again.')
-            return redirect(url_for('auth.edit_address'))
+            return render_template('auth/edit_address.html', user=user)
         
         # Update user's address
         try:
@@ -194,7 +374,9 @@ def edit_address():
             user.city = standardized['city']
             user.state = standardized['state']
             user.zipcode = standardized['zipcode']
-            user.address_verified = True
+            user.address_verified = not standardized.get('_rate_limited')
+            # Representatives depend on the address; refetch on next profile view
+            user.set_cached_reps(None)
             
             db.session.commit()
             flash('Address updated successfully.')
@@ -210,7 +392,7 @@ def edit_address():
 @login_required
 def change_password():
     if request.method == 'POST':
-        user = User.query.get(session['user_id'])
+        user = get_current_user()
         if not user:
             flash('User not found.')
             return redirect(url_for('auth.login'))
@@ -236,10 +418,11 @@ def change_password():
 
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
+@rate_limited(_login_limiter)
 def login():
     if request.method == 'POST':
         # Sanitize inputs
-        username = sanitize_input(request.form.get('username', ''), 150)
+        username = g.form['username']
         password = request.form.get('password', '')
         
         # Basic validation
@@ -254,16 +437,22 @@ def login():
         # Validate username format
         valid, error = validate_username(username)
         if not valid:
+            dummy_verify(password)
             flash('Invalid username or password.')
             return render_template('login.html')
         
         # Check credentials
-        user = User.query.filter_by(username=username).first()
-        if user and user.check_password(password):
+        # Only the columns login reads; the user is reloaded after the redirect
+        user = User.by_username(username, User.id, User.username, User.password_hash, User.role)
+        # Unknown users still pay for a hash check so timing doesn't leak
+        # which usernames exist.
+        verified = user.check_password(password) if user else dummy_verify(password)
+        if user and verified:
+            if user in db.session.dirty:
+                # Legacy password hash was upgraded during verification
+                db.session.commit()
             session.clear()
-            session['user_id'] = user.id
-            session['username'] = user.username
-            session['role'] = user.role
+            session.update(user_id=user.id, username=user.username, role=user.role)
             flash('Logged in successfully.')
             next_url = request.args.get('next') or url_for('index')
             return redirect(next_url)
@@ -277,116 +466,39 @@ def login():
 @auth_bp.route('/logout', methods=['GET', 'POST'])
 def logout():
     session.clear()
+    g.pop('_current_user', None)
     flash('Logged out.')
     return redirect(url_for('index'))
 
 
 @auth_bp.route('/signup', methods=['GET', 'POST'])
+@rate_limited(_signup_limiter)
 def signup():
     if request.method == 'POST':
-        # Get and sanitize inputs
-        username = sanitize_input(request.form.get('username', ''), 150)
-        password = request.form.get('password', '')
-        verify_password = request.form.get('verify_password', '')
-        street_address = sanitize_input(request.form.get('street_address', ''), 255)
-        apt_unit = sanitize_input(request.form.get('apt_unit', ''), 50)
-        city = sanitize_input(request.form.get('city', ''), 100)
-        state = sanitize_input(request.form.get('state', ''), 2).upper()
-        zipcode = sanitize_input(request.form.get('zipcode', ''), 10)
-        role = request.form.get('role', 'regular')
-        
-        # Validate username
-        valid, error = validate_username(username)
-        if not valid:
-            flash(error)
-            return render_template('signup.html')
-        
-        # Validate password
-        valid, error = validate_password(password)
-        if not valid:
-            flash(error)
-            return render_template('signup.html')
-        
-        # Verify passwords match
-        if password != verify_password:
-            flash('Passwords do not match.')
-            return render_template('signup.html')
-        
-        # Validate address
-        valid, error = validate_address(street_address, city, state, zipcode)
-        if not valid:
-            flash(error)
-            return render_template('signup.html')
-        
-        # Validate apt_unit if provided
-        valid, error = validate_apt_unit(apt_unit)
-        if not valid:
-            flash(error)
-            return render_template('signup.html')
-        
-        # Check if username already exists
-        if User.query.filter_by(username=username).first():
-            flash('Username already exists. Please choose another.')
-            return render_template('signup.html')
-        
-        # Validate role
-        if role not in ['regular', 'power', 'admin', 'candidate']:
-            role = 'regular'
-        # For candidate users, find the Candidate Representative placeholder
-        candidate_rep_id = None
-        if role == 'candidate':
-            from models import Representative
-            candidate_rep = Representative.query.filter_by(
-                last_name='Candidate',
-                first_name='Campaign'
-            ).first()
-            if candidate_rep:
-                candidate_rep_id = candidate_rep.id
-        
-        
-        # Create new user
-        user = User(
-            username=username,
-            role=role,
-            street_address=street_address,
-            apt_unit=apt_unit if apt_unit else None,
-            city=city,
-            state=state,
-            zipcode=zipcode,
-            address_verified=False,
-            representative_id=candidate_rep_id
-        )
-        user.set_password(password)
+        user, errors = _process_signup_form(request.form, g.form)
+        if errors:
+            for error in errors:
+                flash(error)
+            return render_template('signup.html', form=request.form)
         
         try:
             db.session.add(user)
             db.session.commit()
             
-            # Lookup representatives for the user's address
-            try:
-                # Use data fetcher - handles production vs development automatically
-                data_fetcher = get_data_fetcher()
-                address_data = {
-                    'street': street_address + (f" {apt_unit}" if apt_unit else ""),
-                    'city': city,
-                    'state': 'MO',
-                    'zip': zipcode
-                }
-                rep_info = data_fetcher.fetch_representatives(address_data)
-                
-                if rep_info:
-                    user.update_representatives(rep_info)
-                    db.session.commit()
-            except Exception as e:
-                # Don't fail signup if rep lookup fails
-                print(f"Error looking up representatives: {e}")
+            # Lookup representatives after responding; signup doesn't need them
+            _enqueue_rep_lookup(user.id)
             
             flash('Account created successfully! Please log in.')
             return redirect(url_for('auth.login'))
+        except IntegrityError:
+            # Username taken (ix_users_username_lower)
+            db.session.rollback()
+            flash('Username already exists. Please choose another.')
+            return render_template('signup.html', form=request.form)
         except Exception as e:
             db.session.rollback()
             flash('An error occurred while creating your account. Please try again.')
-            return render_template('signup.html')
+            return render_template('signup.html', form=request.form)
 
     return render_template('signup.html')
 
@@ -395,7 +507,7 @@ def signup():
 @login_required
 def confirm_reps():
     """Look up and confirm user's representatives."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('User not found.')
         return redirect(url_for('auth.login'))
@@ -18,10 +18,27 @@ class Config:
     # Bills Cache
     BILLS_CACHE_TTL = int(os.environ.get('BILLS_CACHE_TTL', 300))  # 5 minutes
     REPS_CACHE_TTL = int(os.environ.get('REPS_CACHE_TTL', 300))    # 5 minutes
+
+    # Shared cache (Flask-Caching) for scraped pages, see utils.cache
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'SimpleCache')
+    CACHE_REDIS_URL = os.environ.get('REDIS_URL')
+    CACHE_DEFAULT_TIMEOUT = 300
     
     # Address Verification
     USPS_USER_ID = os.environ.get('USPS_USER_ID')
     
+    # Look up a new user's representatives in a background thread after signup
+    REP_LOOKUP_ASYNC = True
+
+    # Per-IP throttling of login/signup POSTs (see auth.rate_limited).
+    # Counts are shared by every worker through Redis when REDIS_URL is set
+    RATELIMIT_ENABLED = True
+
+    # Number of proxies (nginx) in front of the app whose X-Forwarded-For is
+    # trusted for the client address. 0 (the default) when clients connect
+    # directly, as in the Docker image, or they could pick their own address
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
+    
     # URLs
     BILLS_URL = os.environ.get('BILLS_URL', 'https://house.mo.gov/BillList.aspx')
     REPS_URL = os.environ.get('REPS_URL', 'https://house.mo.gov/MemberRoster.aspx')
@@ -36,6 +53,12 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    REP_LOOKUP_ASYNC = False
+    RATELIMIT_ENABLED = False
+    CACHE_TYPE = 'NullCache'
+    CACHE_NO_NULL_WARNING = True
+    # Tests exercise the behind-nginx setup
+    PROXY_FIX_X_FOR = 1
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -55,8 +78,12 @@ class ProductionConfig(Config):
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
     PERMANENT_SESSION_LIFETIME = timedelta(hours=12)
+
+    # Production runs behind nginx (infrastructure/ansible)
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 1))
     
     # Performance
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'RedisCache' if os.environ.get('REDIS_URL') else 'SimpleCache')
     SEND_FILE_MAX_AGE_DEFAULT = 31536000  # 1 year for static files
     
     # Logging
@@ -66,16 +93,20 @@ class ProductionConfig(Config):
     # Validate required settings
     @classmethod
     def validate(cls):
-        """Validate production configuration."""
+        """Validate production configuration.
+        
+        Checks the values read from the environment when this module was
+        imported, i.e. exactly what the app will be configured with.
+        """
         errors = []
         
-        if not os.environ.get('SECRET_KEY') or os.environ.get('SECRET_KEY') == 'dev-secret-key':
+        if not cls.SECRET_KEY or cls.SECRET_KEY == 'dev-secret-key':
             errors.append("SECRET_KEY must be set to a secure random value")
         
-        if not os.environ.get('DATABASE_URL'):
+        if not cls.SQLALCHEMY_DATABASE_URI:
             errors.append("DATABASE_URL must be set")
         
-        if not os.environ.get('DATABASE_URL', '').startswith('postgresql'):
+        if not (cls.SQLALCHEMY_DATABASE_URI or '').startswith('postgresql'):
             errors.append("Production must use PostgreSQL database")
         
         if errors:
@@ -15,16 +15,43 @@ Usage:
 import sys
 import os
 import argparse
-from datetime import datetime, timedelta
+import logging
+from logging.handlers import MemoryHandler
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from flask import Flask
+from sqlalchemy import bindparam
+from sqlalchemy.orm.attributes import set_committed_value
 from extensions import db
 from models import User
 from rep_lookup import RepresentativeLookup
 from address_verification import format_address
+from utils.dates import utcnow
+
+
+# Users updated per transaction
+COMMIT_BATCH_SIZE = 500
+
+log = logging.getLogger('confirm_reps')
+
+
+def setup_logging():
+    """Send report output to stdout through a buffer instead of per-line writes.
+    
+    Returns the buffering handler; close it to flush remaining output.
+    """
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=stream)
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return handler
 
 
 def create_app():
@@ -36,44 +63,82 @@ def create_app():
     return app
 
 
-def confirm_reps_for_user(user, force=False):
-    """Look up and update representative information for a single user.
-    
-    Args:
-        user: User model instance
-        force: If True, update even if reps_last_updated is recent
-    
-    Returns:
-        dict: Result with status, message, and rep_info
-    """
-    # Check if update is needed
+def needs_update(user, force=False):
+    """Return a skip result if the user's rep info is recent, else None."""
     if not force and user.reps_last_updated:
-        days_old = (datetime.utcnow() - user.reps_last_updated).days
+        days_old = (utcnow() - user.reps_last_updated).days
         if days_old < 30:
             return {
                 'status': 'skip',
                 'message': f'Rep info updated {days_old} days ago (use --force to refresh)',
                 'rep_info': user.get_representatives_display()
             }
+    return None
+
+
+def address_key(user):
+    """Key used to share one lookup between users at the same address."""
+    return (user.street_address, user.city, user.zipcode)
+
+
+def lookup_reps_for_users(users, max_workers=16):
+    """Look up representatives for each distinct address among `users`.
     
-    # Format address for lookup
-    address_str = format_address(
-        user.street_address,
-        user.city,
-        user.state,
-        user.zipcode,
-        user.apt_unit
-    )
+    Lookups are network-bound, so they run concurrently and users at the
+    same address share a single request.
     
-    print(f"\n🔍 Looking up representatives for: {user.username}")
-    print(f"   Address: {address_str}")
+    Returns:
+        dict: address_key -> rep_info (None if the lookup failed)
+    """
+    unique = {}
+    for user in users:
+        key = address_key(user)
+        if key not in unique:
+            unique[key] = None
+            address_str = format_address(
+                user.street_address,
+                user.city,
+                user.state,
+                user.zipcode,
+                user.apt_unit
+            )
+            log.info(f"\n🔍 Looking up representatives for: {address_str}")
     
-    # Perform lookup
-    rep_info = RepresentativeLookup.lookup_representatives(
-        user.street_address,
-        user.city,
-        user.zipcode
-    )
+    if not unique:
+        return unique
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        futures = {
+            executor.submit(RepresentativeLookup.lookup_representatives, *key): key
+            for key in unique
+        }
+        for future in as_completed(futures):
+            try:
+                unique[futures[future]] = future.result()
+            except Exception as e:
+                log.warning(f"   ⚠️  Lookup failed for {futures[future]}: {e}")
+    
+    return unique
+
+
+def confirm_reps_for_user(user, rep_info, force=False):
+    """Update representative information for a single user.
+    
+    Args:
+        user: User model instance
+        rep_info: Lookup result for the user's address (see
+            lookup_reps_for_users), or None if the lookup failed
+        force: If True, update even if reps_last_updated is recent
+    
+    Nothing is written here; successful results carry the column
+    'values' for commit_batch to save.
+    
+    Returns:
+        dict: Result with status, message, and rep_info
+    """
+    skip = needs_update(user, force)
+    if skip:
+        return skip
     
     if not rep_info:
         return {
@@ -93,48 +158,88 @@ def confirm_reps_for_user(user, force=False):
             'rep_info': None
         }
     
-    # Update user record
-    success = user.update_representatives(rep_info)
+    # Column values for the user's row; commit_batch writes them with a
+    # Core UPDATE. They're applied to the instance without change tracking
+    # so the display below reflects them without an ORM flush.
+    values = user.representative_values(rep_info)
+    for key, value in values.items():
+        set_committed_value(user, key, value)
     
-    if success:
-        try:
-            db.session.commit()
-            display = user.get_representatives_display()
-            return {
-                'status': 'success',
-                'message': 'Representatives updated successfully',
-                'rep_info': display
-            }
-        except Exception as e:
-            db.session.rollback()
-            return {
-                'status': 'error',
-                'message': f'Database error: {str(e)}',
-                'rep_info': None
-            }
-    else:
-        return {
-            'status': 'error',
-            'message': 'Failed to update user record',
-            'rep_info': None
-        }
+    return {
+        'status': 'success',
+        'message': 'Representatives updated successfully',
+        'rep_info': user.get_representatives_display(),
+        'values': dict(values, user_id=user.id)
+    }
+
+
+def iter_user_batches(query, batch_size=COMMIT_BATCH_SIZE):
+    """Yield users matching `query` in id order, `batch_size` at a time.
+    
+    Pages by primary key rather than holding a cursor open, so only one
+    batch is in memory and each batch can be committed before the next
+    one is read.
+    """
+    last_id = 0
+    while True:
+        batch = query.filter(User.id > last_id).order_by(User.id).limit(batch_size).all()
+        if not batch:
+            return
+        last_id = batch[-1].id
+        yield batch
+
+
+def commit_batch(batch):
+    """Save a batch of (user, result) pairs in one transaction.
+    
+    Successful results are written with one executemany UPDATE per set of
+    changed columns, bypassing ORM change tracking. If the commit fails,
+    every successful result in the batch is turned into an error since
+    none of its updates were saved.
+    """
+    by_columns = defaultdict(list)
+    for _, result in batch:
+        if result['status'] == 'success':
+            by_columns[frozenset(result['values'])].append(result['values'])
+    if not by_columns:
+        return
+    
+    users = User.__table__
+    try:
+        for rows in by_columns.values():
+            # SET columns come from the parameter keys other than user_id,
+            # plus the database's now() for every row
+            db.session.execute(
+                users.update().where(users.c.id == bindparam('user_id')).values(reps_last_updated=db.func.now()),
+                rows,
+            )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        for _, result in batch:
+            if result['status'] == 'success':
+                result.update({
+                    'status': 'error',
+                    'message': f'Database error: {str(e)}',
+                    'rep_info': None
+                })
 
 
 def print_rep_info(display_info):
     """Pretty print representative information."""
     if not display_info or not display_info.get('has_data'):
-        print("   ❌ No representative data")
+        log.info("   ❌ No representative data")
         return
     
     if display_info.get('senator'):
         sen = display_info['senator']
-        print(f"   👔 State Senator: {sen['name']}")
-        print(f"      District: {sen['district']}, Party: {sen['party']}")
+        log.info(f"   👔 State Senator: {sen['name']}")
+        log.info(f"      District: {sen['district']}, Party: {sen['party']}")
     
     if display_info.get('representative'):
         rep = display_info['representative']
-        print(f"   🏛️  State Representative: {rep['name']}")
-        print(f"      District: {rep['district']}, Party: {rep['party']}")
+        log.info(f"   🏛️  State Representative: {rep['name']}")
+        log.info(f"      District: {rep['district']}, Party: {rep['party']}")
 
 
 def main():
@@ -171,6 +276,16 @@ def main():
     
     args = parser.parse_args()
     
+    handler = setup_logging()
+    try:
+        return run(args)
+    finally:
+        handler.close()
+
+
+def run(args):
+    """Process users selected by the parsed command-line `args`."""
+    
     # Create app and get database access
     app = create_app()
     
@@ -179,34 +294,38 @@ def main():
         if args.user_id:
             users = [User.query.get(args.user_id)]
             if not users[0]:
-                print(f"❌ User with ID {args.user_id} not found")
+                log.error(f"❌ User with ID {args.user_id} not found")
                 return 1
+            total, batches = 1, [users]
         elif args.username:
             users = [User.query.filter_by(username=args.username).first()]
             if not users[0]:
-                print(f"❌ User '{args.username}' not found")
+                log.error(f"❌ User '{args.username}' not found")
                 return 1
-        elif args.all:
-            users = User.query.all()
+            total, batches = 1, [users]
         else:
-            # Default: users without rep info or with stale data
-            cutoff_date = datetime.utcnow() - timedelta(days=args.stale_days)
-            users = User.query.filter(
-                db.or_(
-                    User.reps_last_updated == None,
-                    User.reps_last_updated < cutoff_date,
-                    User.representative_name == None
+            if args.all:
+                query = User.query
+            else:
+                # Default: users without rep info or with stale data
+                cutoff_date = utcnow() - timedelta(days=args.stale_days)
+                query = User.query.filter(
+                    db.or_(
+                        User.reps_last_updated == None,
+                        User.reps_last_updated < cutoff_date,
+                        User.representative_name == None
+                    )
                 )
-            ).all()
+            total, batches = query.count(), iter_user_batches(query)
         
-        if not users:
-            print("✅ No users need representative updates")
+        if not total:
+            log.info("✅ No users need representative updates")
             return 0
         
-        print(f"\n{'='*60}")
-        print(f"REPRESENTATIVE CONFIRMATION REPORT")
-        print(f"{'='*60}")
-        print(f"Processing {len(users)} user(s)...")
+        log.info(f"\n{'='*60}")
+        log.info(f"REPRESENTATIVE CONFIRMATION REPORT")
+        log.info(f"{'='*60}")
+        log.info(f"Processing {total} user(s)...")
         
         # Process each user
         results = {
@@ -215,31 +334,49 @@ def main():
             'error': 0
         }
         
-        for user in users:
-            result = confirm_reps_for_user(user, force=args.force)
-            results[result['status']] += 1
-            
-            # Print result
-            status_icon = {
-                'success': '✅',
-                'skip': '⏭️ ',
-                'error': '❌'
-            }[result['status']]
+        # Lookup results by address, shared across batches
+        reps_by_address = {}
+        
+        for users_batch in batches:
+            # Look up each new distinct address once, concurrently
+            to_update = [
+                user for user in users_batch
+                if not needs_update(user, args.force) and address_key(user) not in reps_by_address
+            ]
+            reps_by_address.update(lookup_reps_for_users(to_update))
             
-            print(f"\n{status_icon} User: {user.username} (ID: {user.id})")
-            print(f"   {result['message']}")
+            # Capture labels now; committing expires the loaded users
+            batch = [
+                (user, confirm_reps_for_user(user, reps_by_address.get(address_key(user)), force=args.force))
+                for user in users_batch
+            ]
+            labels = [(user.username, user.id) for user, _ in batch]
+            commit_batch(batch)
             
-            if result.get('rep_info'):
-                print_rep_info(result['rep_info'])
+            for (username, user_id), (_, result) in zip(labels, batch):
+                results[result['status']] += 1
+                
+                # Print result
+                status_icon = {
+                    'success': '✅',
+                    'skip': '⏭️ ',
+                    'error': '❌'
+                }[result['status']]
+                
+                log.info(f"\n{status_icon} User: {username} (ID: {user_id})")
+                log.info(f"   {result['message']}")
+                
+                if result.get('rep_info'):
+                    print_rep_info(result['rep_info'])
         
         # Print summary
-        print(f"\n{'='*60}")
-        print(f"SUMMARY")
-        print(f"{'='*60}")
-        print(f"✅ Successful updates: {results['success']}")
-        print(f"⏭️  Skipped (recent):   {results['skip']}")
-        print(f"❌ Errors:             {results['error']}")
-        print(f"{'='*60}\n")
+        log.info(f"\n{'='*60}")
+        log.info(f"SUMMARY")
+        log.info(f"{'='*60}")
+        log.info(f"✅ Successful updates: {results['success']}")
+        log.info(f"⏭️  Skipped (recent):   {results['skip']}")
+        log.info(f"❌ Errors:             {results['error']}")
+        log.info(f"{'='*60}\n")
         
         return 0 if results['error'] == 0 else 1
 
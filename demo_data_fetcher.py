@@ -3,21 +3,15 @@
 Demo script to show production vs development mode behavior
 """
 
-import os
-import sys
-
 def demo_development_mode():
     """Demonstrate development mode with mock data"""
     print("\n" + "="*70)
     print("DEVELOPMENT MODE DEMO")
     print("="*70)
     
-    # Ensure we're in development mode
-    os.environ['FLASK_ENV'] = 'development'
-    
     from utils.data_fetcher import get_data_fetcher
     
-    fetcher = get_data_fetcher()
+    fetcher = get_data_fetcher(mode='development')
     
     print("\n📋 Fetching Bills (Mock Data)...")
     bills = fetcher.fetch_bills()
@@ -37,16 +31,9 @@ def demo_production_mode():
     print("PRODUCTION MODE DEMO")
     print("="*70)
     
-    # Set production mode
-    os.environ['FLASK_ENV'] = 'production'
-    
-    # Force reload of the module to pick up new environment
-    if 'utils.data_fetcher' in sys.modules:
-        del sys.modules['utils.data_fetcher']
-    
     from utils.data_fetcher import get_data_fetcher
     
-    fetcher = get_data_fetcher()
+    fetcher = get_data_fetcher(mode='production')
     
     print("\n📋 Fetching Bills (Real Data)...")
     print("   Note: This would fetch from Missouri Legislature website")
@@ -8,8 +8,11 @@ This demonstrates:
 3. Extracting structured sections
 4. Generating prompts for analysis
 """
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import load_only
+from extensions import db
 from models import Bill
-from services.bill_text_fetcher import extract_key_sections, prepare_for_llm
+from services.bill_text_fetcher import prepare_for_llm
 from main import app
 
 
@@ -22,7 +25,7 @@ def demo_basic_retrieval():
     
     with app.app_context():
         # Get first bill with text
-        bill = Bill.query.filter(Bill.full_text.isnot(None)).first()
+        bill = Bill.query.filter(Bill.full_text.isnot(None)).order_by(Bill.id).first()
         
         if not bill:
             print("No bills with full text found. Run fetch_bill_text.py first.")
@@ -32,7 +35,7 @@ def demo_basic_retrieval():
         print(f"Title: {bill.title}")
         print(f"Sponsor: {bill.sponsor}")
         print(f"Text length: {len(bill.full_text)} characters")
-        print(f"Word count: {len(bill.full_text.split())} words")
+        print(f"Word count: {bill.word_count or len(bill.full_text.split())} words")
         print()
         print("First 500 characters:")
         print("-" * 80)
@@ -49,7 +52,7 @@ def demo_llm_formatting():
     print()
     
     with app.app_context():
-        bill = Bill.query.filter(Bill.full_text.isnot(None)).first()
+        bill = Bill.query.filter(Bill.full_text.isnot(None)).order_by(Bill.id).first()
         
         if not bill:
             print("No bills with full text found.")
@@ -71,13 +74,13 @@ def demo_section_extraction():
     print()
     
     with app.app_context():
-        bill = Bill.query.filter(Bill.full_text.isnot(None)).first()
+        bill = Bill.query.filter(Bill.full_text.isnot(None)).order_by(Bill.id).first()
         
         if not bill:
             print("No bills with full text found.")
             return
         
-        sections = extract_key_sections(bill.full_text)
+        sections = bill.get_key_sections()
         
         print(f"Analyzing {bill.bill_number}...")
         print()
@@ -109,35 +112,38 @@ def demo_llm_prompts():
     print()
     
     with app.app_context():
-        bill = Bill.query.filter(Bill.full_text.isnot(None)).first()
+        bill = Bill.query.filter(Bill.full_text.isnot(None)).order_by(Bill.id).first()
         
         if not bill:
             print("No bills with full text found.")
             return
         
+        # Same context for every prompt; format it once
+        context = bill.get_llm_context(max_length=4000)
+        
         # Example prompts for different analysis tasks
         prompts = {
             "Summary": f"""Summarize the following Missouri House Bill in 2-3 sentences:
 
-{bill.get_llm_context(max_length=4000)}
+{context}
 
 Summary:""",
             
             "Impact Analysis": f"""Analyze the potential impact of this bill on Missouri residents:
 
-{bill.get_llm_context(max_length=4000)}
+{context}
 
 What are the key impacts?""",
             
             "Stakeholder Analysis": f"""Identify the main stakeholders affected by this bill:
 
-{bill.get_llm_context(max_length=4000)}
+{context}
 
 List the stakeholders and how they're affected:""",
             
             "Plain Language": f"""Explain this bill in plain language for a general audience:
 
-{bill.get_llm_context(max_length=4000)}
+{context}
 
 Plain language explanation:""",
         }
@@ -146,6 +152,11 @@ Plain language explanation:""",
             print(f"\n--- {task} Prompt ---")
             print(prompt[:500] + "..." if len(prompt) > 500 else prompt)
             print()
+        
+        # Bills longer than the context budget can be sent in overlapping,
+        # sentence-aligned chunks instead of being cut off
+        chunks = bill.iter_chunks(size=4000, overlap=400)
+        print(f"\n--- Chunked: {sum(1 for _ in chunks)} chunk(s) of up to 4000 characters ---")
 
 
 def demo_batch_analysis():
@@ -156,7 +167,11 @@ def demo_batch_analysis():
     print()
     
     with app.app_context():
-        bills = Bill.query.filter(Bill.full_text.isnot(None)).limit(5).all()
+        # Stored counts and sections cover most bills; full_text is only
+        # loaded (per bill) for rows fetched before those columns existed
+        bills = Bill.query.options(
+            load_only(Bill.bill_number, Bill.sponsor, Bill.word_count, Bill.sections_json)
+        ).filter(Bill.full_text.isnot(None)).order_by(Bill.id).limit(5).all()
         
         if not bills:
             print("No bills with full text found.")
@@ -166,8 +181,8 @@ def demo_batch_analysis():
         print()
         
         for bill in bills:
-            word_count = len(bill.full_text.split())
-            sections = extract_key_sections(bill.full_text)
+            word_count = bill.word_count or len(bill.full_text.split())
+            sections = bill.get_key_sections()
             
             print(f"{bill.bill_number}")
             print(f"  Sponsor: {bill.sponsor}")
@@ -188,19 +203,23 @@ def demo_search_in_text():
     search_terms = ['education', 'tax', 'healthcare', 'budget']
     
     with app.app_context():
-        for term in search_terms:
-            # Case-insensitive search
-            bills = Bill.query.filter(
-                Bill.full_text.isnot(None),
-                Bill.full_text.ilike(f'%{term}%')
-            ).all()
-            
+        # Match every term in one query rather than one scan per term
+        terms = union_all(*(select(literal(term).label('term')) for term in search_terms)).subquery()
+        matches = db.session.query(terms.c.term, Bill.bill_number, Bill.title).join(
+            Bill, Bill.full_text_matches(terms.c.term, db.engine.dialect.name)
+        ).filter(Bill.full_text.isnot(None)).order_by(Bill.bill_number).all()
+        
+        bills_by_term = {term: [] for term in search_terms}
+        for term, bill_number, title in matches:
+            bills_by_term[term].append((bill_number, title))
+        
+        for term, bills in bills_by_term.items():
             print(f"'{term}': {len(bills)} bills")
             
             if bills:
                 # Show first 3
-                for bill in bills[:3]:
-                    print(f"  - {bill.bill_number}: {bill.title[:60]}...")
+                for bill_number, title in bills[:3]:
+                    print(f"  - {bill_number}: {(title or '')[:60]}...")
             print()
 
 
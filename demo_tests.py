@@ -3,9 +3,9 @@
 Quick test demo - runs a subset of fast tests to demonstrate functionality
 """
 
-import subprocess
 import sys
-import os
+
+import pytest
 
 print("""
 ╔════════════════════════════════════════════════════════════════════╗
@@ -19,40 +19,71 @@ Running a quick subset of tests to demonstrate functionality...
 demos = [
     {
         'name': 'Validator Unit Tests',
-        'command': [sys.executable, '-m', 'pytest', 'tests/unit/test_validators.py::TestValidateUsername', '-v'],
+        'tests': ['tests/unit/test_validators.py::TestValidateUsername'],
         'description': 'Testing username validation logic'
     },
     {
         'name': 'Data Fetcher Tests',
-        'command': [sys.executable, '-m', 'pytest', 'tests/unit/test_data_fetcher.py::TestDataFetcher::test_singleton_pattern', 
-                    'tests/unit/test_data_fetcher.py::TestDataFetcher::test_fetch_bills_development', '-v'],
+        'tests': ['tests/unit/test_data_fetcher.py::TestDataFetcher::test_singleton_pattern',
+                  'tests/unit/test_data_fetcher.py::TestDataFetcher::test_fetch_bills_development'],
         'description': 'Testing data fetcher singleton and bills fetching'
     },
     {
         'name': 'Model Tests',
-        'command': [sys.executable, '-m', 'pytest', 'tests/unit/test_models.py::TestUserModel::test_create_user',
-                    'tests/unit/test_models.py::TestUserModel::test_password_hashing', '-v'],
+        'tests': ['tests/unit/test_models.py::TestUserModel::test_create_user',
+                  'tests/unit/test_models.py::TestUserModel::test_password_hashing'],
         'description': 'Testing user model and password hashing'
     }
 ]
 
+
+def _demo_for(nodeid):
+    """Return the demo a collected test belongs to."""
+    return next((demo for demo in demos if any(nodeid.startswith(t) for t in demo['tests'])), None)
+
+
+class DemoReporter:
+    """pytest plugin that prints each demo's header and records its outcome."""
+
+    def __init__(self):
+        self.current = None
+        self.failed = set()
+        self.ran = set()
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        demo = _demo_for(nodeid)
+        if demo is not None and demo is not self.current:
+            self.current = demo
+            print(f"\n{'='*70}")
+            print(f"🧪 {demo['name']}")
+            print(f"   {demo['description']}")
+            print(f"{'='*70}")
+
+    def pytest_runtest_logreport(self, report):
+        demo = _demo_for(report.nodeid)
+        if demo is None:
+            return
+        self.ran.add(demo['name'])
+        if report.failed:
+            self.failed.add(demo['name'])
+
+
+# One pytest run for every demo: the interpreter, plugins and app imports
+# are only loaded once
+reporter = DemoReporter()
+pytest.main([t for demo in demos for t in demo['tests']] + ['-v', '-p', 'no:cacheprovider', '-p', 'no:cov'],
+            plugins=[reporter])
+
 total_passed = 0
 total_failed = 0
 
 for demo in demos:
-    print(f"\n{'='*70}")
-    print(f"🧪 {demo['name']}")
-    print(f"   {demo['description']}")
-    print(f"{'='*70}\n")
-    
-    result = subprocess.run(demo['command'], capture_output=False)
-    
-    if result.returncode == 0:
+    if demo['name'] in reporter.ran and demo['name'] not in reporter.failed:
         total_passed += 1
-        print(f"\n✅ {demo['name']} - PASSED")
+        print(f"✅ {demo['name']} - PASSED")
     else:
         total_failed += 1
-        print(f"\n❌ {demo['name']} - FAILED")
+        print(f"❌ {demo['name']} - FAILED")
 
 # Summary
 print(f"\n{'='*70}")
@@ -1,4 +1,50 @@
+import sqlite3
+
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import raiseload
+
+try:
+    from flask_caching import Cache
+except ImportError:  # pragma: no cover
+    Cache = None
 
 # single shared DB object to avoid circular imports
 db = SQLAlchemy()
+
+# Cache shared by every worker (Redis in production) for scraped bills and
+# reps; None when Flask-Caching is not installed
+cache = Cache() if Cache is not None else None
+
+
+def list_load_options(*options):
+    """Loader options for a list query.
+
+    Under TESTING, every relationship not loaded by ``options`` raises when
+    touched instead of lazily running one SELECT per row, so an N+1 in a
+    list view fails the tests. In production they load lazily as usual.
+    """
+    if current_app.config.get('TESTING'):
+        return (*options, raiseload('*'))
+    return options
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Use WAL with relaxed fsyncs and memory-mapped reads on SQLite.
+
+    Readers no longer block on the writer, and the migrate_*.py scripts'
+    ALTER/CREATE INDEX statements stop fsyncing on every commit. WAL stays
+    crash-safe with synchronous=NORMAL; the last commits may roll back on
+    power loss. Other databases are left alone.
+    """
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
@@ -12,46 +12,72 @@ Usage:
     python fetch_bill_text.py HB101 HB102       # Fetch specific bills
     python fetch_bill_text.py --limit 10        # Fetch first 10 bills
     python fetch_bill_text.py --refetch         # Re-fetch all bills even if already fetched
+    python fetch_bill_text.py --workers 4       # Limit concurrent downloads
 """
 import sys
+import json
 import argparse
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from sqlalchemy import bindparam, func
 from extensions import db
 from models import Bill
-from services.bill_text_fetcher import fetch_bill_full_text
+from services.bill_text_fetcher import extract_key_sections, fetch_bill_full_text
+from utils.dates import utcnow
 from main import app
 
 
-def fetch_text_for_bill(bill, refetch=False):
-    """Fetch and store text for a single bill."""
-    if not refetch and bill.full_text and bill.text_fetched_at:
+def needs_text(bill, refetch=False):
+    """Return True if the bill's text should be fetched."""
+    if not refetch and bill.has_text and bill.text_fetched_at:
         print(f"  ✓ {bill.bill_number} already has text (fetched {bill.text_fetched_at})")
         return False
+    return True
+
+
+def fetch_text(bill_number, year):
+    """Download text for one bill; safe to run in a worker thread."""
+    print(f"  Fetching text for {bill_number}...")
+    return fetch_bill_full_text(bill_number, year)
+
+
+def text_values(bill, full_text, text_pdf_url, summary_pdf_url):
+    """Build the column values to save for one fetched bill.
     
-    print(f"  Fetching text for {bill.bill_number}...")
+    Returns:
+        (values, fetched) where values is an UPDATE parameter dict keyed by
+        column name plus 'bill_id', and fetched is True if text was found.
+    """
+    # Still update URLs even if text extraction failed
+    values = {
+        'bill_id': bill.id,
+        'text_pdf_url': text_pdf_url,
+        'summary_pdf_url': summary_pdf_url,
+    }
+    if not full_text:
+        print(f"  ✗ {bill.bill_number}: No text found")
+        return values, False
     
-    try:
-        full_text, text_pdf_url, summary_pdf_url = fetch_bill_full_text(bill.bill_number)
-        
-        if full_text:
-            bill.full_text = full_text
-            bill.text_pdf_url = text_pdf_url
-            bill.summary_pdf_url = summary_pdf_url
-            bill.text_fetched_at = datetime.utcnow()
-            
-            word_count = len(full_text.split())
-            print(f"  ✓ {bill.bill_number}: Fetched {word_count} words")
-            return True
-        else:
-            print(f"  ✗ {bill.bill_number}: No text found")
-            # Still update URLs even if text extraction failed
-            bill.text_pdf_url = text_pdf_url
-            bill.summary_pdf_url = summary_pdf_url
-            return False
-            
-    except Exception as e:
-        print(f"  ✗ {bill.bill_number}: Error - {e}")
-        return False
+    values.update(
+        full_text=full_text,
+        text_fetched_at=utcnow(),
+        word_count=len(full_text.split()),
+        sections_json=json.dumps(extract_key_sections(full_text)),
+    )
+    print(f"  ✓ {bill.bill_number}: Fetched {values['word_count']} words")
+    return values, True
+
+
+def save_text_values(updates):
+    """Write text_values() results with one executemany UPDATE per column set."""
+    by_columns = defaultdict(list)
+    for values in updates:
+        by_columns[frozenset(values)].append(values)
+    
+    bills = Bill.__table__
+    for rows in by_columns.values():
+        # SET columns come from the parameter keys other than bill_id
+        db.session.execute(bills.update().where(bills.c.id == bindparam('bill_id')), rows)
 
 
 def main():
@@ -60,21 +86,31 @@ def main():
     parser.add_argument('--limit', type=int, help='Limit number of bills to fetch')
     parser.add_argument('--refetch', action='store_true', help='Re-fetch bills that already have text')
     parser.add_argument('--year', default='2025', help='Legislative year (default: 2025)')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent downloads (default: 8)')
     
     args = parser.parse_args()
     
     with app.app_context():
+        # Only what's needed to decide what to fetch; the text itself is
+        # written back with Core UPDATEs, never loaded into the session
+        columns = Bill.query.with_entities(
+            Bill.id,
+            Bill.bill_number,
+            Bill.text_fetched_at,
+            Bill.full_text.isnot(None).label('has_text'),
+        )
+        
         # Determine which bills to fetch
         if args.bills:
             # Specific bills requested
-            bills = Bill.query.filter(Bill.bill_number.in_(args.bills)).all()
+            bills = columns.filter(Bill.bill_number.in_(args.bills)).all()
             if not bills:
                 print(f"No bills found matching: {', '.join(args.bills)}")
                 return
             print(f"Fetching text for {len(bills)} specified bills...")
         else:
             # All bills (or limited)
-            query = Bill.query.order_by(Bill.bill_number)
+            query = columns.order_by(Bill.bill_number)
             if args.limit:
                 query = query.limit(args.limit)
             bills = query.all()
@@ -88,20 +124,38 @@ def main():
         
         # Fetch text for each bill
         success_count = 0
-        skip_count = 0
         fail_count = 0
         
-        for bill in bills:
-            result = fetch_text_for_bill(bill, refetch=args.refetch)
-            if result:
-                success_count += 1
-            elif bill.full_text:
-                skip_count += 1
-            else:
-                fail_count += 1
+        # Downloads run in worker threads; only the main thread touches the
+        # database session, since it is not thread-safe.
+        to_fetch = [bill for bill in bills if needs_text(bill, refetch=args.refetch)]
+        skip_count = len(bills) - len(to_fetch)
+        updates = []
+        
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+                futures = {
+                    executor.submit(fetch_text, bill.bill_number, args.year): bill
+                    for bill in to_fetch
+                }
+                for future in as_completed(futures):
+                    bill = futures[future]
+                    try:
+                        values, result = text_values(bill, *future.result())
+                        updates.append(values)
+                    except Exception as e:
+                        print(f"  ✗ {bill.bill_number}: Error - {e}")
+                        result = False
+                    if result:
+                        success_count += 1
+                    elif bill.has_text:
+                        skip_count += 1
+                    else:
+                        fail_count += 1
         
         # Commit all changes
         try:
+            save_text_values(updates)
             db.session.commit()
             print(f"\n✓ Database updated successfully")
         except Exception as e:
@@ -119,16 +173,15 @@ def main():
         print(f"Failed/No text:        {fail_count}")
         print()
         
-        # Show stats
-        total_with_text = Bill.query.filter(Bill.full_text.isnot(None)).count()
-        total_bills = Bill.query.count()
+        # Show stats in one aggregate query, without loading any bill text
+        total_bills, total_with_text, total_words = db.session.query(
+            func.count(Bill.id),
+            func.count(Bill.full_text),
+            func.coalesce(func.sum(Bill.word_count), 0),
+        ).one()
         coverage_pct = (total_with_text / total_bills * 100) if total_bills > 0 else 0
         
         print(f"Database coverage: {total_with_text}/{total_bills} bills ({coverage_pct:.1f}%) have full text")
-        
-        # Calculate total words
-        bills_with_text = Bill.query.filter(Bill.full_text.isnot(None)).all()
-        total_words = sum(len(b.full_text.split()) for b in bills_with_text)
         print(f"Total text stored: {total_words:,} words")
         print()
 
@@ -9,8 +9,15 @@ This script uses the application's SQLAlchemy `db` and `User` model.
 from main import app
 from extensions import db
 from models import User
-from werkzeug.security import generate_password_hash
-from rep_lookup import RepresentativeLookup
+from utils.dates import utcnow
+
+# Precomputed hashes of the well-known demo passwords, so seeding does no
+# KDF work. They use the scrypt fallback format, which verifies with or
+# without argon2-cffi installed, and are upgraded to Argon2id on the demo
+# user's first login. Only for these demo accounts; real passwords always
+# go through set_password().
+_DEMO_REGULAR_HASH = 'scrypt:32768:8:1$EFvzG7EY30BYzrLk$83ff962bed8ef8094a462fe6a01038331c45151f48935dfd3c7833abdecbf704dd1efe036e48295d8949a6bb5bfd4212cce030ed10bba85bde72ca58e4900fc5'  # Password1!
+_DEMO_POWER_HASH = 'scrypt:32768:8:1$upecOYP9pIF0OKnj$3de62d6636d376cb64c5f970164ae06afdd1ad2ed1b32dcd532430ad360d799e8ea77bbad574b9cd0b5aeb6848b7deefed73e500c1365560a5c2af3c40609959'  # Powerpass1!
 
 
 def init_db():
@@ -18,8 +25,12 @@ def init_db():
         # First, create all tables
         db.create_all()
         
-        # Create demo users directly
+        # Create demo users directly, with their representative data, in
+        # one transaction
+        # Note: Using mock data since live lookup may require browser session
         try:
+            now = utcnow()
+            
             # Regular user with Jefferson City address
             u = User(
                 username='regular',
@@ -29,10 +40,16 @@ def init_db():
                 city='Jefferson City',
                 state='MO',
                 zipcode='65101',
-                address_verified=True
+                address_verified=True,
+                senator_name="Barbara Washington",
+                senator_district="9",
+                senator_party="D",
+                representative_name="Mark Sharp",
+                representative_district="36",
+                representative_party="D",
+                reps_last_updated=now,
+                password_hash=_DEMO_REGULAR_HASH
             )
-            u.set_password('Password1!')
-            db.session.add(u)
             
             # Power user with St. Louis address
             p = User(
@@ -43,43 +60,22 @@ def init_db():
                 city='St Louis',
                 state='MO',
                 zipcode='63102',
-                address_verified=True
+                address_verified=True,
+                senator_name="Steven Roberts",
+                senator_district="5",
+                senator_party="D",
+                representative_name="Peter Merideth",
+                representative_district="80",
+                representative_party="D",
+                reps_last_updated=now,
+                password_hash=_DEMO_POWER_HASH
             )
-            p.set_password('Powerpass1!')
-            db.session.add(p)
             
+            db.session.add_all([u, p])
             db.session.commit()
-            
-            # Add representative data for demo users
-            # Note: Using mock data since live lookup may require browser session
-            try:
-                from datetime import datetime
-                
-                # Regular user - Kansas City
-                u.senator_name = "Barbara Washington"
-                u.senator_district = "9"
-                u.senator_party = "D"
-                u.representative_name = "Mark Sharp"
-                u.representative_district = "36"
-                u.representative_party = "D"
-                u.reps_last_updated = datetime.utcnow()
-                
-                # Power user - St. Louis
-                p.senator_name = "Steven Roberts"
-                p.senator_district = "5"
-                p.senator_party = "D"
-                p.representative_name = "Peter Merideth"
-                p.representative_district = "80"
-                p.representative_party = "D"
-                p.reps_last_updated = datetime.utcnow()
-                
-                db.session.commit()
-                print('Initialized DB and added demo users with representative data:')
-                print('  regular/Password1! (Jefferson City - Sen. Washington D-9, Rep. Sharp D-36)')
-                print('  power/Powerpass1! (St. Louis - Sen. Roberts D-5, Rep. Merideth D-80)')
-            except Exception as e:
-                print(f'Note: Error adding representative data: {e}')
-                print('Initialized DB and added demo users: regular/Password1! and power/Powerpass1!')
+            print('Initialized DB and added demo users with representative data:')
+            print('  regular/Password1! (Jefferson City - Sen. Washington D-9, Rep. Sharp D-36)')
+            print('  power/Powerpass1! (St. Louis - Sen. Roberts D-5, Rep. Merideth D-80)')
                 
         except Exception as e:
             print(f'Error: {e}')
@@ -1,22 +1,102 @@
 import os
-import time
-import re
-import secrets
-import urllib.request
-from bs4 import BeautifulSoup
-from flask import Flask, render_template, session, flash, redirect, url_for, request
+from flask import Flask, render_template, g
 from flask_migrate import Migrate
-from extensions import db
+from werkzeug.middleware.proxy_fix import ProxyFix
+from extensions import db, cache
 from datetime import datetime
-from auth import login_required, role_required
-from models import User, Comment
-from utils.data_fetcher import get_data_fetcher
+from auth import get_current_user, get_session_user
+from models import EMPTY_REPS_DISPLAY
+
+_DEFAULT_DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def format_datetime(value, format=_DEFAULT_DATETIME_FORMAT):
+    """Format a datetime object."""
+    if value is None:
+        return ""
+    # isoformat gives the same text as the default format for naive
+    # datetimes and is about 3x faster than strftime
+    if format == _DEFAULT_DATETIME_FORMAT and isinstance(value, datetime) and value.tzinfo is None:
+        return value.isoformat(' ', 'minutes')
+    return value.strftime(format)
+
+
+# Postgres advisory lock keys for the scheduled syncs
+_BILLS_SYNC_LOCK = 0x70757201
+_REPS_SYNC_LOCK = 0x70757202
+
+
+def _run_exclusive(app, lock_id, job):
+    """Run a scheduled job unless another process is already running it.
+
+    Every gunicorn worker starts its own scheduler, so each cron tick fires
+    once per worker. On Postgres a session advisory lock lets the first
+    worker run the sync and the rest skip it; other databases (SQLite in
+    development) run a single process and just run the job.
+    """
+    with app.app_context():
+        if db.engine.dialect.name != 'postgresql':
+            job()
+            return
+        from sqlalchemy import text
+        with db.engine.connect() as conn:
+            if not conn.execute(text('SELECT pg_try_advisory_lock(:id)'), {'id': lock_id}).scalar():
+                app.logger.info(f'[Scheduler] {job.__name__} already running in another worker; skipping')
+                return
+            try:
+                job()
+            finally:
+                conn.execute(text('SELECT pg_advisory_unlock(:id)'), {'id': lock_id})
+
+# The process's scheduler, once init_scheduler has started one
+_scheduler = None
+
+
+def init_scheduler(app):
+    """Start the background scheduler for periodic syncs (weekly bills, quarterly reps).
+
+    Only called by the server entrypoints below, never by create_app, so
+    scripts and tests that build an app for its context don't start
+    scheduler threads. Runs at most once per process; set ENABLE_SCHEDULER=0
+    to disable it entirely (disabled processes never import APScheduler).
+    """
+    global _scheduler
+    if _scheduler is not None:
+        return _scheduler
+    try:
+        if os.environ.get('ENABLE_SCHEDULER', '1') == '1':
+            from apscheduler.schedulers.background import BackgroundScheduler
+            from apscheduler.triggers.cron import CronTrigger
+
+            scheduler = BackgroundScheduler(timezone='UTC')
+
+            # The log handler timestamps each record
+            def _sync_bills_job():
+                from sync_bills import sync_bills_to_database
+                app.logger.info('[Scheduler] Syncing bills')
+                sync_bills_to_database()
+
+            def _sync_reps_job():
+                from sync_reps import main as sync_reps_main
+                app.logger.info('[Scheduler] Syncing representatives')
+                sync_reps_main()
+
+            # A missed or overlapping tick runs once, never concurrently
+            job_defaults = {'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600}
+            # Weekly on Sunday at 03:00 UTC
+            scheduler.add_job(_run_exclusive, CronTrigger(day_of_week='sun', hour=3, minute=0),
+                              args=(app, _BILLS_SYNC_LOCK, _sync_bills_job), id='sync_bills_weekly', **job_defaults)
+            # Quarterly on the 1st day of Jan, Apr, Jul, Oct at 04:00 UTC
+            scheduler.add_job(_run_exclusive, CronTrigger(month='1,4,7,10', day=1, hour=4, minute=0),
+                              args=(app, _REPS_SYNC_LOCK, _sync_reps_job), id='sync_reps_quarterly', **job_defaults)
+            scheduler.start()
+            _scheduler = scheduler
+            app.logger.info('Background scheduler started (weekly bills, quarterly reps).')
+    except Exception as e:
+        # Don't crash app if scheduler setup fails
+        print(f"Scheduler initialization skipped/error: {e}")
+    return _scheduler
 
-# Global caches
-_bills_cache = {'ts': 0, 'data': None}
-_BILLS_TTL = int(os.environ.get('BILLS_CACHE_TTL', 300))
-_reps_cache = {'ts': 0, 'data': None}
-_REPS_TTL = int(os.environ.get('REPS_CACHE_TTL', 300))
 
 def create_app(config_name='default'):
     """Create and configure the Flask application."""
@@ -25,6 +105,11 @@ def create_app(config_name='default'):
     # Load configuration
     from config import config
     app.config.from_object(config[config_name])
+
+    # Behind nginx, take the client address from X-Forwarded-For so
+    # request.remote_addr (and the per-IP rate limits) see the real client
+    if app.config.get('PROXY_FIX_X_FOR'):
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
     
     # Ensure instance folder exists
     try:
@@ -35,6 +120,14 @@ def create_app(config_name='default'):
     # Initialize extensions
     db.init_app(app)
     migrate = Migrate(app, db)
+    if cache is not None:
+        cache.init_app(app)
+    elif not app.debug and not app.testing:
+        app.logger.warning('Flask-Caching is not installed; bills and reps are cached per worker')
+
+    from utils.json_provider import ORJSON_AVAILABLE, ORJSONProvider
+    if ORJSON_AVAILABLE:
+        app.json = ORJSONProvider(app)
     
     # Register blueprints
     from auth import auth_bp
@@ -78,19 +171,16 @@ def create_app(config_name='default'):
     @app.context_processor
     def utility_processor():
         """Make common utilities available to templates."""
-        def format_datetime(value, format='%Y-%m-%d %H:%M'):
-            """Format a datetime object."""
-            if value is None:
-                return ""
-            return value.strftime(format)
-        
         def get_user_reps():
             """Get representative information for logged-in user."""
-            if 'user_id' in session:
-                user = User.query.get(session.get('user_id'))
+            # Templates may call this several times per page; build it once
+            if '_user_reps' not in g:
+                user = get_current_user()
                 if user:
-                    return user.get_representatives_display()
-            return {'has_data': False, 'senator': None, 'representative': None}
+                    g._user_reps = user.get_representatives_display()
+                else:
+                    g._user_reps = EMPTY_REPS_DISPLAY
+            return g._user_reps
         
         return dict(
             format_datetime=format_datetime,
@@ -99,110 +189,23 @@ def create_app(config_name='default'):
 
     @app.route('/')
     def index():
-        user = None
-        if 'user_id' in session:
-            user = User.query.get(session.get('user_id'))
-        return render_template('index.html', user=user)
+        return render_template('index.html', user=get_session_user())
 
     @app.route('/about')
     def about():
         return render_template('about.html')
 
-    # Start background scheduler for periodic syncs (weekly bills, quarterly reps)
-    try:
-        from apscheduler.schedulers.background import BackgroundScheduler
-        from apscheduler.triggers.cron import CronTrigger
-
-        if os.environ.get('ENABLE_SCHEDULER', '1') == '1':
-            scheduler = BackgroundScheduler(timezone='UTC')
-
-            def _sync_bills_job():
-                from sync_bills import sync_bills_to_database
-                with app.app_context():
-                    app.logger.info(f"[Scheduler] Syncing bills @ {datetime.utcnow().isoformat()}Z")
-                    sync_bills_to_database()
-
-            def _sync_reps_job():
-                from sync_reps import main as sync_reps_main
-                with app.app_context():
-                    app.logger.info(f"[Scheduler] Syncing representatives @ {datetime.utcnow().isoformat()}Z")
-                    sync_reps_main()
-
-            # Weekly on Sunday at 03:00 UTC
-            scheduler.add_job(_sync_bills_job, CronTrigger(day_of_week='sun', hour=3, minute=0))
-            # Quarterly on the 1st day of Jan, Apr, Jul, Oct at 04:00 UTC
-            scheduler.add_job(_sync_reps_job, CronTrigger(month='1,4,7,10', day=1, hour=4, minute=0))
-            scheduler.start()
-            app.logger.info('Background scheduler started (weekly bills, quarterly reps).')
-    except Exception as e:
-        # Don't crash app if scheduler setup fails
-        print(f"Scheduler initialization skipped/error: {e}")
-
     return app
 
 
-def fetch_remote_page(url, timeout=10):
-    """Fetch a remote page using urllib and return decoded text."""
-    try:
-        with urllib.request.urlopen(url, timeout=timeout) as resp:
-            content_bytes = resp.read()
-            try:
-                return content_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                return content_bytes.decode('latin-1')
-    except Exception:
-        return None
-
-
-def parse_bills_with_bs(html_text):
-    """Parse bills from HTML text using BeautifulSoup."""
-    if not html_text:
-        return []
-
-    soup = BeautifulSoup(html_text, 'html.parser')
-    bills = []
-    bills_table = soup.find('table', class_='sortable')
-    
-    if not bills_table:
-        return []
-
-    for row in bills_table.find_all('tr')[1:]:
-        cols = row.find_all('td')
-        if len(cols) >= 3:
-            bill_id = cols[0].text.strip()
-            description = cols[1].text.strip()
-            sponsor = cols[2].text.strip()
-            
-            bill_link = cols[0].find('a')
-            bill_url = bill_link['href'] if bill_link else None
-            
-            if bill_id and sponsor:
-                bills.append({
-                    'id': bill_id,
-                    'description': description,
-                    'sponsor': sponsor,
-                    'url': bill_url
-                })
-    
-    return bills
-
-
-def get_rep_by_name(name):
-    """Get a representative by their name from the cache."""
-    if _reps_cache['data']:
-        for rep in _reps_cache['data']:
-            if rep['name'].lower() == name.lower():
-                rep['sponsored_bills'] = []
-                if _bills_cache['data']:
-                    for bill in _bills_cache['data']:
-                        if bill['sponsor'].lower() == name.lower():
-                            rep['sponsored_bills'].append(bill)
-                return rep
-    return None
-
-
 # Create the application instance
 app = create_app(os.getenv('FLASK_ENV', 'default'))
 
+# Gunicorn sets SERVER_SOFTWARE for both main:app and wsgi:application
+# (which imports this module); migration scripts never match
+if os.environ.get('SERVER_SOFTWARE', '').startswith('gunicorn'):
+    init_scheduler(app)
+
 if __name__ == '__main__':
-    app.run()
\ No newline at end of file
+    init_scheduler(app)
+    app.run()
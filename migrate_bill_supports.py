@@ -20,6 +20,10 @@ with app.app_context():
                 CONSTRAINT uq_bill_user_vote UNIQUE(bill_number, user_id)
             )
         """))
+        # Same single-column indexes as the model and Alembic migrations, for
+        # "supports by user" / "supports on X" lookups
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_bill_supports_bill_number ON bill_supports(bill_number)"))
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_bill_supports_user_id ON bill_supports(user_id)"))
         db.session.commit()
         print("✓ bill_supports table ensured")
     except Exception as e:
@@ -20,6 +20,10 @@ with app.app_context():
                 CONSTRAINT uq_comment_user_vote UNIQUE(comment_id, user_id)
             )
         """))
+        # Same single-column indexes as the model and Alembic migrations, for
+        # "supports by user" / "supports on X" lookups
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_comment_supports_comment_id ON comment_supports(comment_id)"))
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_comment_supports_user_id ON comment_supports(user_id)"))
         db.session.commit()
         print("✓ comment_supports table ensured")
     except Exception as e:
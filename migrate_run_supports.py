@@ -18,6 +18,10 @@ with app.app_context():
                 CONSTRAINT uq_candidate_supporter UNIQUE(candidate_user_id, supporter_user_id)
             )
         """))
+        # Same single-column indexes as the model and Alembic migrations, for
+        # "supports by user" / "supports on X" lookups
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_run_supports_candidate_user_id ON run_supports(candidate_user_id)"))
+        db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_run_supports_supporter_user_id ON run_supports(supporter_user_id)"))
         db.session.commit()
         print("✓ run_supports table ensured")
     except Exception as e:
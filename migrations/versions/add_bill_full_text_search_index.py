@@ -0,0 +1,33 @@
+"""Add full-text search index on bills.full_text
+
+Revision ID: add_bill_full_text_search_index
+Revises: add_bill_word_count
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bill_full_text_search_index'
+down_revision = 'add_bill_word_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Expression index; queries must use the same to_tsvector('english', full_text)
+    # to hit it. Other databases fall back to LIKE scans.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.create_index('ix_bills_full_text_search', 'bills',
+                        [sa.text("to_tsvector('english', full_text)")],
+                        postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_bills_full_text_search', table_name='bills')
@@ -0,0 +1,26 @@
+"""Add sections_json column to bills table
+
+Revision ID: add_bill_sections_json
+Revises: add_bill_full_text_search_index
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bill_sections_json'
+down_revision = 'add_bill_full_text_search_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by fetch_bill_text.py; rows left NULL are parsed on demand by
+    # Bill.get_key_sections() until their text is refetched
+    op.add_column('bills', sa.Column('sections_json', sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('bills', 'sections_json')
@@ -0,0 +1,36 @@
+"""Add word_count column to bills table
+
+Revision ID: add_bill_word_count
+Revises: add_reps_last_updated_index
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bill_word_count'
+down_revision = 'add_reps_last_updated_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('bills', sa.Column('word_count', sa.Integer(), nullable=True))
+
+    # Backfill bills that already have text, using the same split() count
+    # fetch_bill_text.py uses for new text
+    bind = op.get_bind()
+    bills = sa.table('bills', sa.column('id', sa.Integer), sa.column('full_text', sa.Text),
+                     sa.column('word_count', sa.Integer))
+    rows = bind.execute(sa.select(bills.c.id, bills.c.full_text).where(bills.c.full_text.isnot(None))).fetchall()
+    if rows:
+        bind.execute(
+            bills.update().where(bills.c.id == sa.bindparam('bill_id')).values(word_count=sa.bindparam('count')),
+            [{'bill_id': row.id, 'count': len(row.full_text.split())} for row in rows],
+        )
+
+
+def downgrade():
+    op.drop_column('bills', 'word_count')
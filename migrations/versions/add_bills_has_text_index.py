@@ -0,0 +1,28 @@
+"""Add partial index on bills with fetched text
+
+Revision ID: add_bills_has_text_index
+Revises: add_bill_sections_json
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_bills_has_text_index'
+down_revision = 'add_bill_sections_json'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only rows with text are indexed, so this stays small while most bills
+    # have not been fetched yet
+    op.create_index('ix_bills_has_text', 'bills', ['id'],
+                    postgresql_where=sa.text('full_text IS NOT NULL'),
+                    sqlite_where=sa.text('full_text IS NOT NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_bills_has_text', table_name='bills')
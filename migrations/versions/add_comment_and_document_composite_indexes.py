@@ -0,0 +1,41 @@
+"""Composite indexes for comment and document verification lookups
+
+Revision ID: add_comment_and_document_composite_indexes
+Revises: add_draft_bills_visibility_indexes
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_comment_and_document_composite_indexes'
+down_revision = 'add_draft_bills_visibility_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, new composite index, its columns, single-column index it replaces)
+INDEXES = [
+    ('comments', 'ix_comments_bill_hidden_created', ['bill_id', 'is_hidden', 'created_at'],
+     ('ix_comments_bill_id', 'bill_id')),
+    ('document_verifications', 'ix_document_verifications_user_status', ['user_id', 'verification_status'],
+     ('ix_document_verifications_user_id', 'user_id')),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table, name, columns, (old_name, _) in INDEXES:
+        op.create_index(name, table, columns)
+        # The old index is a prefix of the new one. Tables first built by
+        # create_all may not have it under this name
+        if old_name in {index['name'] for index in inspector.get_indexes(table)}:
+            op.drop_index(old_name, table_name=table)
+
+
+def downgrade():
+    for table, name, _, (old_name, old_column) in INDEXES:
+        op.create_index(old_name, table, [old_column])
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,23 @@
+"""Index comments by author
+
+Revision ID: add_comments_user_id_index
+Revises: add_bills_has_text_index
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_comments_user_id_index'
+down_revision = 'add_bills_has_text_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_comments_user_id'), 'comments', ['user_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_comments_user_id'), table_name='comments')
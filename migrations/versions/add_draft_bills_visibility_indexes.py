@@ -0,0 +1,29 @@
+"""Index draft bill visibility lookups
+
+Revision ID: add_draft_bills_visibility_indexes
+Revises: add_support_counts
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_draft_bills_visibility_indexes'
+down_revision = 'add_support_counts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_draft_bills_visibility_rep', 'draft_bills', ['visibility', 'representative_id'])
+    # Only public drafts are indexed, for anonymous browsing by recency
+    op.create_index('ix_draft_bills_public_updated', 'draft_bills', ['updated_at'],
+                    postgresql_where=sa.text("visibility = 'public'"),
+                    sqlite_where=sa.text("visibility = 'public'"))
+
+
+def downgrade():
+    op.drop_index('ix_draft_bills_public_updated', table_name='draft_bills')
+    op.drop_index('ix_draft_bills_visibility_rep', table_name='draft_bills')
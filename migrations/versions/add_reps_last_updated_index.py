@@ -0,0 +1,27 @@
+"""Add index on users.reps_last_updated
+
+Revision ID: add_reps_last_updated_index
+Revises: add_username_lower_index
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_reps_last_updated_index'
+down_revision = 'add_username_lower_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # confirm_user_reps.py selects stale users by reps_last_updated
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_reps_last_updated'), ['reps_last_updated'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_reps_last_updated'))
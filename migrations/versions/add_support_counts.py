@@ -0,0 +1,107 @@
+"""Denormalize support/oppose counts onto bills and comments
+
+Revision ID: add_support_counts
+Revises: add_comments_user_id_index
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_support_counts'
+down_revision = 'add_comments_user_id_index'
+branch_labels = None
+depends_on = None
+
+
+# (votes table, counted table, votes column, counted table key, seed new rows)
+VOTE_TABLES = [
+    # Bills can be voted on before sync_bills inserts them
+    ('bill_supports', 'bills', 'bill_number', 'bill_number', True),
+    ('comment_supports', 'comments', 'comment_id', 'id', False),
+]
+
+
+def _trigger_ddl(dialect, votes, parent, fk, key, seed):
+    """Same triggers the models attach to create_all (models._vote_count_triggers)."""
+    def tally(value):
+        return f"(SELECT COUNT(*) FROM {votes} WHERE {fk} = NEW.{key} AND value = {value})"
+
+    def delta(sign, row):
+        return (f"support_count = support_count {sign} (CASE WHEN {row}.value = 1 THEN 1 ELSE 0 END), "
+                f"oppose_count = oppose_count {sign} (CASE WHEN {row}.value = -1 THEN 1 ELSE 0 END)")
+
+    add = f"UPDATE {parent} SET {delta('+', 'NEW')} WHERE {key} = NEW.{fk};"
+    remove = f"UPDATE {parent} SET {delta('-', 'OLD')} WHERE {key} = OLD.{fk};"
+    if dialect == 'postgresql':
+        statements = [
+            f"""CREATE OR REPLACE FUNCTION {votes}_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN {remove} END IF;
+    IF TG_OP <> 'DELETE' THEN {add} END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql""",
+            f"CREATE TRIGGER trg_{votes}_count AFTER INSERT OR DELETE OR UPDATE OF value, {fk} ON {votes} "
+            f"FOR EACH ROW EXECUTE FUNCTION {votes}_count()",
+        ]
+        if seed:
+            statements += [
+                f"""CREATE OR REPLACE FUNCTION {parent}_seed_counts() RETURNS trigger AS $$
+BEGIN
+    NEW.support_count := {tally(1)};
+    NEW.oppose_count := {tally(-1)};
+    RETURN NEW;
+END $$ LANGUAGE plpgsql""",
+                f"CREATE TRIGGER trg_{parent}_seed_counts BEFORE INSERT ON {parent} "
+                f"FOR EACH ROW EXECUTE FUNCTION {parent}_seed_counts()",
+            ]
+        return statements
+    statements = [
+        f"CREATE TRIGGER trg_{votes}_insert AFTER INSERT ON {votes} BEGIN {add} END",
+        f"CREATE TRIGGER trg_{votes}_delete AFTER DELETE ON {votes} BEGIN {remove} END",
+        f"CREATE TRIGGER trg_{votes}_update AFTER UPDATE OF value, {fk} ON {votes} BEGIN {remove} {add} END",
+    ]
+    if seed:
+        statements.append(
+            f"CREATE TRIGGER trg_{parent}_seed_counts AFTER INSERT ON {parent} BEGIN "
+            f"UPDATE {parent} SET support_count = {tally(1)}, oppose_count = {tally(-1)} "
+            f"WHERE {key} = NEW.{key}; END"
+        )
+    return statements
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    for votes, parent, fk, key, seed in VOTE_TABLES:
+        op.add_column(parent, sa.Column('support_count', sa.Integer(), nullable=False, server_default='0'))
+        op.add_column(parent, sa.Column('oppose_count', sa.Integer(), nullable=False, server_default='0'))
+
+        # Backfill from the existing votes, then let the triggers keep it current
+        for column, value in (('support_count', 1), ('oppose_count', -1)):
+            op.execute(
+                f"UPDATE {parent} SET {column} = (SELECT COUNT(*) FROM {votes} "
+                f"WHERE {votes}.{fk} = {parent}.{key} AND {votes}.value = {value})"
+            )
+
+        for statement in _trigger_ddl(dialect, votes, parent, fk, key, seed):
+            op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    for votes, parent, fk, key, seed in VOTE_TABLES:
+        if dialect == 'postgresql':
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{votes}_count ON {votes}")
+            op.execute(f"DROP FUNCTION IF EXISTS {votes}_count()")
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{parent}_seed_counts ON {parent}")
+            op.execute(f"DROP FUNCTION IF EXISTS {parent}_seed_counts()")
+        else:
+            for event in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER IF EXISTS trg_{votes}_{event}")
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{parent}_seed_counts")
+
+        with op.batch_alter_table(parent) as batch_op:
+            batch_op.drop_column('oppose_count')
+            batch_op.drop_column('support_count')
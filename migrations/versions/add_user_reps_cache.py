@@ -0,0 +1,27 @@
+"""Add cached representative lookup columns to users table
+
+Revision ID: add_user_reps_cache
+Revises: 01a36cdb8633
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_user_reps_cache'
+down_revision = '01a36cdb8633'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Profile page reuses the last representative lookup for 24 hours
+    op.add_column('users', sa.Column('reps_fetched_at', sa.DateTime(), nullable=True))
+    op.add_column('users', sa.Column('reps_cache_json', sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('users', 'reps_cache_json')
+    op.drop_column('users', 'reps_fetched_at')
@@ -0,0 +1,31 @@
+"""Add case-insensitive unique index on users.username
+
+Revision ID: add_username_lower_index
+Revises: add_user_reps_cache
+Create Date: 2025-11-10 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_username_lower_index'
+down_revision = 'add_user_reps_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Fails if existing usernames collide case-insensitively; resolve those first.
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build without locking the users table against writes
+        with op.get_context().autocommit_block():
+            op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')],
+                            unique=True, postgresql_concurrently=True)
+    else:
+        op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=True)
+
+
+def downgrade():
+    op.drop_index('ix_users_username_lower', table_name='users')
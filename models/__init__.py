@@ -1,14 +1,50 @@
 """
 Models package for database models.
 """
+import json
+from datetime import timedelta
+from functools import cached_property
+from types import MappingProxyType
+
+from sqlalchemy import DDL, event
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import column_property, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+
 from extensions import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from utils.dates import utcnow
+from utils.passwords import hash_password, verify_password
 from models.document_verification import DocumentVerification
 
+# get_representatives_display() result for users without rep info; read-only
+# because it is shared by every such user
+EMPTY_REPS_DISPLAY = MappingProxyType({'has_data': False, 'senator': None, 'representative': None})
+
+
+# Lookup result key (and its legacy alias) -> User columns for its
+# _REP_INFO_FIELDS, in order
+_REP_INFO_FIELDS = ('name', 'district', 'party')
+_REP_INFO_COLUMNS = (
+    ('state_senator', 'senator', ('senator_name', 'senator_district', 'senator_party')),
+    ('state_representative', 'representative',
+     ('representative_name', 'representative_district', 'representative_party')),
+)
+
+
+def _rep_display(name, district, party):
+    """Display dict for one legislator, with 'N/A' for missing fields."""
+    district = district or 'N/A'
+    party = party or 'N/A'
+    return {'name': name, 'district': district, 'party': party, 'display': f"{name} ({party}-{district})"}
+
 class User(db.Model):
     __tablename__ = 'users'
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(150), unique=True, nullable=False)
+    __table_args__ = (
+        # Usernames are unique case-insensitively; logins look them up by lower()
+        db.Index('ix_users_username_lower', db.func.lower(username), unique=True),
+    )
     email = db.Column(db.String(255), unique=True, nullable=True)  # Nullable for existing users
     password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(50), nullable=False, default='regular')  # regular, power, rep, staffer
@@ -39,7 +75,11 @@ class User(db.Model):
     representative_name = db.Column(db.String(255), nullable=True)
     representative_district = db.Column(db.String(10), nullable=True)
     representative_party = db.Column(db.String(50), nullable=True)
-    reps_last_updated = db.Column(db.DateTime, nullable=True)
+    reps_last_updated = db.Column(db.DateTime, nullable=True, index=True)
+    
+    # Cached representative lookup shown on the profile page
+    reps_fetched_at = db.Column(db.DateTime, nullable=True)
+    reps_cache_json = db.Column(db.Text, nullable=True)
     
     # Profile fields
     bio = db.Column(db.Text, nullable=True)
@@ -51,71 +91,111 @@ class User(db.Model):
     # Relationship to Representative (for staffer users)
     rep_boss = db.relationship('Representative', backref='staffers', foreign_keys=[rep_boss_id])
 
+    @classmethod
+    def by_username(cls, username, *columns):
+        """Case-insensitive username lookup (uses ix_users_username_lower).
+
+        If `columns` are given, only those are loaded; others load on access.
+        """
+        query = cls.query
+        if columns:
+            query = query.options(load_only(*columns))
+        return query.filter(db.func.lower(cls.username) == username.lower()).one_or_none()
+
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        self.password_hash = hash_password(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """Verify a password, upgrading a legacy hash in place on success.
+
+        The caller is responsible for committing the session if the hash
+        was upgraded.
+        """
+        is_valid, new_hash = verify_password(self.password_hash, password)
+        if new_hash:
+            self.password_hash = new_hash
+        return is_valid
+    
+    def get_cached_reps(self, max_age=timedelta(hours=24)):
+        """Return the cached representative lookup, or None if missing or stale."""
+        if not self.reps_cache_json or not self.reps_fetched_at:
+            return None
+        if self.reps_fetched_at < utcnow() - max_age:
+            return None
+        return json.loads(self.reps_cache_json)
+
+    def set_cached_reps(self, rep_info):
+        """Store a representative lookup result (None clears the cache)."""
+        self.reps_cache_json = json.dumps(rep_info) if rep_info is not None else None
+        self.reps_fetched_at = utcnow() if rep_info is not None else None
+    
+    def representative_values(self, rep_info):
+        """Column values that update_representatives writes for a lookup result.
+
+        reps_last_updated is not included; writers set it to the database's
+        now() so a batch doesn't build a timestamp per user.
+        """
+        values = {}
+        for key, legacy_key, columns in _REP_INFO_COLUMNS:
+            block = rep_info.get(key) or rep_info.get(legacy_key)
+            if block:
+                values.update(zip(columns, map(block.get, _REP_INFO_FIELDS)))
+        return values
     
     def update_representatives(self, rep_info):
         """Update representative information from lookup result."""
-        from datetime import datetime
-        
         if not rep_info:
             return False
         
-        # Update senator info (support legacy and new keys)
-        senator_block = rep_info.get('state_senator') or rep_info.get('senator')
-        if senator_block:
-            senator = senator_block
-            self.senator_name = senator.get('name')
-            self.senator_district = senator.get('district')
-            self.senator_party = senator.get('party')
-        
-        # Update representative info (support legacy and new keys)
-        representative_block = rep_info.get('state_representative') or rep_info.get('representative')
-        if representative_block:
-            rep = representative_block
-            self.representative_name = rep.get('name')
-            self.representative_district = rep.get('district')
-            self.representative_party = rep.get('party')
-        
-        self.reps_last_updated = datetime.utcnow()
+        for key, value in self.representative_values(rep_info).items():
+            setattr(self, key, value)
+        # Assigned by the database when the row is flushed
+        self.reps_last_updated = db.func.now()
         return True
     
     def get_representatives_display(self):
         """Get formatted representative information for display."""
-        result = {'has_data': False}
-        
-        if self.senator_name or self.representative_name:
-            result['has_data'] = True
-        
-        if self.senator_name:
-            result['senator'] = {
-                'name': self.senator_name,
-                'district': self.senator_district or 'N/A',
-                'party': self.senator_party or 'N/A',
-                'display': f"{self.senator_name} ({self.senator_party or 'N/A'}-{self.senator_district or 'N/A'})"
-            }
-        else:
-            result['senator'] = None
-        
-        if self.representative_name:
-            result['representative'] = {
-                'name': self.representative_name,
-                'district': self.representative_district or 'N/A',
-                'party': self.representative_party or 'N/A',
-                'display': f"{self.representative_name} ({self.representative_party or 'N/A'}-{self.representative_district or 'N/A'})"
-            }
-        else:
-            result['representative'] = None
+        return self.representatives_display
+
+    @cached_property
+    def representatives_display(self):
+        """get_representatives_display() result, built once per loaded instance.
+
+        Dropped whenever one of the rep columns is set or the instance is
+        expired or refreshed (see _forget_reps_display).
+        """
+        senator_name = self.senator_name
+        representative_name = self.representative_name
+        if not (senator_name or representative_name):
+            return EMPTY_REPS_DISPLAY
         
-        return result
+        return {
+            'has_data': True,
+            'senator': _rep_display(senator_name, self.senator_district, self.senator_party)
+                       if senator_name else None,
+            'representative': _rep_display(representative_name, self.representative_district,
+                                           self.representative_party)
+                              if representative_name else None,
+        }
 
     def __repr__(self):
         return f"<User {self.username} ({self.role})>"
 
 
+# Columns representatives_display is built from
+_REPS_DISPLAY_COLUMNS = tuple(column for _, _, columns in _REP_INFO_COLUMNS for column in columns)
+
+
+def _forget_reps_display(target, *args):
+    target.__dict__.pop('representatives_display', None)
+
+
+for _column in _REPS_DISPLAY_COLUMNS:
+    event.listen(getattr(User, _column), 'set', _forget_reps_display)
+event.listen(User, 'expire', _forget_reps_display)
+event.listen(User, 'refresh', _forget_reps_display)
+
+
 class Bill(db.Model):
     __tablename__ = 'bills'
     id = db.Column(db.Integer, primary_key=True)
@@ -131,12 +211,29 @@ class Bill(db.Model):
     text_pdf_url = db.Column(db.String(500), nullable=True)
     summary_pdf_url = db.Column(db.String(500), nullable=True)
     text_fetched_at = db.Column(db.DateTime, nullable=True)
+    word_count = db.Column(db.Integer, nullable=True)  # len(full_text.split()), set with full_text
+    sections_json = db.Column(db.Text, nullable=True)  # extract_key_sections(full_text), set with full_text
+    # Maintained by triggers on bill_supports (see _vote_count_triggers)
+    support_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    oppose_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    __table_args__ = (
+        # Most text queries filter on full_text IS NOT NULL
+        db.Index('ix_bills_has_text', 'id',
+                 postgresql_where=db.text('full_text IS NOT NULL'),
+                 sqlite_where=db.text('full_text IS NOT NULL')),
+        # Full-text search matches to_tsvector('english', full_text); PostgreSQL only
+        db.Index('ix_bills_full_text_search', db.func.to_tsvector(db.literal_column("'english'"), full_text),
+                 postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
     
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
 
     def to_dict(self):
         """Convert bill to dictionary for template rendering."""
+        # Unflushed bills have None until the insert applies the defaults
+        support_count = self.support_count or 0
+        oppose_count = self.oppose_count or 0
         return {
             'id': self.bill_number,
             'number': self.bill_number,
@@ -145,9 +242,9 @@ class Bill(db.Model):
             'description': self.description,
             'status': self.status,
             'last_action': self.last_action,
-            'support_count': getattr(self, 'support_count', None),
-            'oppose_count': getattr(self, 'oppose_count', None),
-            'score': (getattr(self, 'support_count', 0) or 0) - (getattr(self, 'oppose_count', 0) or 0),
+            'support_count': support_count,
+            'oppose_count': oppose_count,
+            'score': support_count - oppose_count,
             'has_full_text': bool(self.full_text),
             'text_pdf_url': self.text_pdf_url,
             'summary_pdf_url': self.summary_pdf_url,
@@ -156,32 +253,81 @@ class Bill(db.Model):
     def get_llm_context(self, max_length=None):
         """Get bill text formatted for LLM processing.
         
+        Metadata and a summary of the key sections come first, so when
+        max_length applies it cuts the tail of the bill text rather than
+        the information a model needs most.
+        
         Args:
             max_length: Optional max characters to return (for context length limits)
             
         Returns:
-            Formatted string with bill metadata and full text
+            Formatted string with bill metadata, key sections and full text
         """
-        context = f"""Bill: {self.bill_number}
+        parts = [f"""Bill: {self.bill_number}
 Title: {self.title or 'No title'}
 Sponsor: {self.sponsor or 'Unknown'}
 Status: {self.status or 'Unknown'}
 Last Action: {self.last_action or 'None'}
 
-"""
+"""]
         if self.description:
-            context += f"Description:\n{self.description}\n\n"
+            parts.append(f"Description:\n{self.description}\n\n")
         
-        if self.full_text:
-            context += f"Full Bill Text:\n{self.full_text}\n"
+        full_text = self.full_text
+        if full_text:
+            sections = self.get_key_sections()
+            effective_date = sections.get('effective_date')
+            numbered_sections = sections.get('numbered_sections')
+            if effective_date:
+                parts.append(f"Effective Date: {effective_date}\n")
+            if numbered_sections:
+                parts.append(f"Number of Sections: {len(numbered_sections)}\n")
+            if effective_date or numbered_sections:
+                parts.append("\n")
+            parts.append("Full Bill Text:\n")
         else:
-            context += "Full Bill Text: Not yet fetched\n"
+            parts.append("Full Bill Text: Not yet fetched\n")
+        context = ''.join(parts)
+        
+        if full_text:
+            if max_length and len(context) + len(full_text) + 1 > max_length:
+                # Copy only the part of the text that survives truncation
+                text = full_text[:max(0, max_length - len(context))]
+                return context[:max_length] + text + "\n... [truncated]"
+            # One copy of the (possibly very long) text
+            return ''.join((context, full_text, "\n"))
         
         if max_length and len(context) > max_length:
             context = context[:max_length] + "\n... [truncated]"
         
         return context
 
+    def get_key_sections(self):
+        """Return extract_key_sections() output, from the stored copy when present."""
+        if self.sections_json:
+            return json.loads(self.sections_json)
+        from services.bill_text_fetcher import extract_key_sections
+        return extract_key_sections(self.full_text)
+
+    def iter_chunks(self, size=1024, overlap=256):
+        """Yield the full text in overlapping, sentence-aligned chunks (see services.chunking)."""
+        from services.chunking import chunk_text
+        return chunk_text(self.full_text, size=size, overlap=overlap)
+
+    @classmethod
+    def full_text_matches(cls, term, dialect_name):
+        """SQL condition for bills whose full text mentions `term`.
+        
+        On PostgreSQL this is a stemmed word match served by the
+        ix_bills_full_text_search index; other databases fall back to a
+        case-insensitive substring scan.
+        """
+        if dialect_name == 'postgresql':
+            english = db.literal_column("'english'")
+            return db.func.to_tsvector(english, cls.full_text).op('@@')(
+                db.func.plainto_tsquery(english, term))
+        return cls.full_text.ilike('%' + term + '%')
+
     def __repr__(self):
         return f"<Bill {self.bill_number}>"
 
@@ -189,28 +335,37 @@ Last Action: {self.last_action or 'None'}
 class Comment(db.Model):
     __tablename__ = 'comments'
     id = db.Column(db.Integer, primary_key=True)
-    bill_id = db.Column(db.String(64), nullable=False, index=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    bill_id = db.Column(db.String(64), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     content = db.Column(db.Text, nullable=False)
     is_hidden = db.Column(db.Boolean, nullable=False, server_default='0')
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    __table_args__ = (
+        # A bill's visible comments, newest first (get_comments_for_bill)
+        db.Index('ix_comments_bill_hidden_created', 'bill_id', 'is_hidden', 'created_at'),
+    )
+    # Maintained by triggers on comment_supports (see _vote_count_triggers)
+    support_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    oppose_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     user = db.relationship('User', backref=db.backref('comments', lazy='dynamic'))
 
     def __repr__(self):
         return f"<Comment {self.id} bill={self.bill_id} user={self.user_id}>"
 
-    @property
+    # Read the trigger-maintained counts rather than loading every vote; as
+    # hybrids they also work in queries, e.g. order_by(Comment.score.desc())
+    @hybrid_property
     def up_votes(self):
-        return sum(1 for v in self.votes if v.value == 1)
+        return self.support_count
 
-    @property
+    @hybrid_property
     def down_votes(self):
-        return sum(1 for v in self.votes if v.value == -1)
+        return self.oppose_count
 
-    @property
+    @hybrid_property
     def score(self):
-        return self.up_votes - self.down_votes
+        return self.support_count - self.oppose_count
 
 
 class CommentSupport(db.Model):
@@ -249,10 +404,90 @@ class BillSupport(db.Model):
         db.UniqueConstraint('bill_number', 'user_id', name='uq_bill_user_vote'),
     )
 
+    @classmethod
+    def counts_for(cls, bill_numbers):
+        """Count support/oppose votes per bill number from the votes themselves.
+
+        Bills with a Bill row carry these counts as columns. Votes can also be
+        cast on bills only known from the scraped list, which have no row to
+        keep counts on. Returns {bill_number: (support, oppose)}.
+        """
+        rows = db.session.query(
+            cls.bill_number,
+            db.func.sum(db.case((cls.value == 1, 1), else_=0)),
+            db.func.sum(db.case((cls.value == -1, 1), else_=0)),
+        ).filter(cls.bill_number.in_(bill_numbers)).group_by(cls.bill_number)
+        return {num: (up, down) for num, up, down in rows}
+
     def __repr__(self):
         return f"<BillSupport bill={self.bill_number} user={self.user_id} value={self.value}>"
 
 
+def _vote_count_triggers(votes, parent, fk, key, seed=False):
+    """Triggers keeping parent.support_count/oppose_count in step with a votes table.
+
+    Pages read the denormalized counts instead of grouping the votes on
+    every render. With `seed`, a parent row inserted after votes were cast
+    on its key starts from those votes rather than 0 (bill_supports accepts
+    any bill number, so a bill can be voted on before sync_bills adds it).
+    Returns (sqlite, postgresql) lists of DDL statements.
+    """
+    def delta(sign, row):
+        return (f"support_count = support_count {sign} (CASE WHEN {row}.value = 1 THEN 1 ELSE 0 END), "
+                f"oppose_count = oppose_count {sign} (CASE WHEN {row}.value = -1 THEN 1 ELSE 0 END)")
+
+    add = f"UPDATE {parent} SET {delta('+', 'NEW')} WHERE {key} = NEW.{fk};"
+    remove = f"UPDATE {parent} SET {delta('-', 'OLD')} WHERE {key} = OLD.{fk};"
+    sqlite = [
+        f"CREATE TRIGGER trg_{votes}_insert AFTER INSERT ON {votes} BEGIN {add} END",
+        f"CREATE TRIGGER trg_{votes}_delete AFTER DELETE ON {votes} BEGIN {remove} END",
+        f"CREATE TRIGGER trg_{votes}_update AFTER UPDATE OF value, {fk} ON {votes} BEGIN {remove} {add} END",
+    ]
+    postgresql = [
+        f"""CREATE OR REPLACE FUNCTION {votes}_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN {remove} END IF;
+    IF TG_OP <> 'DELETE' THEN {add} END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql""",
+        f"CREATE TRIGGER trg_{votes}_count AFTER INSERT OR DELETE OR UPDATE OF value, {fk} ON {votes} "
+        f"FOR EACH ROW EXECUTE FUNCTION {votes}_count()",
+    ]
+    if seed:
+        def tally(value):
+            return f"(SELECT COUNT(*) FROM {votes} WHERE {fk} = NEW.{key} AND value = {value})"
+
+        sqlite.append(
+            f"CREATE TRIGGER trg_{parent}_seed_counts AFTER INSERT ON {parent} BEGIN "
+            f"UPDATE {parent} SET support_count = {tally(1)}, oppose_count = {tally(-1)} "
+            f"WHERE {key} = NEW.{key}; END"
+        )
+        postgresql += [
+            f"""CREATE OR REPLACE FUNCTION {parent}_seed_counts() RETURNS trigger AS $$
+BEGIN
+    NEW.support_count := {tally(1)};
+    NEW.oppose_count := {tally(-1)};
+    RETURN NEW;
+END $$ LANGUAGE plpgsql""",
+            f"CREATE TRIGGER trg_{parent}_seed_counts BEFORE INSERT ON {parent} "
+            f"FOR EACH ROW EXECUTE FUNCTION {parent}_seed_counts()",
+        ]
+    return sqlite, postgresql
+
+
+def _listen_vote_count_triggers(model, parent, fk, key, seed=False):
+    """Create the vote count triggers whenever model's table is created."""
+    sqlite, postgresql = _vote_count_triggers(model.__tablename__, parent, fk, key, seed)
+    for statement in sqlite:
+        event.listen(model.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+    for statement in postgresql:
+        event.listen(model.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+
+
+_listen_vote_count_triggers(BillSupport, 'bills', 'bill_number', 'bill_number', seed=True)
+_listen_vote_count_triggers(CommentSupport, 'comments', 'comment_id', 'id')
+
+
 class RunSupport(db.Model):
     __tablename__ = 'run_supports'
     id = db.Column(db.Integer, primary_key=True)
@@ -392,6 +627,23 @@ class EventPurchase(db.Model):
     user = db.relationship('User', backref=db.backref('event_purchases', lazy='dynamic'))
     option = db.relationship('EventOption', backref=db.backref('purchases', lazy='dynamic'))
     
+    @classmethod
+    def bulk_create(cls, rows):
+        """Insert purchases from a list of column dicts and return their new ids.
+
+        One multi-row INSERT ... RETURNING (paged at 1000 rows) instead of
+        flushing an EventPurchase object per row. The ids are not guaranteed
+        to follow the order of `rows`; asking for that makes SQLite fall back
+        to one INSERT per row. Rows are not added to the session, so callers
+        still commit.
+        """
+        return db.session.scalars(
+            db.insert(cls)
+            .returning(cls.id)
+            .execution_options(insertmanyvalues_page_size=1000),
+            rows,
+        ).all()
+    
     def __repr__(self):
         return f"<EventPurchase {self.id}: User {self.user_id} bought {self.quantity}x {self.option.option_name}>"
 
@@ -480,6 +732,14 @@ class DraftBill(db.Model):
     # 'constituents' = rep's constituents can see
     # 'public' = everyone can see
     visibility = db.Column(db.String(20), nullable=False, default='hidden')
+    __table_args__ = (
+        # visible_to() filters on visibility, alone or with the rep
+        db.Index('ix_draft_bills_visibility_rep', 'visibility', 'representative_id'),
+        # Anonymous browsing lists only public drafts, newest first
+        db.Index('ix_draft_bills_public_updated', 'updated_at',
+                 postgresql_where=db.text("visibility = 'public'"),
+                 sqlite_where=db.text("visibility = 'public'")),
+    )
     
     # Optional metadata from AI generation
     topic = db.Column(db.String(100), nullable=True)
@@ -489,10 +749,15 @@ class DraftBill(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
     
-    representative = db.relationship('Representative', backref=db.backref('draft_bills', lazy='dynamic', cascade='all, delete-orphan'))
+    # Every view of a draft shows (or checks) its representative
+    representative = db.relationship('Representative', lazy='joined', innerjoin=True,
+                                     backref=db.backref('draft_bills', lazy='dynamic', cascade='all, delete-orphan'))
     
     def can_view(self, user):
-        """Check if a user can view this draft bill."""
+        """Check if a user can view this draft bill.
+
+        Same rules as visible_to(), for a draft that is already loaded.
+        """
         if not user:
             return self.visibility == 'public'
         
@@ -515,6 +780,22 @@ class DraftBill(db.Model):
         
         return False
     
+    @classmethod
+    def visible_to(cls, user):
+        """SQL condition for the drafts `user` can view (see can_view)."""
+        conditions = [cls.visibility == 'public']
+        if user:
+            if user.representative_id is not None:
+                conditions.append(cls.representative_id == user.representative_id)
+            if user.role == 'staffer' and user.rep_boss_id is not None:
+                conditions.append(cls.representative_id == user.rep_boss_id)
+            if user.representative_district:
+                conditions.append(db.and_(
+                    cls.visibility == 'constituents',
+                    cls.representative.has(Representative.district == user.representative_district),
+                ))
+        return db.or_(*conditions)
+    
     def to_dict(self):
         """Convert to dictionary for API/template rendering."""
         return {
@@ -531,9 +812,29 @@ class DraftBill(db.Model):
             },
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'comment_count': self.comments.count() if hasattr(self, 'comments') else 0,
+            'comment_count': self.comment_count,
         }
     
+    @classmethod
+    def bulk_to_dicts(cls, draft_bills):
+        """to_dict() for a list of drafts, fetching their comment counts together.
+
+        Counts not already loaded (drafts queried without undefer) come from
+        one GROUP BY query instead of a COUNT per draft. Representatives are
+        always joined in with the drafts.
+        """
+        missing = [d.id for d in draft_bills if 'comment_count' not in d.__dict__]
+        if missing:
+            counts = dict(db.session.execute(
+                db.select(DraftBillComment.draft_bill_id, db.func.count())
+                .where(DraftBillComment.draft_bill_id.in_(missing))
+                .group_by(DraftBillComment.draft_bill_id)
+            ).all())
+            for draft in draft_bills:
+                if draft.id in missing:
+                    set_committed_value(draft, 'comment_count', counts.get(draft.id, 0))
+        return [draft.to_dict() for draft in draft_bills]
+    
     def __repr__(self):
         return f"<DraftBill {self.id}: {self.title} ({self.visibility})>"
 
@@ -549,8 +850,21 @@ class DraftBillComment(db.Model):
     created_at = db.Column(db.DateTime, server_default=db.func.now())
     updated_at = db.Column(db.DateTime, server_default=db.func.now(), onupdate=db.func.now())
     
-    draft_bill = db.relationship('DraftBill', backref=db.backref('comments', lazy='dynamic', cascade='all, delete-orphan', order_by='DraftBillComment.created_at'))
+    # A draft has tens of comments at most, so a plain list that can be
+    # selectinload()ed; lists of drafts use DraftBill.comment_count instead
+    draft_bill = db.relationship('DraftBill', backref=db.backref('comments', cascade='all, delete-orphan', order_by='DraftBillComment.created_at'))
     user = db.relationship('User', backref=db.backref('draft_comments', lazy='dynamic'))
     
     def __repr__(self):
-        return f"<DraftBillComment {self.id} on DraftBill {self.draft_bill_id}>"
\ No newline at end of file
+        return f"<DraftBillComment {self.id} on DraftBill {self.draft_bill_id}>"
+
+
+# Number of comments on a draft. Deferred; list queries undefer it so the
+# counts come back with the drafts instead of one COUNT per draft rendered
+DraftBill.comment_count = column_property(
+    db.select(db.func.count(DraftBillComment.id))
+    .where(DraftBillComment.draft_bill_id == DraftBill.id)
+    .correlate_except(DraftBillComment)
+    .scalar_subquery(),
+    deferred=True,
+)
\ No newline at end of file
@@ -2,7 +2,6 @@
 Document verification model for address verification through uploaded documents.
 """
 from extensions import db
-from datetime import datetime
 
 
 class DocumentVerification(db.Model):
@@ -10,7 +9,7 @@ class DocumentVerification(db.Model):
     __tablename__ = 'document_verifications'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     
     # Document details
     file_path = db.Column(db.String(500), nullable=False)  # Path to uploaded file
@@ -19,49 +18,58 @@ class DocumentVerification(db.Model):
     
     # Verification status
     verification_status = db.Column(db.String(50), nullable=False, default='pending')  # 'pending', 'approved', 'rejected'
+    __table_args__ = (
+        # A user's documents, optionally by status; also serves user_id alone
+        db.Index('ix_document_verifications_user_status', 'user_id', 'verification_status'),
+    )
     rejection_reason = db.Column(db.Text, nullable=True)  # Reason if rejected
     
     # Timestamps
-    uploaded_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # Set by the database in the INSERT/UPDATE rather than built in Python
+    uploaded_at = db.Column(db.DateTime, nullable=False, default=db.func.now())
     verified_at = db.Column(db.DateTime, nullable=True)
     
     # Admin who verified
     verified_by_admin_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     
-    # Relationships
-    user = db.relationship('User', backref=db.backref('verification_documents', lazy='dynamic'), foreign_keys=[user_id])
-    verified_by = db.relationship('User', foreign_keys=[verified_by_admin_id])
+    # Relationships; both are shown wherever a document is, so load them with it
+    user = db.relationship('User', lazy='joined', innerjoin=True,
+                           backref=db.backref('verification_documents', lazy='dynamic'), foreign_keys=[user_id])
+    verified_by = db.relationship('User', lazy='joined', foreign_keys=[verified_by_admin_id])
     
     def approve(self, admin_id):
         """Approve the document and update user's address_verified status."""
         self.verification_status = 'approved'
-        self.verified_at = datetime.utcnow()
+        self.verified_at = db.func.now()
         self.verified_by_admin_id = admin_id
         
-        # Update user's address verification status
-        if self.user:
-            self.user.address_verified = True
+        # Update user's address verification status (once; a second
+        # approved document leaves the user row alone)
+        user = self.user
+        if user and not user.address_verified:
+            user.address_verified = True
     
     def reject(self, admin_id, reason):
         """Reject the document with a reason."""
         self.verification_status = 'rejected'
-        self.verified_at = datetime.utcnow()
+        self.verified_at = db.func.now()
         self.verified_by_admin_id = admin_id
         self.rejection_reason = reason
     
     def to_dict(self):
         """Convert to dictionary for API/template rendering."""
+        user, verified_by = self.user, self.verified_by
         return {
             'id': self.id,
             'user_id': self.user_id,
-            'username': self.user.username if self.user else None,
+            'username': user.username if user else None,
             'original_filename': self.original_filename,
             'document_type': self.document_type,
             'verification_status': self.verification_status,
             'rejection_reason': self.rejection_reason,
             'uploaded_at': self.uploaded_at.isoformat() if self.uploaded_at else None,
             'verified_at': self.verified_at.isoformat() if self.verified_at else None,
-            'verified_by': self.verified_by.username if self.verified_by else None,
+            'verified_by': verified_by.username if verified_by else None,
         }
     
     def __repr__(self):
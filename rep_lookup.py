@@ -1,7 +1,27 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 
+from services.web_utils import HTML_PARSER
+
+# Connection pool shared by every lookup so repeated and concurrent lookups
+# reuse open TLS connections. Each lookup still gets its own Session (and
+# so its own ASP.NET cookies); only the adapter is shared.
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+
+
+def _new_session():
+    session = requests.Session()
+    session.mount('https://', _adapter)
+    session.mount('http://', _adapter)
+    return session
+
+
 class RepresentativeLookup:
     LOOKUP_URL = "https://www.senate.mo.gov/legislookup/default"
     
@@ -11,11 +31,13 @@ class RepresentativeLookup:
         Look up representatives for a given address using the MO Senate website.
         Returns a dictionary with senator and representative information.
         """
+        from bs4 import BeautifulSoup
+
         try:
             # Initial page load to get session tokens/cookies
-            session = requests.Session()
+            session = _new_session()
             response = session.get(RepresentativeLookup.LOOKUP_URL)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Find the form and extract any hidden fields
             form = soup.find('form')
@@ -42,7 +64,7 @@ class RepresentativeLookup:
                 
             # Submit the form
             response = session.post(RepresentativeLookup.LOOKUP_URL, data=data)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Extract representative information
             results = {
@@ -4,7 +4,8 @@ Representatives can use LLM to draft new bills based on successful/failed bill p
 """
 from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, session
 from functools import wraps
-from models import User, Bill, Representative
+from models import Bill, Representative
+from auth import get_current_user
 from services.bill_drafting import (
     create_llm_bill_draft,
     get_bill_drafting_statistics,
@@ -32,7 +33,7 @@ def rep_required(f):
             flash('Please login to access this page.', 'error')
             return redirect(url_for('auth.login'))
         
-        user = User.query.get(user_id)
+        user = get_current_user()
         if not user or user.role not in ['rep', 'admin']:
             flash('This feature is only available to representatives and administrators.', 'error')
             return redirect(url_for('index'))
@@ -50,7 +51,7 @@ def rep_or_staffer_required(f):
             flash('Please login to access this page.', 'error')
             return redirect(url_for('auth.login'))
         
-        user = User.query.get(user_id)
+        user = get_current_user()
         if not user or user.role not in ['rep', 'staffer', 'admin']:
             flash('This feature is only available to representatives, staff, and administrators.', 'error')
             return redirect(url_for('index'))
@@ -67,7 +68,7 @@ def draft_bill():
     Shows statistics and provides form to generate bill drafts.
     """
     from flask import session
-    user = User.query.get(session.get('user_id'))
+    user = get_current_user()
     
     # Get overall statistics
     stats = get_bill_drafting_statistics()
@@ -122,8 +123,7 @@ def generate_draft():
         )
         
         # Get all reps if admin
-        user_id = session.get('user_id')
-        user = User.query.get(user_id)
+        user = get_current_user()
         all_reps = None
         if user.role == 'admin':
             all_reps = Representative.query.order_by(Representative.district).all()
@@ -246,8 +246,7 @@ def workspace():
     Shows all their draft bills with visibility controls.
     Admins can view all drafts from all representatives.
     """
-    user_id = session.get('user_id')
-    user = User.query.get(user_id)
+    user = get_current_user()
     
     # Get representative ID (could be rep themselves, their staffer's boss, or admin viewing all)
     if user.role == 'rep':
@@ -299,8 +298,7 @@ def save_draft():
     """
     Save a new draft bill or update an existing one.
     """
-    user_id = session.get('user_id')
-    user = User.query.get(user_id)
+    user = get_current_user()
     
     # Determine which representative this draft is for
     if user.role == 'admin':
@@ -381,8 +379,7 @@ def update_visibility(draft_id):
     """
     Update visibility of a draft bill.
     """
-    user_id = session.get('user_id')
-    user = User.query.get(user_id)
+    user = get_current_user()
     
     draft = get_draft_by_id(draft_id)
     if not draft:
@@ -421,8 +418,7 @@ def view_draft(draft_id):
     View a draft bill with comments.
     Visibility controlled - only visible to those with permission.
     """
-    user_id = session.get('user_id')
-    user = User.query.get(user_id) if user_id else None
+    user = get_current_user()
     
     draft = get_draft_by_id(draft_id)
     if not draft:
@@ -465,7 +461,7 @@ def add_comment(draft_id):
         flash('Please login to comment.', 'error')
         return redirect(url_for('auth.login'))
     
-    user = User.query.get(user_id)
+    user = get_current_user()
     draft = get_draft_by_id(draft_id)
     
     if not draft:
@@ -506,8 +502,7 @@ def delete_draft(draft_id):
     Delete a draft bill.
     Only the rep who created it (or admin) can delete.
     """
-    user_id = session.get('user_id')
-    user = User.query.get(user_id)
+    user = get_current_user()
     
     draft = get_draft_by_id(draft_id)
     if not draft:
@@ -536,8 +531,7 @@ def browse_rep_drafts(rep_id):
     """
     from models import Representative
     
-    user_id = session.get('user_id')
-    user = User.query.get(user_id) if user_id else None
+    user = get_current_user()
     
     # Get the representative
     representative = Representative.query.get(rep_id)
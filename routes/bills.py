@@ -2,14 +2,13 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from services.bills import get_cached_bills, parse_bills_with_bs, get_bill_details
 from services.web_utils import fetch_remote_page
 from services.comments import get_comments_for_bill, add_comment, delete_comment, update_comment
-from models import User, Comment, Bill, CommentSupport, BillSupport, RunSupport
-from extensions import db
-from auth import login_required
+from models import Comment, Bill, CommentSupport, BillSupport, RunSupport
+from extensions import db, list_load_options
+from auth import login_required, get_current_user
 from utils.validators import validate_comment_content, sanitize_input
 from utils.data_fetcher import get_data_fetcher
 
 bills_bp = Blueprint('bills', __name__)
-from sqlalchemy import func
 
 @bills_bp.route('/bills')
 def bills_list():
@@ -29,7 +28,7 @@ def bills_list():
     # Try database first
     try:
         # Start with base query
-        query = Bill.query
+        query = Bill.query.options(*list_load_options())
         
         # Apply search filter if provided
         if search:
@@ -55,21 +54,7 @@ def bills_list():
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
         
         if pagination.items:
-            # Annotate counts for supports/opposes
-            numbers = [b.bill_number for b in pagination.items]
-            if numbers:
-                counts = db.session.query(BillSupport.bill_number, BillSupport.value, func.count('*')) \
-                    .filter(BillSupport.bill_number.in_(numbers)) \
-                    .group_by(BillSupport.bill_number, BillSupport.value).all()
-                counts_map = {}
-                for num, val, cnt in counts:
-                    counts_map.setdefault(num, {1: 0, -1: 0})
-                    counts_map[num][val] = cnt
-                for b in pagination.items:
-                    c = counts_map.get(b.bill_number, {1: 0, -1: 0})
-                    # attach for template consumption when using model objects
-                    b.support_count = c.get(1, 0)
-                    b.oppose_count = c.get(-1, 0)
+            # Support/oppose counts are stored on each bill row
             bills = [bill.to_dict() for bill in pagination.items]
     except Exception as e:
         # Database table doesn't exist or other error - fall back to cached data
@@ -123,18 +108,16 @@ def bills_list():
         try:
             numbers = [b.get('number') or b.get('id') for b in bills if b]
             if numbers:
-                counts = db.session.query(BillSupport.bill_number, BillSupport.value, func.count('*')) \
-                    .filter(BillSupport.bill_number.in_(numbers)) \
-                    .group_by(BillSupport.bill_number, BillSupport.value).all()
-                counts_map = {}
-                for num, val, cnt in counts:
-                    counts_map.setdefault(num, {1: 0, -1: 0})
-                    counts_map[num][val] = cnt
+                counts = db.session.query(Bill.bill_number, Bill.support_count, Bill.oppose_count) \
+                    .filter(Bill.bill_number.in_(numbers)).all()
+                counts_map = {num: (up, down) for num, up, down in counts}
+                # Bills with no Bill row have no stored counts; count their votes
+                unstored = [num for num in numbers if num not in counts_map]
+                if unstored:
+                    counts_map.update(BillSupport.counts_for(unstored))
                 for b in bills:
                     num = b.get('number') or b.get('id')
-                    c = counts_map.get(num, {1: 0, -1: 0})
-                    b['support_count'] = c.get(1, 0)
-                    b['oppose_count'] = c.get(-1, 0)
+                    b['support_count'], b['oppose_count'] = counts_map.get(num, (0, 0))
         except Exception:
             pass
     
@@ -191,9 +174,13 @@ def bill_detail(bill_id):
     oppose_count = 0
     user_vote = 0
     try:
-        # bill_id is the bill_number key
-        support_count = BillSupport.query.filter_by(bill_number=bill_id, value=1).count()
-        oppose_count = BillSupport.query.filter_by(bill_number=bill_id, value=-1).count()
+        # bill_id is the bill_number key. Votes on a bill with no Bill row
+        # have no stored counts, so count them directly
+        if bill:
+            support_count = bill.support_count
+            oppose_count = bill.oppose_count
+        else:
+            support_count, oppose_count = BillSupport.counts_for([bill_id]).get(bill_id, (0, 0))
         if session.get('user_id'):
             uv = BillSupport.query.filter_by(bill_number=bill_id, user_id=session['user_id']).first()
             user_vote = uv.value if uv else 0
@@ -202,19 +189,11 @@ def bill_detail(bill_id):
 
     comments = get_comments_for_bill(bill_id) if bill_dict else []
 
-    # Precompute comment support/not support counts and current user vote
-    comment_vote_map = {}
+    # Attach the current user's vote on each comment; support/oppose counts
+    # are stored on the comment rows
     if comments:
         try:
-            from models import CommentSupport
             comment_ids = [c.id for c in comments]
-            # Counts grouped
-            grouped = db.session.query(CommentSupport.comment_id, CommentSupport.value, func.count('*')) \
-                .filter(CommentSupport.comment_id.in_(comment_ids)) \
-                .group_by(CommentSupport.comment_id, CommentSupport.value).all()
-            for cid, val, cnt in grouped:
-                comment_vote_map.setdefault(cid, {1:0, -1:0})
-                comment_vote_map[cid][val] = cnt
             user_map = {}
             if session.get('user_id'):
                 user_votes = CommentSupport.query.filter_by(user_id=session['user_id']).filter(CommentSupport.comment_id.in_(comment_ids)).all()
@@ -222,9 +201,6 @@ def bill_detail(bill_id):
                     user_map[uv.comment_id] = uv.value
             # Attach lightweight attrs
             for c in comments:
-                counts = comment_vote_map.get(c.id, {1:0, -1:0})
-                c.support_count = counts.get(1,0)
-                c.oppose_count = counts.get(-1,0)
                 c.user_vote = user_map.get(c.id, 0)
         except Exception:
             pass
@@ -313,7 +289,7 @@ def add_bill_comment(bill_id):
 @login_required
 def delete_bill_comment(bill_id, comment_id):
     """Delete a comment. Regular users can delete their own; power users can delete any."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('You must be logged in to delete comments.')
         return redirect(url_for('bills.bill_detail', bill_id=bill_id))
@@ -337,7 +313,7 @@ def edit_bill_comment(bill_id, comment_id):
         flash(error)
         return redirect(url_for('bills.bill_detail', bill_id=bill_id))
 
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('You must be logged in to edit comments.')
         return redirect(url_for('bills.bill_detail', bill_id=bill_id))
@@ -1,7 +1,7 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session, jsonify
 from models import User, Event, Representative, EventTemplate, EventOption, EventPurchase, EventInvitation, EventRSVP, EventCart, EventCartItem
 from extensions import db
-from auth import login_required
+from auth import login_required, get_current_user
 from utils.validators import sanitize_input
 from datetime import datetime
 
@@ -12,7 +12,7 @@ def rep_required(f):
     from functools import wraps
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        user = User.query.get(session.get('user_id'))
+        user = get_current_user()
         if not user or user.role not in ['rep', 'rep_staffer', 'candidate', 'admin']:
             flash('You must be a representative, candidate, rep staffer, or administrator to access this page.')
             return redirect(url_for('index'))
@@ -24,7 +24,7 @@ def rep_required(f):
 @rep_required
 def manage_events():
     """View all events for the logged-in representative or all events for admins."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     
     if user.role == 'admin':
         # Admins can see all events
@@ -46,7 +46,7 @@ def manage_events():
 @rep_required
 def create_event():
     """Create a new event."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     
     # Non-admins must be linked to a representative profile
     if user.role != 'admin' and not user.representative_id:
@@ -135,7 +135,7 @@ def create_event():
 @rep_required
 def edit_event(event_id):
     """Edit an existing event."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     event = Event.query.get_or_404(event_id)
     
     # Ensure user owns this event (admins, reps, and rep_staffers for their rep's events)
@@ -199,7 +199,7 @@ def edit_event(event_id):
 @rep_required
 def delete_event(event_id):
     """Delete an event."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     event = Event.query.get_or_404(event_id)
     
     # Ensure user owns this event (admins, reps, and rep_staffers for their rep's events)
@@ -369,21 +369,20 @@ def purchase_event_options(event_id):
                 if quantity > 0:
                     option = EventOption.query.get(option_id)
                     if option and option.template_id == event.template_id and option.is_active:
-                        purchase = EventPurchase(
-                            event_id=event.id,
-                            user_id=user_id,
-                            option_id=option.id,
-                            quantity=quantity,
-                            price_paid=option.price * quantity
-                        )
-                        purchases.append(purchase)
+                        purchases.append({
+                            'event_id': event.id,
+                            'user_id': user_id,
+                            'option_id': option.id,
+                            'quantity': quantity,
+                            'price_paid': option.price * quantity,
+                        })
                         total_amount += option.price * quantity
             except:
                 continue
     
     if purchases:
         try:
-            db.session.add_all(purchases)
+            EventPurchase.bulk_create(purchases)
             db.session.commit()
             flash(f'Purchase successful! Total: ${total_amount:.2f}')
         except Exception as e:
@@ -401,7 +400,7 @@ def purchase_event_options(event_id):
 @rep_required
 def manage_invitations(event_id):
     """Invite constituents to an event."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     event = Event.query.get_or_404(event_id)
     
     # Ensure user owns this event (admins may manage any event)
@@ -672,22 +671,23 @@ def checkout_cart(event_id):
     purchases = []
     total_amount = 0
     
-    for item in cart.items.all():
-        purchase = EventPurchase(
-            event_id=event_id,
-            user_id=user_id,
-            option_id=item.option_id,
-            quantity=item.quantity,
-            price_paid=item.option.price * item.quantity
-        )
-        purchases.append(purchase)
-        total_amount += purchase.price_paid
+    items = cart.items.all()
+    for item in items:
+        price_paid = item.option.price * item.quantity
+        purchases.append({
+            'event_id': event_id,
+            'user_id': user_id,
+            'option_id': item.option_id,
+            'quantity': item.quantity,
+            'price_paid': price_paid,
+        })
+        total_amount += price_paid
     
     try:
         # Add purchases
-        db.session.add_all(purchases)
+        EventPurchase.bulk_create(purchases)
         # Clear cart
-        for item in cart.items.all():
+        for item in items:
             db.session.delete(item)
         db.session.delete(cart)
         db.session.commit()
@@ -704,7 +704,7 @@ def checkout_cart(event_id):
 @login_required
 def manage_staffers():
     """Manage rep staffers (reps and admins only)."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     
     # Only reps and admins can manage staffers
     if user.role not in ['rep', 'candidate', 'admin']:
@@ -775,7 +775,7 @@ def manage_staffers():
 @login_required
 def delete_staffer(staffer_id):
     """Delete a rep staffer."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     
     # Only reps, candidates, and admins can delete staffers
     if user.role not in ['rep', 'candidate', 'admin']:
@@ -1,7 +1,7 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from models import User, Message
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from models import Message
 from extensions import db
-from auth import login_required
+from auth import login_required, get_current_user
 from utils.validators import validate_comment_content, sanitize_input
 from datetime import datetime
 
@@ -11,7 +11,7 @@ messages_bp = Blueprint('messages', __name__)
 @login_required
 def inbox():
     """Display user's sent messages."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('Please log in to view messages.')
         return redirect(url_for('auth.login'))
@@ -25,7 +25,7 @@ def inbox():
 @login_required
 def compose():
     """Compose a message to user's representative or senator."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('Please log in to send messages.')
         return redirect(url_for('auth.login'))
@@ -96,7 +96,7 @@ def compose():
 @login_required
 def view_message(message_id):
     """View a specific message."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('Please log in to view messages.')
         return redirect(url_for('auth.login'))
@@ -115,7 +115,7 @@ def view_message(message_id):
 @login_required
 def delete_message(message_id):
     """Delete a message."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('Please log in.')
         return redirect(url_for('auth.login'))
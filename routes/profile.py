@@ -4,7 +4,7 @@ Profile routes for viewing and editing user profiles.
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 from extensions import db
 from models import User, RunSupport
-from auth import login_required
+from auth import login_required, get_current_user
 from utils.validators import sanitize_input
 
 profile_bp = Blueprint('profile', __name__, url_prefix='/profile')
@@ -13,7 +13,7 @@ profile_bp = Blueprint('profile', __name__, url_prefix='/profile')
 @login_required
 def view_profile():
     """View the current user's profile."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('User not found.')
         return redirect(url_for('auth.login'))
@@ -37,7 +37,7 @@ def view_profile():
 @login_required
 def edit_profile():
     """Edit the current user's profile."""
-    user = User.query.get(session['user_id'])
+    user = get_current_user()
     if not user:
         flash('User not found.')
         return redirect(url_for('auth.login'))
@@ -73,7 +73,7 @@ def toggle_run_support(candidate_user_id):
     - Target user must exist and have thinking_about_running True.
     - Toggle off if already supported.
     """
-    current_user = User.query.get(session['user_id'])
+    current_user = get_current_user()
     candidate = User.query.get(candidate_user_id)
 
     if not candidate or not candidate.thinking_about_running:
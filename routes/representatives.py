@@ -2,7 +2,9 @@ from flask import Blueprint, render_template, session, flash, redirect, url_for
 from services.representatives import get_all_reps, get_rep_by_name, get_member_sponsorships
 from services.web_utils import fetch_remote_page
 from models import Representative, User, RunSupport
+from auth import get_current_user
 from services.bills import get_bills_by_sponsor
+from services.bill_drafting import get_visible_drafts_for_user
 
 reps_bp = Blueprint('reps', __name__)
 
@@ -52,7 +54,7 @@ def rep_detail(district):
         sc = get_member_sponsorships(r.district)
         
         # Get all bills to enrich with titles
-        from models import Bill, Event, DraftBill
+        from models import Bill, Event
         from utils.data_fetcher import get_data_fetcher
         from datetime import datetime
         
@@ -65,17 +67,9 @@ def rep_detail(district):
         draft_bills = []
         try:
             # Get user if logged in
-            user_id = session.get('user_id')
-            current_user = User.query.get(user_id) if user_id else None
+            current_user = get_current_user()
             
-            # Get all drafts for this rep and filter by visibility
-            all_drafts = DraftBill.query.filter_by(representative_id=r.id).order_by(
-                DraftBill.updated_at.desc()
-            ).all()
-            
-            for draft in all_drafts:
-                if draft.can_view(current_user):
-                    draft_bills.append(draft)
+            draft_bills = get_visible_drafts_for_user(current_user, r.id)
         except Exception as e:
             # If there's any error, just don't show drafts
             print(f"Error loading draft bills: {e}")
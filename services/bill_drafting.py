@@ -9,8 +9,9 @@ The LLM learns from successful patterns and avoids failed approaches.
 """
 from typing import List, Dict, Optional, Tuple
 import json
+from sqlalchemy.orm import joinedload, undefer
 from models import Bill, DraftBill, DraftBillComment, Representative, User
-from extensions import db
+from extensions import db, list_load_options
 from services.bill_text_fetcher import prepare_for_llm
 
 
@@ -281,7 +282,13 @@ def analyze_bill_patterns(bills: List[Bill]) -> Dict[str, any]:
     import re
     
     # Basic stats
-    word_counts = [len(bill.full_text.split()) if bill.full_text else 0 for bill in bills]
+    # Prefer the count stored when the text was fetched over re-splitting
+    # every bill's full text
+    word_counts = [
+        bill.word_count if bill.word_count is not None
+        else len(bill.full_text.split()) if bill.full_text else 0
+        for bill in bills
+    ]
     avg_length = sum(word_counts) / len(word_counts) if word_counts else 0
     
     # Common sponsors
@@ -512,6 +519,11 @@ def update_draft_visibility(draft_id: int, visibility: str) -> Optional[DraftBil
     return update_draft_bill(draft_id, visibility=visibility)
 
 
+def _draft_list_options():
+    """Loader options for draft lists: representative and comment count up front."""
+    return list_load_options(joinedload(DraftBill.representative), undefer(DraftBill.comment_count))
+
+
 def get_rep_drafts(representative_id: int) -> List[DraftBill]:
     """
     Get all draft bills for a specific representative.
@@ -522,7 +534,9 @@ def get_rep_drafts(representative_id: int) -> List[DraftBill]:
     Returns:
         List of DraftBill objects ordered by most recent
     """
-    return DraftBill.query.filter_by(
+    return DraftBill.query.options(
+        *_draft_list_options()
+    ).filter_by(
         representative_id=representative_id
     ).order_by(
         DraftBill.updated_at.desc()
@@ -540,20 +554,12 @@ def get_visible_drafts_for_user(user: User, representative_id: Optional[int] = N
     Returns:
         List of visible DraftBill objects
     """
-    query = DraftBill.query
+    query = DraftBill.query.options(*_draft_list_options()).filter(DraftBill.visible_to(user))
     
     if representative_id:
         query = query.filter_by(representative_id=representative_id)
     
-    # Get all drafts and filter by visibility rules
-    all_drafts = query.order_by(DraftBill.updated_at.desc()).all()
-    
-    visible_drafts = []
-    for draft in all_drafts:
-        if draft.can_view(user):
-            visible_drafts.append(draft)
-    
-    return visible_drafts
+    return query.order_by(DraftBill.updated_at.desc()).all()
 
 
 def get_draft_by_id(draft_id: int) -> Optional[DraftBill]:
@@ -649,7 +655,7 @@ def get_draft_statistics(representative_id: int) -> Dict:
         'hidden_count': sum(1 for d in drafts if d.visibility == 'hidden'),
         'constituents_count': sum(1 for d in drafts if d.visibility == 'constituents'),
         'public_count': sum(1 for d in drafts if d.visibility == 'public'),
-        'total_comments': sum(d.comments.count() for d in drafts),
+        'total_comments': sum(d.comment_count for d in drafts),
         'recent_drafts': drafts[:5]  # 5 most recent
     }
     
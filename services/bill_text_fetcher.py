@@ -8,11 +8,12 @@ This module provides functionality to:
 """
 import re
 import io
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Tuple
 
+from .web_utils import HTML_PARSER
+
 # Try to import PDF parsing libraries
 try:
     import PyPDF2
@@ -26,6 +27,25 @@ try:
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
 
+# One keep-alive session for every fetch. house.mo.gov and
+# documents.house.mo.gov are hit once or twice per bill, so reusing pooled
+# connections skips a TLS handshake per request; the pool is sized for
+# fetch_bill_text.py's worker threads. No cookies are involved, so sharing
+# the session across threads is safe.
+_session = requests.Session()
+_session.headers['User-Agent'] = 'Mozilla/5.0'
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Precompiled patterns used on every bill's text
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_PAGE_NUMBER_RE = re.compile(r'Page \d+ of \d+')
+_WIDE_SPACES_RE = re.compile(r' {3,}')
+_ENACTING_RE = re.compile(r'(Be it enacted.*?follows:)', re.IGNORECASE | re.DOTALL)
+_EFFECTIVE_DATE_RE = re.compile(r'(effective\s+(?:date|upon).*?)(?:\n|$)', re.IGNORECASE)
+_NUMBERED_SECTIONS_RE = re.compile(r'\n(Section [A-Z0-9]+\..*?)(?=\nSection [A-Z0-9]+\.|\Z)', re.DOTALL | re.IGNORECASE)
+
 
 def fetch_bill_text_from_url(url: str, timeout: int = 30) -> Optional[str]:
     """
@@ -42,20 +62,19 @@ def fetch_bill_text_from_url(url: str, timeout: int = 30) -> Optional[str]:
         return None
     
     try:
-        request = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(request, timeout=timeout) as response:
-            content_type = response.headers.get('Content-Type', '').lower()
-            
-            if 'pdf' in content_type or url.lower().endswith('.pdf'):
-                # PDF content
-                pdf_data = response.read()
-                return extract_text_from_pdf(pdf_data)
-            else:
-                # HTML content
-                html = response.read().decode('utf-8', errors='ignore')
-                return extract_text_from_html(html)
+        response = _session.get(url, timeout=timeout)
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '').lower()
+        
+        if 'pdf' in content_type or url.lower().endswith('.pdf'):
+            # PDF content
+            return extract_text_from_pdf(response.content)
+        else:
+            # HTML content
+            html = response.content.decode('utf-8', errors='ignore')
+            return extract_text_from_html(html)
                 
-    except (URLError, HTTPError, Exception) as e:
+    except Exception as e:
         print(f"Error fetching bill text from {url}: {e}")
         return None
 
@@ -117,8 +136,10 @@ def extract_text_from_html(html: str) -> Optional[str]:
     Returns:
         Extracted text or None if failed
     """
+    from bs4 import BeautifulSoup
+    
     try:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         
         # Remove script and style elements
         for script in soup(["script", "style"]):
@@ -163,20 +184,20 @@ def clean_bill_text(text: str) -> str:
         return ""
     
     # Remove excessive whitespace
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     
     # Remove trailing/leading whitespace from lines
     lines = [line.strip() for line in text.split('\n')]
     text = '\n'.join(lines)
     
     # Remove page numbers (common pattern: "Page 1 of 10")
-    text = re.sub(r'Page \d+ of \d+', '', text)
+    text = _PAGE_NUMBER_RE.sub('', text)
     
     # Remove excessive spaces
-    text = re.sub(r' {3,}', '  ', text)
+    text = _WIDE_SPACES_RE.sub('  ', text)
     
     # Remove common PDF artifacts
-    text = re.sub(r'\x0c', '', text)  # Form feed
+    text = text.replace('\x0c', '')  # Form feed
     
     return text.strip()
 
@@ -194,16 +215,18 @@ def get_bill_pdfs(bill_number: str, year: str = '2025', code: str = 'R') -> Dict
         Dict with 'text_pdf_url' and 'summary_pdf_url' keys
     """
     from urllib.parse import urlencode
+    from bs4 import BeautifulSoup, SoupStrainer
     
     params = urlencode({'bill': bill_number, 'year': year, 'code': code})
     content_url = f"https://house.mo.gov/BillContent.aspx?{params}&style=new"
     
     try:
-        request = Request(content_url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urlopen(request, timeout=15) as response:
-            html = response.read().decode('utf-8')
+        response = _session.get(content_url, timeout=15)
+        response.raise_for_status()
+        html = response.content.decode('utf-8')
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Only the links are needed
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer('a', href=True))
         
         text_pdf_url = None
         summary_pdf_url = None
@@ -283,26 +306,17 @@ def extract_key_sections(full_text: str) -> Dict[str, str]:
     sections = {}
     
     # Extract enacting clause (common in MO bills)
-    enacting_match = re.search(
-        r'(Be it enacted.*?follows:)',
-        full_text,
-        re.IGNORECASE | re.DOTALL
-    )
+    enacting_match = _ENACTING_RE.search(full_text)
     if enacting_match:
         sections['enacting_clause'] = enacting_match.group(1).strip()
     
     # Extract effective date
-    effective_match = re.search(
-        r'(effective\s+(?:date|upon).*?)(?:\n|$)',
-        full_text,
-        re.IGNORECASE
-    )
+    effective_match = _EFFECTIVE_DATE_RE.search(full_text)
     if effective_match:
         sections['effective_date'] = effective_match.group(1).strip()
     
     # Extract section numbers (e.g., "Section 1.", "Section A.")
-    section_pattern = re.compile(r'\n(Section [A-Z0-9]+\..*?)(?=\nSection [A-Z0-9]+\.|\Z)', re.DOTALL | re.IGNORECASE)
-    bill_sections = section_pattern.findall(full_text)
+    bill_sections = _NUMBERED_SECTIONS_RE.findall(full_text)
     if bill_sections:
         sections['numbered_sections'] = bill_sections
     
@@ -1,11 +1,30 @@
 import time
-from bs4 import BeautifulSoup
-from .web_utils import fetch_remote_page
+from collections import defaultdict
+from .web_utils import HTML_PARSER, fetch_remote_page
+from utils.cache import shared_get, shared_set
 import os
 from urllib.parse import urlencode
 
+# Optional C-backed HTML parser for the bill list; much faster than walking
+# a BeautifulSoup tree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    SELECTOLAX_AVAILABLE = False
+
+# Otherwise read cells straight off an lxml tree with precompiled XPath
+# rather than going through BeautifulSoup
+try:
+    from lxml import etree, html as lxml_html
+    _CELLS = etree.XPath('.//td')
+    _TEXT_NODES = etree.XPath('.//text()')
+    LXML_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    LXML_AVAILABLE = False
+
 # Cache configuration
-_bills_cache = {'ts': 0, 'data': None}
+_bills_cache = {'ts': 0, 'data': None, 'by_id': {}, 'by_sponsor': {}}
 _BILLS_TTL = int(os.environ.get('BILLS_CACHE_TTL', 300))
 
 # Per-bill details cache (longer TTL, details change less often)
@@ -14,75 +33,107 @@ _BILL_DETAILS_TTL = int(os.environ.get('BILL_DETAILS_CACHE_TTL', 3600))
 
 
 def get_cached_bills():
-    """Get bills from cache if not expired, otherwise fetch fresh data."""
+    """Get bills from cache if not expired, otherwise fetch fresh data.
+
+    The parsed list is also kept in the shared cache, so only one worker
+    per TTL pays for fetching and parsing the bill list.
+    """
     if _bills_cache['data'] is None or time.time() - _bills_cache['ts'] > _BILLS_TTL:
+        bills = shared_get('bills:list')
+        if bills is not None:
+            return _store_bills(bills)
+
         # Try to fetch fresh data
         html = fetch_remote_page('https://house.mo.gov/BillList.aspx')
         if html:
-            return parse_bills_with_bs(html)
+            bills = parse_bills_with_bs(html)
+            shared_set('bills:list', bills, timeout=_BILLS_TTL)
+            return bills
         return None
     return _bills_cache['data']
 
 
-def parse_bills_with_bs(html_text):
-    """Parse bills from HTML text using BeautifulSoup."""
+def _store_bills(bills):
+    """Make `bills` the cached bill list and rebuild its lookup indexes."""
+    by_id = {}
+    by_sponsor = defaultdict(list)
+    for bill in bills:
+        by_id.setdefault(bill['id'], bill)
+        by_sponsor[bill['sponsor'].casefold()].append(bill)
+
     _bills_cache['ts'] = time.time()
-    _bills_cache['data'] = []
+    _bills_cache['data'] = bills
+    _bills_cache['by_id'] = by_id
+    _bills_cache['by_sponsor'] = dict(by_sponsor)
+    return bills
 
-    if not html_text:
-        return []
 
-    soup = BeautifulSoup(html_text, 'html.parser')
+def _row_cells(html_text):
+    """Return the stripped text of the <td> cells in every <tr> of a page."""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html_text)
+        return [[td.text(strip=True) for td in tr.css('td')] for tr in tree.css('tr')]
 
-    # Find all table rows - each bill has a 2-row pattern
-    rows = soup.find_all('tr')
+    if LXML_AVAILABLE:
+        doc = lxml_html.fromstring(html_text)
+        return [
+            [''.join(t.strip() for t in _TEXT_NODES(td)) for td in _CELLS(tr)]
+            for tr in doc.iter('tr')
+        ]
+
+    from bs4 import BeautifulSoup, SoupStrainer
+    # Only build the table rows, not the rest of the page
+    soup = BeautifulSoup(html_text, HTML_PARSER, parse_only=SoupStrainer('tr'))
+    return [[td.get_text(strip=True) for td in tr.find_all('td')] for tr in soup.find_all('tr')]
+
+
+def parse_bills_with_bs(html_text):
+    """Parse bills from the BillList page HTML."""
+    bills = []
+    if not html_text:
+        return _store_bills(bills)
+
+    # Each bill has a 2-row pattern
+    rows = _row_cells(html_text)
 
     for i in range(0, len(rows) - 1, 2):  # Process pairs of rows
-        try:
-            row1 = rows[i]
-            row2 = rows[i + 1]
-
-            cols1 = row1.find_all('td')
-            cols2 = row2.find_all('td')
-
-            if len(cols1) >= 2 and len(cols2) >= 1:
-                # First row has bill number and sponsor
-                bill_number = cols1[0].get_text(strip=True)
-                sponsor = cols1[1].get_text(strip=True) if len(cols1) > 1 else 'Unknown'
-
-                # Second row has description
-                description = cols2[0].get_text(strip=True) if cols2 else ''
-
-                # Skip if empty or header rows
-                if bill_number and bill_number.startswith('HB'):
-                    _bills_cache['data'].append({
-                        'id': bill_number,
-                        'number': bill_number,
-                        'sponsor': sponsor,
-                        'title': description[:200] if len(description) > 200 else description,
-                        'description': description,
-                        'status': 'Active',
-                        'last_action': 'Filed'
-                    })
-        except Exception:
-            continue  # Skip malformed rows
+        cols1 = rows[i]
+        cols2 = rows[i + 1]
 
-    return _bills_cache['data']
+        if len(cols1) >= 2 and len(cols2) >= 1:
+            # First row has bill number and sponsor
+            bill_number = cols1[0]
+            sponsor = cols1[1]
+
+            # Second row has description
+            description = cols2[0]
+
+            # Skip if empty or header rows
+            if bill_number and bill_number.startswith('HB'):
+                bills.append({
+                    'id': bill_number,
+                    'number': bill_number,
+                    'sponsor': sponsor,
+                    'title': description[:200] if len(description) > 200 else description,
+                    'description': description,
+                    'status': 'Active',
+                    'last_action': 'Filed'
+                })
+
+    return _store_bills(bills)
 
 
 def get_bill_by_id(bill_id):
     """Get a specific bill by ID from the cache."""
-    bills = get_cached_bills()
-    if bills:
-        return next((b for b in bills if b['id'] == bill_id), None)
+    if get_cached_bills():
+        return _bills_cache['by_id'].get(bill_id)
     return None
 
 
 def get_bills_by_sponsor(sponsor_name):
     """Get all bills sponsored by a specific representative."""
-    bills = get_cached_bills()
-    if bills:
-        return [b for b in bills if b['sponsor'].lower() == sponsor_name.lower()]
+    if get_cached_bills():
+        return list(_bills_cache['by_sponsor'].get(sponsor_name.casefold(), ()))
     return []
 
 
@@ -104,7 +155,7 @@ def _build_bill_urls(bill_number: str, year: str = '2025', code: str = 'R'):
     }
 
 
-def _parse_text_and_summary_pdfs(soup: BeautifulSoup):
+def _parse_text_and_summary_pdfs(soup):
     """Extract links to the Bill Text and Bill Summary PDFs from the content page."""
     text_pdf_url = None
     summary_pdf_url = None
@@ -126,7 +177,8 @@ def _parse_hearing_status(hearings_html: str):
     """Parse hearing status text from the hearings page."""
     if not hearings_html:
         return None
-    hsoup = BeautifulSoup(hearings_html, 'html.parser')
+    from bs4 import BeautifulSoup
+    hsoup = BeautifulSoup(hearings_html, HTML_PARSER)
     text = hsoup.get_text(separator=' ', strip=True)
     # Return a concise message
     for phrase in [
@@ -147,7 +199,8 @@ def _parse_actions(actions_html: str):
     actions = []
     if not actions_html:
         return actions
-    soup = BeautifulSoup(actions_html, 'html.parser')
+    from bs4 import BeautifulSoup, SoupStrainer
+    soup = BeautifulSoup(actions_html, HTML_PARSER, parse_only=SoupStrainer('tr'))
     rows = soup.find_all('tr')
     for row in rows:
         cols = [c.get_text(strip=True) for c in row.find_all(['td', 'th'])]
@@ -196,7 +249,8 @@ def get_bill_details(bill_number: str, year: str = '2025', code: str = 'R'):
 
     # Parse content page for PDFs and possible headline/summary
     if content_html:
-        csoup = BeautifulSoup(content_html, 'html.parser')
+        from bs4 import BeautifulSoup
+        csoup = BeautifulSoup(content_html, HTML_PARSER)
         text_pdf_url, summary_pdf_url = _parse_text_and_summary_pdfs(csoup)
         if text_pdf_url:
             details['text_pdf_url'] = text_pdf_url
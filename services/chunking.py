@@ -0,0 +1,71 @@
+"""
+Split bill text into overlapping chunks for LLM processing.
+
+Chunks break on the coarsest boundary that fits (paragraph, line,
+sentence, clause, word), so a sentence is only cut in half when it is
+longer than the chunk itself. Consecutive chunks overlap so context
+that straddles a boundary appears in both.
+"""
+from collections import deque
+from typing import Iterator, List, Sequence
+
+# Sentences end at '. ' (with the space), so decimal points in statute
+# numbers and amounts ("143.121", "$1.5") are never split on
+_SEPARATORS = ('\n\n', '\n', '. ', '; ', ' ')
+
+
+def _split(text: str, size: int, separators: Sequence[str]) -> List[str]:
+    """Split text into pieces of at most `size` chars, keeping separators."""
+    if len(text) <= size:
+        return [text]
+    if not separators:
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    sep, finer = separators[0], separators[1:]
+    parts = text.split(sep)
+    pieces = []
+    for i, part in enumerate(parts):
+        if i < len(parts) - 1:
+            part += sep
+        if len(part) <= size:
+            if part:
+                pieces.append(part)
+        else:
+            pieces.extend(_split(part, size, finer))
+    return pieces
+
+
+def chunk_text(text: str, size: int = 1024, overlap: int = 256) -> Iterator[str]:
+    """
+    Yield chunks of `text` of at most `size` characters.
+
+    Args:
+        text: Text to split
+        size: Maximum characters per chunk
+        overlap: Approximate characters repeated from the end of one chunk
+            at the start of the next
+
+    Yields:
+        Chunks with surrounding whitespace stripped
+    """
+    if overlap >= size:
+        raise ValueError("overlap must be smaller than size")
+    if not text:
+        return
+
+    window = deque()
+    length = 0
+    for piece in _split(text, size, _SEPARATORS):
+        if window and length + len(piece) > size:
+            chunk = ''.join(window).strip()
+            if chunk:
+                yield chunk
+            # Keep the tail of this chunk as the start of the next one
+            while window and (length > overlap or length + len(piece) > size):
+                length -= len(window.popleft())
+        window.append(piece)
+        length += len(piece)
+
+    chunk = ''.join(window).strip()
+    if chunk:
+        yield chunk
@@ -1,4 +1,6 @@
-from extensions import db
+from sqlalchemy.orm import joinedload
+
+from extensions import db, list_load_options
 from models import Comment, User
 
 def add_comment(bill_id, user_id, content):
@@ -17,8 +19,8 @@ def add_comment(bill_id, user_id, content):
         raise e
 
 def get_comments_for_bill(bill_id):
-    """Get all visible comments for a bill."""
-    return Comment.query.filter_by(
+    """Get all visible comments for a bill, with their authors."""
+    return Comment.query.options(*list_load_options(joinedload(Comment.user))).filter_by(
         bill_id=bill_id,
         is_hidden=False
     ).order_by(Comment.created_at.desc()).all()
@@ -1,12 +1,12 @@
 import time
 import os
-from bs4 import BeautifulSoup
-from .web_utils import fetch_remote_page
+from .web_utils import HTML_PARSER, fetch_remote_page
 from urllib.parse import urlparse, parse_qs
 from .bills import get_bills_by_sponsor
+from utils.cache import shared_get, shared_set
 
 # Cache configuration
-_reps_cache = {'ts': 0, 'data': None}
+_reps_cache = {'ts': 0, 'data': None, 'by_name': {}}
 _REPS_TTL = int(os.environ.get('REPS_CACHE_TTL', 300))
 
 def get_cached_reps():
@@ -17,13 +17,13 @@ def get_cached_reps():
 
 def parse_reps_with_bs(html_text):
     """Parse representatives from HTML text using BeautifulSoup."""
-    _reps_cache['ts'] = time.time()
-    _reps_cache['data'] = []
-
+    reps = []
     if not html_text:
-        return []
+        return _store_reps(reps)
 
-    soup = BeautifulSoup(html_text, 'html.parser')
+    from bs4 import BeautifulSoup, SoupStrainer
+    # Only build the table rows, not the rest of the page
+    soup = BeautifulSoup(html_text, HTML_PARSER, parse_only=SoupStrainer('tr'))
     
     # Find all table rows with representative data
     rows = soup.find_all('tr')
@@ -42,7 +42,7 @@ def parse_reps_with_bs(html_text):
                 # Skip empty/vacant seats
                 if last_name and first_name and last_name != 'Vacant':
                     full_name = f"{first_name} {last_name}"
-                    _reps_cache['data'].append({
+                    reps.append({
                         'id': district,
                         'name': full_name,
                         'district': district,
@@ -52,39 +52,50 @@ def parse_reps_with_bs(html_text):
             except Exception:
                 continue  # Skip malformed rows
     
-    return _reps_cache['data']
+    return _store_reps(reps)
+
+
+def _store_reps(reps):
+    """Make `reps` the cached rep list and rebuild the name index."""
+    by_name = {}
+    for rep in reps:
+        by_name.setdefault(rep['name'].casefold(), rep)
+
+    _reps_cache['ts'] = time.time()
+    _reps_cache['data'] = reps
+    _reps_cache['by_name'] = by_name
+    return reps
 
 def get_rep_by_name(name):
     """Get a representative by their name and include their sponsored bills."""
-    reps = get_cached_reps()
-    if not reps:
+    if not get_cached_reps():
         return None
         
-    for rep in reps:
-        if rep['name'].lower() == name.lower():
-            rep_data = rep.copy()
-            rep_data['sponsored_bills'] = get_bills_by_sponsor(name)
-            return rep_data
-            
+    rep = _reps_cache['by_name'].get(name.casefold())
+    if rep:
+        return {**rep, 'sponsored_bills': get_bills_by_sponsor(name)}
     return None
 
 def get_all_reps():
     """Get all representatives with their sponsored bills."""
     reps = get_cached_reps()
     if not reps:
-        # Try to fetch fresh data
-        html = fetch_remote_page('https://house.mo.gov/MemberGridCluster.aspx')
-        if html:
-            reps = parse_reps_with_bs(html)
+        # Another worker may already have fetched and parsed the list
+        reps = shared_get('reps:list')
+        if reps is not None:
+            _store_reps(reps)
+        else:
+            # Try to fetch fresh data
+            html = fetch_remote_page('https://house.mo.gov/MemberGridCluster.aspx')
+            if html:
+                reps = parse_reps_with_bs(html)
+                shared_set('reps:list', reps, timeout=_REPS_TTL)
         
     if not reps:
         return []
         
-    # Add sponsored bills to each representative
-    for rep in reps:
-        rep['sponsored_bills'] = get_bills_by_sponsor(rep['name'])
-        
-    return reps
+    # Add sponsored bills to copies, leaving the cached reps untouched
+    return [{**rep, 'sponsored_bills': get_bills_by_sponsor(rep['name'])} for rep in reps]
 
 
 def _extract_bill_numbers_from_member_details(html_text):
@@ -94,7 +105,8 @@ def _extract_bill_numbers_from_member_details(html_text):
     """
     if not html_text:
         return []
-    soup = BeautifulSoup(html_text, 'html.parser')
+    from bs4 import BeautifulSoup, SoupStrainer
+    soup = BeautifulSoup(html_text, HTML_PARSER, parse_only=SoupStrainer('a', href=True))
     bills = []
     for a in soup.find_all('a', href=True):
         href = a['href']
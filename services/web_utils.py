@@ -1,17 +1,96 @@
-import urllib.request
+import os
+from email.message import Message
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.cache import TTLCache
+
+# BeautifulSoup backend: libxml2 via lxml when installed, else the much
+# slower pure-Python stdlib parser
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:  # pragma: no cover
+    HTML_PARSER = 'html.parser'
+
+# Pages are served from memory for this long before going back upstream
+_PAGE_TTL = int(os.environ.get('PAGE_CACHE_TTL', 300))
+
+# Keep-alive connections to house.mo.gov shared by every fetch; transient
+# gateway errors and dropped connections are retried on the same pool
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# url -> decoded page text while fresh
+_page_cache = TTLCache(maxsize=64, ttl=_PAGE_TTL)
+# url -> (etag, last_modified, text), kept past expiry so a stale page can be
+# revalidated with a conditional GET instead of downloaded again
+_validator_cache = TTLCache(maxsize=64, ttl=24 * 3600)
+
+
+def _decode(content, content_type):
+    """Decode a response body in one pass using the declared charset.
+
+    Only pages that don't declare a charset fall back to latin-1 when they
+    aren't valid utf-8.
+    """
+    header = Message()
+    header['Content-Type'] = content_type
+    charset = header.get_param('charset')
+    if charset:
+        try:
+            return content.decode(charset, errors='replace')
+        except LookupError:
+            pass
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
+        return content.decode('latin-1')
+
 
 def fetch_remote_page(url, timeout=10):
-    """Fetch a remote page using urllib and return decoded text.
-    Keeps dependency list small (no requests required).
+    """Fetch a remote page and return decoded text (None on failure).
+
+    Responses are cached per URL for PAGE_CACHE_TTL seconds. After that the
+    page is revalidated with If-None-Match/If-Modified-Since when the server
+    sent an ETag or Last-Modified, so an unchanged page costs a 304.
     """
+    text = _page_cache.get(url)
+    if text is not None:
+        return text
+
+    stale = _validator_cache.get(url)
+    headers = {}
+    if stale:
+        etag, last_modified, _ = stale
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
     try:
-        with urllib.request.urlopen(url, timeout=timeout) as resp:
-            content_bytes = resp.read()
-            # try to decode, fallback to latin-1
-            try:
-                return content_bytes.decode('utf-8')
-            except UnicodeDecodeError:
-                return content_bytes.decode('latin-1')
+        resp = _session.get(url, timeout=timeout, headers=headers)
+        if resp.status_code == 304 and stale:
+            text = stale[2]
+        else:
+            resp.raise_for_status()
+            text = _decode(resp.content, resp.headers.get('Content-Type', ''))
+
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+            if etag or last_modified:
+                _validator_cache.set(url, (etag, last_modified, text))
     except Exception as e:
         print(f"Error fetching page: {e}")
-        return None
\ No newline at end of file
+        return None
+
+    _page_cache.set(url, text)
+    return text
@@ -7,6 +7,7 @@ import sys
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 from bs4 import BeautifulSoup
+from services.web_utils import HTML_PARSER
 from extensions import db
 from models import Bill
 from main import app
@@ -23,7 +24,7 @@ def fetch_bills_from_mo_house():
         print(f"Error fetching bills: {e}")
         return []
     
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER)
     rows = soup.find_all('tr')
     
     bills = []
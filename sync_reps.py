@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Tuple
 from urllib.request import urlopen, Request
 from urllib.error import URLError, HTTPError
 from bs4 import BeautifulSoup
+from services.web_utils import HTML_PARSER
 from main import app
 from extensions import db
 from models import Representative
@@ -35,7 +36,7 @@ def parse_from_roster(html: str) -> List[Dict]:
     Returns a list of dicts with keys: district, first_name, last_name, party, city, phone, room.
     """
     reps: List[Dict] = []
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     # Generic approach: scan all rows, detect at least district/party columns.
     for tr in soup.find_all('tr'):
@@ -100,7 +101,7 @@ def parse_from_roster(html: str) -> List[Dict]:
 def parse_from_grid(html: str) -> List[Dict]:
     """Parse from MemberGridCluster.aspx known structure (8 columns)."""
     reps: List[Dict] = []
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, HTML_PARSER)
     for tr in soup.find_all('tr'):
         tds = tr.find_all('td')
         if len(tds) >= 8:
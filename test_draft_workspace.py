@@ -208,8 +208,8 @@ def test_draft_bills():
         )
         print(f"✓ Constituent commented on constituent-visible draft")
         
-        print(f"\nPublic draft now has {public_draft.comments.count()} comments")
-        print(f"Constituent draft now has {constituent_draft.comments.count()} comments")
+        print(f"\nPublic draft now has {len(public_draft.comments)} comments")
+        print(f"Constituent draft now has {len(constituent_draft.comments)} comments")
         
         print("\n" + "="*60)
         print("TESTING VISIBILITY UPDATE")
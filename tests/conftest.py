@@ -68,6 +68,33 @@ def db_session(app):
         db.session.rollback()
 
 
+@pytest.fixture
+def count_queries(app):
+    """Return a context manager that records the SQL statements run inside it.
+
+    Usage: ``with count_queries() as queries: ...`` then assert on
+    ``len(queries)`` to hold a view to its query budget.
+    """
+    from contextlib import contextmanager
+    from sqlalchemy import event
+    from extensions import db
+
+    @contextmanager
+    def counter():
+        queries = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            yield queries
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+
+    return counter
+
+
 @pytest.fixture
 def auth_client(client, db_session):
     """Create a client with an authenticated user."""
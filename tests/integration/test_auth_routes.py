@@ -68,6 +68,85 @@ class TestLogin:
         
         assert response.status_code in [200, 400]
 
+    def test_login_rate_limited_per_ip(self, app, client, monkeypatch):
+        """Test that repeated login attempts from one IP get HTTP 429."""
+        import auth
+
+        monkeypatch.setitem(app.config, 'RATELIMIT_ENABLED', True)
+        auth._login_limiter.reset()
+        try:
+            for _ in range(5):
+                response = client.post('/login', data={'username': 'nobody', 'password': 'x'})
+                assert response.status_code == 200
+
+            response = client.post('/login', data={'username': 'nobody', 'password': 'x'})
+            assert response.status_code == 429
+            assert int(response.headers['Retry-After']) > 0
+            # Viewing the form is never throttled
+            assert client.get('/login').status_code == 200
+        finally:
+            auth._login_limiter.reset()
+
+    def test_login_rate_limit_keyed_on_forwarded_client(self, app, client, monkeypatch):
+        """Test that clients behind the proxy are limited separately by X-Forwarded-For."""
+        import auth
+
+        monkeypatch.setitem(app.config, 'RATELIMIT_ENABLED', True)
+        auth._login_limiter.reset()
+        form = {'username': 'nobody', 'password': 'x'}
+        try:
+            for _ in range(5):
+                response = client.post('/login', data=form, headers={'X-Forwarded-For': '203.0.113.1'})
+                assert response.status_code == 200
+            response = client.post('/login', data=form, headers={'X-Forwarded-For': '203.0.113.1'})
+            assert response.status_code == 429
+
+            response = client.post('/login', data=form, headers={'X-Forwarded-For': '203.0.113.2'})
+            assert response.status_code == 200
+        finally:
+            auth._login_limiter.reset()
+
+    def test_login_rate_limit_counts_in_shared_cache(self, app, client, monkeypatch):
+        """Test that with Redis configured the counts live in the shared cache."""
+        import auth
+
+        class _CounterCache:
+            def __init__(self):
+                self.data = {}
+
+            def add(self, key, value, timeout=None):
+                self.data.setdefault(key, value)
+
+            def inc(self, key):
+                self.data[key] += 1
+                return self.data[key]
+
+        shared = _CounterCache()
+        monkeypatch.setattr('extensions.cache', shared)
+        monkeypatch.setitem(app.config, 'RATELIMIT_ENABLED', True)
+        monkeypatch.setitem(app.config, 'CACHE_REDIS_URL', 'redis://localhost:6379/0')
+        auth._login_limiter.reset()
+        form = {'username': 'nobody', 'password': 'x'}
+        for _ in range(5):
+            assert client.post('/login', data=form).status_code == 200
+        # Another worker sees the same counters even with an empty local limiter
+        auth._login_limiter.reset()
+        response = client.post('/login', data=form)
+
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) > 0
+        assert any(key.startswith('ratelimit:login:60:') for key in shared.data)
+
+
+    def test_index_greets_logged_in_user(self, client):
+        """Test that the home page greets the user from the session alone."""
+        with client.session_transaction() as sess:
+            sess.update(user_id=12345, username='sessionuser', role='power')
+        
+        response = client.get('/')
+        assert response.status_code == 200
+        assert b'Welcome Back, sessionuser' in response.data
+
 
 class TestSignup:
     """Test signup functionality."""
@@ -97,6 +176,48 @@ class TestSignup:
         assert user is not None
         assert user.username == 'newuser'
     
+    def test_signup_looks_up_representatives(self, client, db_session):
+        """Test that the post-signup representative lookup is stored."""
+        client.post('/signup', data={
+            'username': 'repsuser',
+            'password': 'SecurePass123!',
+            'verify_password': 'SecurePass123!',
+            'street_address': '201 W Capitol Ave',
+            'city': 'Jefferson City',
+            'state': 'MO',
+            'zipcode': '65101'
+        })
+
+        from models import User
+        db_session.expire_all()
+        user = User.query.filter_by(username='repsuser').first()
+        assert user is not None
+        assert user.reps_last_updated is not None
+        assert user.senator_name
+
+    def test_signup_leaves_address_unverified(self, client, db_session):
+        """Test that signup standardizes the address but leaves verification to document upload."""
+        from models import User
+
+        form = {
+            'password': 'SecurePass123!',
+            'verify_password': 'SecurePass123!',
+            'street_address': ' 201 W Capitol Ave ',
+            'city': 'Jefferson City',
+            'state': 'mo',
+            'zipcode': '65101',
+        }
+        client.post('/signup', data={**form, 'username': 'unverifieduser'})
+        client.post('/register', data={**form, 'username': 'registereduser'})
+
+        db_session.expire_all()
+        signed_up = User.query.filter_by(username='unverifieduser').first()
+        registered = User.query.filter_by(username='registereduser').first()
+        assert signed_up.address_verified is False
+        assert signed_up.street_address == '201 W Capitol Ave'
+        assert signed_up.state == 'MO'
+        assert registered.address_verified is True
+
     def test_signup_duplicate_username(self, client, db_session):
         """Test signup with duplicate username."""
         from models import User
@@ -120,6 +241,29 @@ class TestSignup:
         
         assert b'already exists' in response.data.lower() or b'taken' in response.data.lower()
     
+    def test_signup_duplicate_username_different_case(self, client, db_session):
+        """Test that the unique index rejects a username differing only in case."""
+        from models import User
+
+        user = User(username='dupeuser', street_address='123 Test St',
+                    city='Test City', state='MO', zipcode='65101')
+        user.set_password('Pass123!')
+        db_session.add(user)
+        db_session.commit()
+
+        response = client.post('/signup', data={
+            'username': 'DupeUser',
+            'password': 'SecurePass123!',
+            'verify_password': 'SecurePass123!',
+            'street_address': '201 W Capitol Ave',
+            'city': 'Jefferson City',
+            'state': 'MO',
+            'zipcode': '65101'
+        })
+
+        assert b'already exists' in response.data.lower()
+        assert User.query.filter_by(username='DupeUser').first() is None
+    
     def test_signup_password_mismatch(self, client):
         """Test signup with mismatched passwords."""
         response = client.post('/signup', data={
@@ -134,6 +278,25 @@ class TestSignup:
         
         assert b'match' in response.data.lower() or b'same' in response.data.lower()
     
+    def test_signup_reports_all_errors_without_redirect(self, client):
+        """Test that every invalid field is reported and the form is refilled."""
+        response = client.post('/signup', data={
+            'username': 'keptname',
+            'password': 'weak',
+            'verify_password': 'other',
+            'street_address': '123 Test St',
+            'city': 'Test City',
+            'state': 'MO',
+            'zipcode': '123'
+        })
+
+        assert response.status_code == 200
+        body = response.data.lower()
+        assert b'uppercase' in body or b'at least' in body
+        assert b'do not match' in body
+        assert b'zip code must be' in body
+        assert b'value="keptname"' in body
+    
     def test_signup_weak_password(self, client):
         """Test signup with weak password."""
         response = client.post('/signup', data={
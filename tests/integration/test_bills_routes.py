@@ -36,6 +36,102 @@ class TestBillsRoutes:
         # Should handle gracefully
         assert response.status_code in [200, 404]
 
+    def test_bills_list_query_count_is_flat(self, client, db_session, count_queries):
+        """Test that the bills list runs the same queries for 1 bill or 5."""
+        from models import Bill
+
+        def list_queries():
+            with count_queries() as queries:
+                response = client.get('/bills?search=ZZ%20')
+            assert response.status_code == 200
+            return len(queries)
+
+        numbers = [f'ZZ {i}' for i in range(5)]
+        try:
+            db_session.add(Bill(bill_number=numbers[0], title='Budget check'))
+            db_session.commit()
+            one_bill = list_queries()
+
+            db_session.add_all(Bill(bill_number=n, title='Budget check') for n in numbers[1:])
+            db_session.commit()
+            assert list_queries() == one_bill
+        finally:
+            Bill.query.filter(Bill.bill_number.in_(numbers)).delete(synchronize_session=False)
+            db_session.commit()
+
+    def test_bill_detail_query_count_is_flat(self, client, db_session, count_queries, monkeypatch):
+        """Test that the bill page runs the same queries for 1 comment or 3."""
+        from models import Bill, Comment, User
+
+        rendered = {}
+
+        def render_template(template, **context):
+            rendered.update(context)
+            return ''
+
+        monkeypatch.setattr('routes.bills.render_template', render_template)
+        monkeypatch.setattr('routes.bills.get_bill_details', lambda bill_id: {})
+
+        def detail_queries():
+            with count_queries() as queries:
+                response = client.get('/bill/YY%201')
+            assert response.status_code == 200
+            return len(queries)
+
+        authors = []
+        for i in range(3):
+            user = User(username=f'detail_author{i}', street_address='1 Main St', city='Columbia',
+                        state='MO', zipcode='65201', thinking_about_running=(i == 0))
+            user.set_password('Pass123!')
+            authors.append(user)
+        try:
+            db_session.add(Bill(bill_number='YY 1', title='Detail check'))
+            db_session.add_all(authors)
+            db_session.flush()
+            db_session.add(Comment(bill_id='YY 1', user_id=authors[0].id, content='First comment'))
+            db_session.commit()
+            one_comment = detail_queries()
+
+            db_session.add_all(Comment(bill_id='YY 1', user_id=user.id, content='Another comment')
+                               for user in authors[1:])
+            db_session.commit()
+
+            assert detail_queries() == one_comment
+            assert len(rendered['comments']) == 3
+        finally:
+            # Other tests expect the bills list to fall back to mock data
+            Comment.query.filter_by(bill_id='YY 1').delete(synchronize_session=False)
+            Bill.query.filter_by(bill_number='YY 1').delete(synchronize_session=False)
+            db_session.commit()
+
+    def test_bills_list_counts_votes_on_bills_not_in_db(self, client, db_session, monkeypatch):
+        """Test that votes on a scraped bill with no Bill row still show in the list."""
+        from models import User, BillSupport
+
+        class _Fetcher:
+            def fetch_bills(self):
+                return [{'number': 'QQ 1', 'title': 'Only scraped'}]
+
+        monkeypatch.setattr('routes.bills.get_data_fetcher', lambda: _Fetcher())
+        voters = []
+        for i, value in enumerate((1, 1, -1)):
+            user = User(username=f'scraped_voter{i}', street_address='1 Main St',
+                        city='Columbia', state='MO', zipcode='65201')
+            user.set_password('Pass123!')
+            db_session.add(user)
+            db_session.flush()
+            db_session.add(BillSupport(bill_number='QQ 1', user_id=user.id, value=value))
+            voters.append(user)
+        db_session.commit()
+        # Counts are only shown to logged-in users
+        with client.session_transaction() as sess:
+            sess.update(user_id=voters[0].id, username=voters[0].username, role='regular')
+
+        response = client.get('/bills?search=QQ%201')
+
+        assert response.status_code == 200
+        assert b'</i> 2 / <i class="bi bi-arrow-down"></i> 1' in response.data
+
 
 class TestBillComments:
     """Test bill commenting functionality."""
@@ -0,0 +1,281 @@
+"""
+Unit tests for address_verification.py
+"""
+
+import pytest
+import requests
+import address_verification
+from address_verification import verify_address, verify_addresses_bulk, format_address
+from utils.rate_limit import RateLimiter
+
+
+class _FakeValidation:
+    def __init__(self, result):
+        self.result = result
+
+
+class _FakeUSPS:
+    """Stand-in USPS client that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def validate_address(self, address):
+        self.calls += 1
+        return _FakeValidation({
+            'AddressValidateResponse': {
+                'Address': {
+                    'Address2': address['address_1'].upper(),
+                    'City': address['city'].upper(),
+                    'State': address['state'].upper(),
+                    'Zip5': address['zipcode'][:5],
+                    'Zip4': '1234',
+                }
+            }
+        })
+
+
+@pytest.fixture(autouse=True)
+def unlimited_usps(monkeypatch):
+    """Keep the module-level USPS quota from leaking between tests."""
+    monkeypatch.setattr(address_verification, '_usps_limiter', RateLimiter((1000, 1)))
+
+
+@pytest.fixture
+def fake_usps(monkeypatch):
+    client = _FakeUSPS()
+    monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+    verify_address.cache_clear()
+    yield client
+    verify_address.cache_clear()
+
+
+class TestVerifyAddressCache:
+    """Test memoization of USPS verification results."""
+
+    def test_repeat_lookup_hits_cache(self, fake_usps):
+        """Test that the same address only calls USPS once."""
+        first = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        second = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+
+        assert fake_usps.calls == 1
+        assert first == second
+        assert first[1]['zipcode'] == '65101-1234'
+
+    def test_normalized_variants_share_entry(self, fake_usps):
+        """Test that case/whitespace variants reuse the cached result."""
+        verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        verify_address('  201  w capitol AVE ', 'jefferson city', 'mo', '65101')
+
+        assert fake_usps.calls == 1
+
+    def test_cached_result_is_a_copy(self, fake_usps):
+        """Test that callers cannot mutate the cached dict."""
+        _, standardized = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        standardized['city'] = 'Elsewhere'
+
+        _, again = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        assert again['city'] == 'JEFFERSON CITY'
+
+    def test_cache_clear(self, fake_usps):
+        """Test that cache_clear forces a fresh USPS call."""
+        verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        verify_address.cache_clear()
+        verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+
+        assert fake_usps.calls == 2
+
+    def test_malformed_input_skips_usps(self, fake_usps):
+        """Test that a bad ZIP or state is rejected without a USPS call."""
+        assert verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '6510') == (False, None)
+        assert verify_address('201 W Capitol Ave', 'Jefferson City', 'Missouri', '65101') == (False, None)
+        assert fake_usps.calls == 0
+
+
+class TestVerifyAddressesBulk:
+    """Test concurrent bulk verification."""
+
+    def test_results_follow_input_order(self, fake_usps):
+        """Test that results are yielded in input order across chunks."""
+        rows = [
+            {'street_address': f'{n} Main St', 'city': 'Columbia', 'state': 'MO', 'zipcode': '65201'}
+            for n in range(1, 8)
+        ]
+
+        results = list(verify_addresses_bulk(rows, max_concurrency=3, chunk_size=3))
+
+        assert [row for row, _, _ in results] == rows
+        assert all(valid for _, valid, _ in results)
+        assert results[4][2]['street_address'] == '5 MAIN ST'
+        assert fake_usps.calls == 7
+
+
+    def test_waits_for_quota_instead_of_flagging_rows(self, fake_usps, monkeypatch):
+        """Test that rows beyond the quota wait for a slot rather than come back rate limited."""
+        class _SlowQuota:
+            """Each slot frees up 30 seconds after being asked for."""
+
+            def __init__(self):
+                self.asked = 0
+
+            def try_acquire(self):
+                self.asked += 1
+                return 0.0 if self.asked % 2 == 0 else 30.0
+
+        sleeps = []
+        monkeypatch.setattr(address_verification, '_usps_limiter', _SlowQuota())
+        monkeypatch.setattr(address_verification.time, 'sleep', sleeps.append)
+        rows = [
+            {'street_address': f'{n} Main St', 'city': 'Columbia', 'state': 'MO', 'zipcode': '65201'}
+            for n in range(1, 4)
+        ]
+
+        results = list(verify_addresses_bulk(rows, max_concurrency=1))
+
+        assert fake_usps.calls == 3
+        assert not any('_rate_limited' in standardized for _, _, standardized in results)
+        assert sleeps == [30.0, 30.0, 30.0]
+
+    def test_persistently_throttled_rows_are_flagged(self, monkeypatch):
+        """Test that a row USPS keeps throttling comes back marked `_rate_limited`."""
+        client = _FlakyUSPS([_http_error(429) for _ in range(10)])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+        monkeypatch.setattr(address_verification.time, 'sleep', lambda seconds: None)
+        verify_address.cache_clear()
+        row = {'street_address': '1 Main St', 'city': 'Columbia', 'state': 'MO', 'zipcode': '65201'}
+
+        [(_, valid, standardized)] = verify_addresses_bulk([row])
+
+        assert valid is True
+        assert standardized['_rate_limited'] is True
+        assert client.calls == address_verification._USPS_RETRY_ATTEMPTS
+
+
+class TestUSPSRateLimit:
+    """Test client-side pacing of USPS requests."""
+
+    def test_exhausted_quota_skips_usps(self, fake_usps, monkeypatch):
+        """Test that a drained quota falls back without calling USPS."""
+        monkeypatch.setattr(address_verification, '_usps_limiter', RateLimiter((1, 3600)))
+
+        verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+        valid, standardized = verify_address('1 Main St', 'Columbia', 'MO', '65201')
+
+        assert fake_usps.calls == 1
+        assert valid is True
+        assert standardized['_rate_limited'] is True
+        assert standardized['city'] == 'Columbia'
+
+    def test_limiter_enforces_every_rate(self):
+        """Test that the tightest configured rate wins."""
+        limiter = RateLimiter((2, 60), (3, 3600))
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() == 0.0
+        assert limiter.try_acquire() > 0
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+class _FlakyUSPS(_FakeUSPS):
+    """USPS client that fails with the given HTTP errors before succeeding."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+
+    def validate_address(self, address):
+        if self.errors:
+            self.calls += 1
+            raise self.errors.pop(0)
+        return super().validate_address(address)
+
+
+class TestUSPSRetry:
+    """Test backoff/retry around the USPS client."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        self.sleeps = []
+        monkeypatch.setattr(address_verification.time, 'sleep', self.sleeps.append)
+        verify_address.cache_clear()
+        yield
+        verify_address.cache_clear()
+
+    def test_retries_throttled_requests(self, monkeypatch):
+        """Test that 429s are retried and Retry-After is honoured."""
+        client = _FlakyUSPS([_http_error(429, {'Retry-After': '3'}), _http_error(503)])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+
+        valid, standardized = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+
+        assert valid is True
+        assert standardized['city'] == 'JEFFERSON CITY'
+        assert client.calls == 3
+        assert self.sleeps[0] == 3
+        assert len(self.sleeps) == 2
+
+    def test_retries_take_a_limiter_slot(self, monkeypatch):
+        """Test that a retry with the USPS quota spent falls back instead of calling USPS."""
+        client = _FlakyUSPS([_http_error(503)])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+        monkeypatch.setattr(address_verification, '_usps_limiter', RateLimiter((1, 3600)))
+
+        valid, standardized = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+
+        assert client.calls == 1
+        assert valid is True
+        assert standardized['_rate_limited'] is True
+
+    def test_long_retry_after_gives_up_at_once(self, monkeypatch):
+        """Test that a Retry-After beyond the request budget is not slept through."""
+        client = _FlakyUSPS([_http_error(429, {'Retry-After': '30'})])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+
+        valid, standardized = verify_address('201 W Capitol Ave', 'Jefferson City', 'MO', '65101')
+
+        assert client.calls == 1
+        assert self.sleeps == []
+        assert standardized['_rate_limited'] is True
+
+    def test_retries_are_bounded(self, monkeypatch):
+        """Test that persistent 5xx responses stop after a few attempts within the budget."""
+        client = _FlakyUSPS([_http_error(503) for _ in range(10)])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+
+        with pytest.raises(requests.HTTPError):
+            address_verification._call_usps(client, {'address_1': '1 Main St'})
+
+        assert client.calls == address_verification._USPS_RETRY_ATTEMPTS == 3
+        assert sum(self.sleeps) <= address_verification._USPS_RETRY_BUDGET
+
+    def test_client_errors_are_not_retried(self, monkeypatch):
+        """Test that 4xx address errors propagate without retrying."""
+        client = _FlakyUSPS([_http_error(400)])
+        monkeypatch.setattr(address_verification, '_get_usps_client', lambda: client)
+
+        with pytest.raises(requests.HTTPError):
+            address_verification._call_usps(client, {'address_1': '1 Main St'})
+        assert client.calls == 1
+        assert self.sleeps == []
+
+    def test_backoff_is_capped(self):
+        """Test that computed delays never exceed the configured maximum."""
+        delay = address_verification._retry_delay(20)
+        assert delay <= address_verification._USPS_RETRY_MAX_DELAY + 0.5
+
+
+class TestFormatAddress:
+    """Test address formatting."""
+
+    def test_without_unit(self):
+        """Test formatting without an apartment/unit."""
+        assert format_address('1 Main St', 'Columbia', 'MO', '65201') == '1 Main St, Columbia, MO 65201'
+
+    def test_with_unit(self):
+        """Test formatting with an apartment/unit."""
+        assert format_address('1 Main St', 'Columbia', 'MO', '65201', '4B') == '1 Main St, Unit 4B, Columbia, MO 65201'
@@ -0,0 +1,106 @@
+"""
+Unit tests for services/bills.py
+"""
+
+import pytest
+
+from services import bills as services_bills
+from services.bills import parse_bills_with_bs, get_bills_by_sponsor, get_cached_bills, get_bill_by_id
+
+
+BILL_LIST_HTML = """
+<table class="sortable">
+  <tr><th>Bill</th><th>Sponsor</th></tr>
+  <tr><th>Description</th></tr>
+  <tr><td><a href="/Bill.aspx?bill=HB1">HB1</a></td><td>Smith</td></tr>
+  <tr><td>Modifies provisions relating to income tax</td></tr>
+  <tr><td>HB2</td><td>Jones</td></tr>
+  <tr><td>Establishes the Show-Me Broadband Act</td></tr>
+</table>
+"""
+
+
+class TestParseBills:
+    """Test parsing of the BillList page."""
+
+    def test_parses_two_row_bill_pattern(self):
+        """Test that each pair of rows becomes one bill and headers are skipped."""
+        bills = parse_bills_with_bs(BILL_LIST_HTML)
+
+        assert [b['number'] for b in bills] == ['HB1', 'HB2']
+        assert bills[0]['sponsor'] == 'Smith'
+        assert bills[0]['description'] == 'Modifies provisions relating to income tax'
+
+    def test_beautifulsoup_fallback_matches(self, monkeypatch):
+        """Test that the BeautifulSoup fallback parses the same bills."""
+        expected = parse_bills_with_bs(BILL_LIST_HTML)
+        monkeypatch.setattr('services.bills.SELECTOLAX_AVAILABLE', False)
+        monkeypatch.setattr('services.bills.LXML_AVAILABLE', False)
+
+        assert parse_bills_with_bs(BILL_LIST_HTML) == expected
+
+    def test_sponsor_index_rebuilt(self, monkeypatch):
+        """Test that the sponsor lookup serves parsed bills."""
+        parse_bills_with_bs(BILL_LIST_HTML)
+        monkeypatch.setattr('services.bills._BILLS_TTL', 3600)
+
+        assert [b['number'] for b in get_bills_by_sponsor('JONES')] == ['HB2']
+
+    def test_sponsor_lookup_casefolds(self, monkeypatch):
+        """Test that sponsor matching is case-insensitive beyond ASCII."""
+        parse_bills_with_bs(BILL_LIST_HTML.replace('Jones', 'Strauß'))
+        monkeypatch.setattr('services.bills._BILLS_TTL', 3600)
+
+        assert [b['number'] for b in get_bills_by_sponsor('STRAUSS')] == ['HB2']
+
+
+class _DictCache:
+    """Stand-in Flask-Caching backend."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+
+class TestSharedBillsCache:
+    """Test that workers share the parsed bill list."""
+
+    def test_parsed_bills_published_and_reused(self, app, monkeypatch):
+        """Test that one worker's parse is served to another without fetching."""
+        shared = _DictCache()
+        monkeypatch.setattr('extensions.cache', shared)
+        monkeypatch.setattr('services.bills._bills_cache', {'ts': 0, 'data': None, 'by_id': {}, 'by_sponsor': {}})
+        fetches = []
+        monkeypatch.setattr('services.bills.fetch_remote_page', lambda url: fetches.append(url) or BILL_LIST_HTML)
+
+        with app.app_context():
+            assert len(get_cached_bills()) == 2
+            # Simulate a second worker with an empty in-process cache
+            services_bills._bills_cache['data'] = None
+            assert get_bill_by_id('HB2')['sponsor'] == 'Jones'
+
+        assert len(fetches) == 1
+        assert [b['number'] for b in shared.data['bills:list']] == ['HB1', 'HB2']
+
+    def test_parsed_bills_shared_through_flask_caching(self, app, monkeypatch):
+        """Test the same hand-off through a real Flask-Caching backend."""
+        flask_caching = pytest.importorskip('flask_caching')
+        shared = flask_caching.Cache(config={'CACHE_TYPE': 'SimpleCache'})
+        shared.init_app(app)
+        monkeypatch.setattr('extensions.cache', shared)
+        monkeypatch.setattr('services.bills._bills_cache', {'ts': 0, 'data': None, 'by_id': {}, 'by_sponsor': {}})
+        fetches = []
+        monkeypatch.setattr('services.bills.fetch_remote_page', lambda url: fetches.append(url) or BILL_LIST_HTML)
+
+        with app.app_context():
+            assert len(get_cached_bills()) == 2
+            services_bills._bills_cache['data'] = None
+            assert get_bill_by_id('HB1')['sponsor'] == 'Smith'
+            assert [b['number'] for b in shared.get('bills:list')] == ['HB1', 'HB2']
+
+        assert len(fetches) == 1
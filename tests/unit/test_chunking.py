@@ -0,0 +1,41 @@
+"""
+Unit tests for services/chunking.py
+"""
+
+import pytest
+from services.chunking import chunk_text
+
+
+SENTENCE = "Section 143.121 sets the rate at 1.5 percent. "
+
+
+class TestChunkText:
+    """Test sentence-aligned chunking of bill text."""
+
+    def test_short_text_is_one_chunk(self):
+        """Test that text under the size limit comes back unchanged."""
+        assert list(chunk_text(SENTENCE, size=100, overlap=10)) == [SENTENCE.strip()]
+
+    def test_chunks_end_on_sentence_boundaries(self):
+        """Test that chunks respect size and never split a sentence or decimal."""
+        chunks = list(chunk_text(SENTENCE * 20, size=200, overlap=50))
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk) <= 200
+            assert chunk.startswith('Section 143.121')
+            assert chunk.endswith('1.5 percent.')
+
+    def test_consecutive_chunks_overlap(self):
+        """Test that the end of one chunk is repeated at the start of the next."""
+        text = ''.join(f"Sentence number {i} ends here. " for i in range(40))
+        chunks = list(chunk_text(text, size=200, overlap=60))
+
+        for first, second in zip(chunks, chunks[1:]):
+            last_sentence = first.rsplit('. ', 1)[-1]
+            assert last_sentence in second
+
+    def test_overlap_must_be_smaller_than_size(self):
+        """Test that an overlap as large as the chunk is rejected."""
+        with pytest.raises(ValueError):
+            list(chunk_text(SENTENCE, size=50, overlap=50))
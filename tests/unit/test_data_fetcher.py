@@ -18,6 +18,14 @@ class TestDataFetcher:
         fetcher2 = get_data_fetcher()
         assert fetcher1 is fetcher2
     
+    def test_fetcher_per_explicit_mode(self):
+        """Test that an explicit mode overrides FLASK_ENV and is shared."""
+        os.environ['FLASK_ENV'] = 'development'
+        production = get_data_fetcher(mode='production')
+        assert production.is_production is True
+        assert get_data_fetcher(mode='production') is production
+        assert get_data_fetcher(mode='development').is_production is False
+    
     def test_development_mode_detection(self):
         """Test that development mode is detected correctly."""
         os.environ['FLASK_ENV'] = 'development'
@@ -135,3 +143,30 @@ class TestDataFetcher:
         
         # Should still have data
         assert len(new_data) > 0
+
+
+class TestFetchRepresentativesBatch:
+    """Test batched representative lookups."""
+    
+    def test_duplicate_addresses_fetch_once(self, mocker):
+        """Test that identical addresses share a single upstream call."""
+        fetcher = DataFetcher()
+        fetch = mocker.patch.object(fetcher, 'fetch_representatives', return_value={'senator': {}})
+        
+        results = fetcher.fetch_representatives_batch([
+            {'id': 1, 'street': '201 W Capitol Ave', 'city': 'Jefferson City', 'state': 'MO', 'zip': '65101'},
+            {'id': 2, 'street': '201  w capitol ave', 'city': 'JEFFERSON CITY', 'state': 'MO', 'zip': '65101-1234'},
+            {'id': 3, 'street': '1 Main St', 'city': 'Columbia', 'state': 'MO', 'zip': '65201'},
+        ])
+        
+        assert fetch.call_count == 2
+        assert set(results) == {1, 2, 3}
+    
+    def test_results_keyed_by_index_without_ids(self, mocker):
+        """Test that inputs without an id are keyed by position."""
+        fetcher = DataFetcher()
+        mocker.patch.object(fetcher, 'fetch_representatives', return_value={'senator': {}})
+        
+        results = fetcher.fetch_representatives_batch([{'street': '1 Main St', 'zip': '65201'}])
+        
+        assert list(results) == [0]
@@ -0,0 +1,21 @@
+"""
+Unit tests for extensions.py
+"""
+
+from sqlalchemy import create_engine, text
+
+import extensions  # noqa: F401  registers the SQLite connect listener
+
+
+class TestSqlitePragmas:
+    """Test the pragmas applied to new SQLite connections."""
+
+    def test_file_database_uses_wal(self, tmp_path):
+        """Test that file databases switch to WAL with synchronous=NORMAL."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'bills.db'}")
+        with engine.connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            # 1 == NORMAL
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert conn.execute(text('PRAGMA temp_store')).scalar() == 2
+        engine.dispose()
@@ -0,0 +1,43 @@
+"""
+Unit tests for utils/json_provider.py
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from utils.json_provider import ORJSON_AVAILABLE, ORJSONProvider
+
+pytestmark = pytest.mark.skipif(not ORJSON_AVAILABLE, reason='orjson not installed')
+
+PAYLOAD = {
+    'zeta': 1,
+    'alpha': ['Café', None, True, 1.5],
+    'when': datetime(2025, 11, 10, 8, 30),
+    'amount': Decimal('12.50'),
+}
+
+
+class TestORJSONProvider:
+    """Test that the orjson provider matches Flask's default output."""
+
+    def test_dumps_matches_default_provider(self, app):
+        """Test that compact output decodes to the same JSON as the stdlib provider."""
+        fast = ORJSONProvider(app).dumps(PAYLOAD, separators=(',', ':'))
+        slow = DefaultJSONProvider(app).dumps(PAYLOAD, separators=(',', ':'))
+
+        assert fast.startswith('{"alpha":')
+        assert DefaultJSONProvider(app).loads(fast) == DefaultJSONProvider(app).loads(slow)
+
+    def test_jsonify_uses_orjson_provider(self, app):
+        """Test that the app serializes responses with the orjson provider."""
+        assert isinstance(app.json, ORJSONProvider)
+        with app.test_request_context():
+            response = app.json.response(PAYLOAD)
+
+        assert response.get_json()['when'] == 'Mon, 10 Nov 2025 08:30:00 GMT'
+
+    def test_wide_integers_fall_back(self, app):
+        """Test that values orjson rejects still serialize."""
+        assert ORJSONProvider(app).dumps({'n': 2 ** 70}) == '{"n": 1180591620717411303424}'
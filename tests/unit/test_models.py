@@ -3,7 +3,8 @@ Unit tests for models
 """
 
 import pytest
-from models import User, Comment
+from models import (User, Comment, CommentSupport, Bill, BillSupport, DraftBill, DraftBillComment, Representative,
+                    DocumentVerification, Event, EventTemplate, EventOption, EventPurchase)
 from extensions import db
 
 
@@ -37,7 +38,20 @@ class TestUserModel:
         assert user.password_hash != 'SecurePass123!'
         assert user.check_password('SecurePass123!')
         assert not user.check_password('WrongPassword')
-    
+
+    def test_legacy_pbkdf2_hash_is_upgraded(self, app, db_session):
+        """Test that legacy pbkdf2 hashes verify and are rehashed with argon2."""
+        from werkzeug.security import generate_password_hash
+
+        user = User(username='legacyuser')
+        user.password_hash = generate_password_hash('SecurePass123!', method='pbkdf2:sha256')
+
+        assert not user.check_password('WrongPassword')
+        assert user.password_hash.startswith('pbkdf2:sha256')
+        assert user.check_password('SecurePass123!')
+        assert user.password_hash.startswith('$argon2id$')
+        assert user.check_password('SecurePass123!')
+
     def test_user_repr(self, app, db_session):
         """Test user representation."""
         user = User(username='testuser')
@@ -99,6 +113,55 @@ class TestUserModel:
         assert display['senator']['name'] == 'Sen. Test'
         assert display['representative']['district'] == '10'
     
+    def test_representatives_display_without_data(self, app):
+        """Test that users without rep info get the empty display and partial data shows N/A."""
+        display = User(username='no_reps').get_representatives_display()
+        assert display == {'has_data': False, 'senator': None, 'representative': None}
+        
+        display = User(username='senator_only', senator_name='Sen. Test').get_representatives_display()
+        assert display['has_data'] is True
+        assert display['senator']['display'] == 'Sen. Test (N/A-N/A)'
+        assert display['representative'] is None
+    
+    def test_representatives_display_rebuilt_after_update(self, app, db_session):
+        """Test that the cached display follows rep changes."""
+        user = User(username='display_cache', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201',
+                    representative_name='Old Rep', representative_district='44')
+        user.set_password('Pass123!')
+        db_session.add(user)
+        db_session.commit()
+
+        first = user.get_representatives_display()
+        assert user.get_representatives_display() is first
+
+        user.update_representatives({'representative': {'name': 'New Rep', 'district': '45', 'party': 'R'}})
+        assert user.get_representatives_display()['representative']['display'] == 'New Rep (R-45)'
+
+        db_session.commit()
+        db_session.execute(db.text("UPDATE users SET representative_name = 'Third Rep' WHERE id = :id"),
+                           {'id': user.id})
+        db_session.expire(user)
+        assert user.get_representatives_display()['representative']['name'] == 'Third Rep'
+
+    def test_cached_reps_expire(self, app, db_session):
+        """Test that cached representative lookups expire after max_age."""
+        from datetime import datetime, timedelta
+
+        user = User(username='cached_reps')
+        assert user.get_cached_reps() is None
+
+        rep_info = {'senator': {'name': 'Sen. Test'}, 'representative': {'name': 'Rep. Test'}}
+        user.set_cached_reps(rep_info)
+        assert user.get_cached_reps() == rep_info
+
+        user.reps_fetched_at = datetime.utcnow() - timedelta(hours=25)
+        assert user.get_cached_reps() is None
+
+        user.set_cached_reps(None)
+        assert user.reps_cache_json is None
+        assert user.reps_fetched_at is None
+    
     def test_unique_username(self, app, db_session):
         """Test that usernames must be unique."""
         user1 = User(
@@ -125,6 +188,113 @@ class TestUserModel:
         with pytest.raises(Exception):
             db_session.commit()
 
+    def test_username_unique_case_insensitive(self, app, db_session):
+        """Test that usernames differing only in case are rejected and found."""
+        user1 = User(
+            username='CaseUser',
+            street_address='123 Test St',
+            city='Test City',
+            state='MO',
+            zipcode='12345'
+        )
+        user1.set_password('Pass123!')
+        db_session.add(user1)
+        db_session.commit()
+
+        assert User.by_username('caseuser') == user1
+
+        user2 = User(
+            username='caseuser',
+            street_address='456 Other St',
+            city='Other City',
+            state='MO',
+            zipcode='54321'
+        )
+        user2.set_password('Pass456!')
+        db_session.add(user2)
+
+        with pytest.raises(Exception):
+            db_session.commit()
+        db_session.rollback()
+
+
+class TestBillModel:
+    """Test the Bill model."""
+    
+    def test_full_text_matches_falls_back_to_substring(self, app, db_session):
+        """Test that text search is a case-insensitive match off PostgreSQL."""
+        db_session.add_all([
+            Bill(bill_number='HB 901', full_text='Relating to EDUCATION funding.'),
+            Bill(bill_number='HB 902', full_text='Relating to sales tax.'),
+            Bill(bill_number='HB 903'),
+        ])
+        db_session.commit()
+        
+        matches = Bill.query.filter(Bill.full_text_matches('education', db.engine.dialect.name)).all()
+        assert [bill.bill_number for bill in matches] == ['HB 901']
+    
+    def test_key_sections_prefers_stored_copy(self, app, db_session):
+        """Test that stored sections are used instead of reparsing the text."""
+        text = 'Be it enacted by the General Assembly, as follows:\nSection 1. Text.'
+        bill = Bill(bill_number='HB 904', full_text=text)
+        assert 'enacting_clause' in bill.get_key_sections()
+        
+        bill.sections_json = '{"effective_date": "stored"}'
+        assert bill.get_key_sections() == {'effective_date': 'stored'}
+    
+    def test_llm_context_truncates_text_not_summary(self, app):
+        """Test that max_length cuts the bill text while keeping the summary."""
+        bill = Bill(bill_number='HB 905', title='Schools',
+                    full_text='\nSection 1. Effective date August 28.\n' + 'x' * 1000)
+        
+        context = bill.get_llm_context(max_length=300)
+        assert context.startswith('Bill: HB 905\nTitle: Schools')
+        assert 'Effective Date: Effective date August 28.' in context
+        assert 'Number of Sections: 1' in context
+        assert context.endswith('... [truncated]')
+        assert len(context) <= 300 + len('\n... [truncated]')
+    
+    def test_support_counts_follow_votes(self, app, db_session):
+        """Test that the stored support/oppose counts track bill votes."""
+        users = [User(username=f'voter{i}', street_address='123 Test St', city='Test City',
+                      state='MO', zipcode='12345', password_hash='x') for i in range(2)]
+        bill = Bill(bill_number='HB 906')
+        db_session.add_all(users + [bill])
+        db_session.commit()
+        
+        votes = [BillSupport(bill_number='HB 906', user_id=u.id, value=1) for u in users]
+        db_session.add_all(votes)
+        db_session.commit()
+        db_session.refresh(bill)
+        assert (bill.support_count, bill.oppose_count) == (2, 0)
+        
+        votes[0].value = -1
+        db_session.delete(votes[1])
+        db_session.commit()
+        db_session.refresh(bill)
+        assert (bill.support_count, bill.oppose_count) == (0, 1)
+
+    def test_counts_seeded_from_votes_cast_before_the_bill(self, app, db_session):
+        """Test that a bill added after it was voted on starts from those votes."""
+        users = [User(username=f'early_voter{i}', street_address='123 Test St', city='Test City',
+                      state='MO', zipcode='12345', password_hash='x') for i in range(3)]
+        db_session.add_all(users)
+        db_session.flush()
+        db_session.add_all(BillSupport(bill_number='HB 907', user_id=u.id, value=value)
+                           for u, value in zip(users, (1, 1, -1)))
+        db_session.commit()
+
+        bill = Bill(bill_number='HB 907')
+        db_session.add(bill)
+        db_session.commit()
+        db_session.refresh(bill)
+        assert (bill.support_count, bill.oppose_count) == (2, 1)
+
+        db_session.delete(BillSupport.query.filter_by(bill_number='HB 907', value=-1).one())
+        db_session.commit()
+        db_session.refresh(bill)
+        assert (bill.support_count, bill.oppose_count) == (2, 0)
+
 
 class TestCommentModel:
     """Test the Comment model."""
@@ -201,3 +371,233 @@ class TestCommentModel:
         db_session.add(comment)
         db_session.commit()
         assert 'HB 123' in repr(comment)
+
+    def test_vote_totals_use_counts(self, app, db_session):
+        """Test that up/down votes and score come from the stored counts."""
+        voters = []
+        for i in range(3):
+            voter = User(username=f'comment_voter{i}', street_address='1 Main St',
+                         city='Columbia', state='MO', zipcode='65201')
+            voter.set_password('Pass123!')
+            voters.append(voter)
+        db_session.add_all(voters)
+        comment = Comment(bill_id='HB 9', content='Vote on me')
+        db_session.add(comment)
+        db_session.flush()
+        db_session.add_all([
+            CommentSupport(comment_id=comment.id, user_id=voters[0].id, value=1),
+            CommentSupport(comment_id=comment.id, user_id=voters[1].id, value=1),
+            CommentSupport(comment_id=comment.id, user_id=voters[2].id, value=-1),
+        ])
+        db_session.commit()
+
+        assert (comment.up_votes, comment.down_votes, comment.score) == (2, 1, 1)
+        top = Comment.query.filter(Comment.score > 0).order_by(Comment.score.desc()).first()
+        assert top.id == comment.id
+
+
+    def test_deleting_comment_removes_votes(self, app, db_session):
+        """Test that a comment's votes are deleted with it."""
+        voter = User(username='cascade_voter', street_address='1 Main St',
+                     city='Columbia', state='MO', zipcode='65201')
+        voter.set_password('Pass123!')
+        comment = Comment(bill_id='HB 10', content='Going away')
+        db_session.add_all([voter, comment])
+        db_session.flush()
+        db_session.add(CommentSupport(comment_id=comment.id, user_id=voter.id, value=1))
+        db_session.commit()
+        comment_id = comment.id
+
+        db_session.delete(comment)
+        db_session.commit()
+
+        assert CommentSupport.query.filter_by(comment_id=comment_id).count() == 0
+
+
+class TestDocumentVerificationModel:
+    """Test the DocumentVerification model."""
+
+    def test_approve_stamps_database_time(self, app, db_session):
+        """Test that upload and approval times are filled in by the database."""
+        user = User(username='doc_owner', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201')
+        user.set_password('Pass123!')
+        db_session.add(user)
+        db_session.flush()
+        doc = DocumentVerification(user_id=user.id, file_path='uploads/a.pdf',
+                                   original_filename='a.pdf', document_type='utility_bill')
+        db_session.add(doc)
+        db_session.commit()
+
+        doc.approve(user.id)
+        db_session.commit()
+
+        assert doc.uploaded_at is not None
+        assert doc.verified_at >= doc.uploaded_at
+        assert user.address_verified is True
+
+    def test_second_approval_leaves_user_alone(self, app, db_session, count_queries):
+        """Test that approving another document for a verified user does not update the user."""
+        user = User(username='doc_verified', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201', address_verified=True)
+        user.set_password('Pass123!')
+        db_session.add(user)
+        db_session.flush()
+        doc = DocumentVerification(user_id=user.id, file_path='uploads/b.pdf',
+                                   original_filename='b.pdf', document_type='lease')
+        db_session.add(doc)
+        db_session.commit()
+        doc.user
+
+        doc.approve(user.id)
+        assert user not in db_session.dirty
+        with count_queries() as queries:
+            db_session.flush()
+
+        assert not any(q.startswith('UPDATE users') for q in queries)
+        assert any(q.startswith('UPDATE document_verifications') for q in queries)
+
+
+class TestEventPurchaseModel:
+    """Test the EventPurchase model."""
+
+    def test_bulk_create_inserts_in_one_statement(self, app, db_session, count_queries):
+        """Test that bulk_create inserts every row at once and returns their ids."""
+        from datetime import datetime
+
+        rep = Representative(district='110', first_name='Eve', last_name='Buyer')
+        template = EventTemplate(name='Bulk Rally')
+        user = User(username='bulk_buyer', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201')
+        user.set_password('Pass123!')
+        db_session.add_all([rep, template, user])
+        db_session.flush()
+        event = Event(representative_id=rep.id, template_id=template.id, title='Rally',
+                      event_date=datetime(2026, 1, 1))
+        options = [EventOption(template_id=template.id, option_name=f'Item {i}',
+                               option_type='merchandise', price=5.0) for i in range(3)]
+        db_session.add(event)
+        db_session.add_all(options)
+        db_session.commit()
+
+        rows = [{'event_id': event.id, 'user_id': user.id, 'option_id': option.id,
+                 'quantity': i + 1, 'price_paid': 5.0 * (i + 1)} for i, option in enumerate(options)]
+        with count_queries() as queries:
+            ids = EventPurchase.bulk_create(rows)
+        db_session.commit()
+
+        assert len(queries) == 1
+        purchases = [db_session.get(EventPurchase, purchase_id) for purchase_id in ids]
+        assert sorted(p.option_id for p in purchases) == [option.id for option in options]
+        assert all(p.purchased_at is not None for p in purchases)
+
+
+class TestDraftBillModel:
+    """Test the DraftBill model."""
+
+    def test_comment_count_loaded_with_list(self, app, db_session):
+        """Test that rep draft lists carry their comment counts."""
+        from services.bill_drafting import get_rep_drafts
+
+        rep = Representative(district='101', first_name='Jane', last_name='Doe')
+        user = User(username='draft_reader', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201')
+        user.set_password('Pass123!')
+        db_session.add_all([rep, user])
+        db_session.flush()
+        busy = DraftBill(representative_id=rep.id, title='Busy', content='Text')
+        quiet = DraftBill(representative_id=rep.id, title='Quiet', content='Text')
+        db_session.add_all([busy, quiet])
+        db_session.flush()
+        db_session.add_all([
+            DraftBillComment(draft_bill_id=busy.id, user_id=user.id, comment_text='One'),
+            DraftBillComment(draft_bill_id=busy.id, user_id=user.id, comment_text='Two'),
+        ])
+        db_session.commit()
+        db_session.expire_all()
+
+        counts = {d.title: d.to_dict()['comment_count'] for d in get_rep_drafts(rep.id)}
+
+        assert counts == {'Busy': 2, 'Quiet': 0}
+
+    def test_bulk_to_dicts_counts_in_one_query(self, app, db_session):
+        """Test that drafts loaded without counts get them from one query."""
+        from sqlalchemy import event
+
+        rep = Representative(district='102', first_name='John', last_name='Roe')
+        user = User(username='bulk_reader', street_address='1 Main St',
+                    city='Columbia', state='MO', zipcode='65201')
+        user.set_password('Pass123!')
+        db_session.add_all([rep, user])
+        db_session.flush()
+        drafts = [DraftBill(representative_id=rep.id, title=f'Draft {i}', content='Text') for i in range(3)]
+        db_session.add_all(drafts)
+        db_session.flush()
+        db_session.add(DraftBillComment(draft_bill_id=drafts[0].id, user_id=user.id, comment_text='Hi'))
+        db_session.commit()
+        db_session.expire_all()
+
+        loaded = DraftBill.query.filter_by(representative_id=rep.id).order_by(DraftBill.id).all()
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            dicts = DraftBill.bulk_to_dicts(loaded)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+        assert [d['comment_count'] for d in dicts] == [1, 0, 0]
+        assert dicts[0]['representative']['name'] == 'John Roe'
+        assert len(statements) == 1
+
+    def test_rep_draft_list_renders_without_queries(self, app, db_session, count_queries):
+        """Test that serializing a rep's draft list needs no further queries."""
+        from services.bill_drafting import get_rep_drafts
+
+        rep = Representative(district='103', first_name='Ann', last_name='Poe')
+        db_session.add(rep)
+        db_session.flush()
+        db_session.add_all(DraftBill(representative_id=rep.id, title=f'Draft {i}', content='Text')
+                           for i in range(3))
+        db_session.commit()
+        db_session.expire_all()
+
+        drafts = get_rep_drafts(rep.id)
+        with count_queries() as queries:
+            dicts = [d.to_dict() for d in drafts]
+
+        assert len(dicts) == 3
+        assert queries == []
+
+    def test_visible_to_matches_can_view(self, app, db_session):
+        """Test that the SQL visibility filter agrees with can_view for each kind of user."""
+        own = Representative(district='104', first_name='Own', last_name='Rep')
+        other = Representative(district='105', first_name='Other', last_name='Rep')
+        db_session.add_all([own, other])
+        db_session.flush()
+        for rep in (own, other):
+            for visibility in ('hidden', 'constituents', 'public'):
+                db_session.add(DraftBill(representative_id=rep.id, title=f'{rep.district} {visibility}',
+                                         content='Text', visibility=visibility))
+
+        def make_user(username, **fields):
+            user = User(username=username, street_address='1 Main St', city='Columbia',
+                        state='MO', zipcode='65201', **fields)
+            user.set_password('Pass123!')
+            return user
+
+        users = [
+            None,
+            make_user('vis_constituent', representative_district='104'),
+            make_user('vis_rep', role='rep', representative_id=own.id),
+            make_user('vis_staffer', role='staffer', rep_boss_id=other.id),
+        ]
+        db_session.add_all(users[1:])
+        db_session.commit()
+
+        drafts = DraftBill.query.filter(DraftBill.representative_id.in_([own.id, other.id])).all()
+        for user in users:
+            expected = {d.title for d in drafts if d.can_view(user)}
+            visible = DraftBill.query.filter(DraftBill.visible_to(user),
+                                             DraftBill.representative_id.in_([own.id, other.id]))
+            assert {d.title for d in visible} == expected
@@ -0,0 +1,94 @@
+"""
+Unit tests for utils/passwords.py
+"""
+
+import threading
+import time
+
+import pytest
+from utils import passwords
+from utils.cache import TTLCache
+from utils.passwords import dummy_verify, hash_password, verify_password
+
+
+@pytest.fixture(autouse=True)
+def empty_verify_cache(monkeypatch):
+    """Give every test its own cache of verified passwords."""
+    monkeypatch.setattr(passwords, '_verified', TTLCache(maxsize=16, ttl=300))
+
+
+@pytest.fixture
+def kdf_calls(monkeypatch):
+    """Count the checks that reach the KDF."""
+    calls = []
+    check = passwords._check_password
+
+    def counting_check(password_hash, password):
+        calls.append(password)
+        return check(password_hash, password)
+
+    monkeypatch.setattr(passwords, '_check_password', counting_check)
+    return calls
+
+
+class TestVerifyPassword:
+    """Test password verification and its cache of successful checks."""
+
+    def test_repeat_success_skips_kdf(self, kdf_calls):
+        """Test that a password verified once is not hashed again."""
+        stored = hash_password('SecurePass123!')
+
+        assert verify_password(stored, 'SecurePass123!') == (True, None)
+        assert verify_password(stored, 'SecurePass123!') == (True, None)
+        assert len(kdf_calls) == 1
+
+    def test_failures_are_not_cached(self, kdf_calls):
+        """Test that every wrong password pays for the KDF."""
+        stored = hash_password('SecurePass123!')
+
+        assert verify_password(stored, 'wrong') == (False, None)
+        assert verify_password(stored, 'wrong') == (False, None)
+        assert len(kdf_calls) == 2
+
+    def test_cache_is_keyed_on_hash(self, kdf_calls):
+        """Test that a changed hash does not reuse an old success."""
+        verify_password(hash_password('SecurePass123!'), 'SecurePass123!')
+
+        assert verify_password(hash_password('NewPass456!'), 'SecurePass123!') == (False, None)
+        assert len(kdf_calls) == 2
+
+    def test_dummy_verify_bypasses_cache(self, kdf_calls):
+        """Test that unknown-user checks always cost a full KDF."""
+        assert dummy_verify('not-a-real-password') is False
+        assert dummy_verify('not-a-real-password') is False
+        assert len(passwords._verified) == 0
+
+    def test_concurrent_checks_are_bounded(self, monkeypatch):
+        """Test that no more KDF calls run at once than there are slots."""
+        stored = hash_password('SecurePass123!')
+        hasher = passwords._argon2
+        running = []
+        peak = []
+
+        class SlowHasher:
+            def verify(self, password_hash, password):
+                running.append(1)
+                peak.append(len(running))
+                time.sleep(0.05)
+                running.pop()
+                return hasher.verify(password_hash, password)
+
+            def check_needs_rehash(self, password_hash):
+                return False
+
+        monkeypatch.setattr(passwords, '_argon2', SlowHasher())
+        monkeypatch.setattr(passwords, '_kdf_slots', threading.BoundedSemaphore(2))
+
+        threads = [threading.Thread(target=verify_password, args=(stored, f'guess{i}')) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(peak) == 6
+        assert max(peak) <= 2
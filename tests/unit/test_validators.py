@@ -8,6 +8,7 @@ from utils.validators import (
     validate_password,
     validate_address,
     validate_apt_unit,
+    validate_zip_state,
     validate_comment_content,
     sanitize_input
 )
@@ -140,6 +141,31 @@ class TestValidateAddress:
         assert valid is False
 
 
+class TestValidateZipState:
+    """Test the offline ZIP prefix/state check."""
+    
+    def test_matching_zip_and_state(self):
+        """Test that a Missouri ZIP passes with MO."""
+        valid, error = validate_zip_state('65101', 'MO')
+        assert valid is True
+        assert error is None
+    
+    def test_zip_plus_four_and_lowercase_state(self):
+        """Test that ZIP+4 and lowercase state codes are accepted."""
+        valid, error = validate_zip_state('63101-1234', 'mo')
+        assert valid is True
+    
+    def test_mismatched_zip_and_state(self):
+        """Test that a Kansas ZIP fails with MO."""
+        valid, error = validate_zip_state('66044', 'MO')
+        assert valid is False
+        assert 'does not match' in error.lower()
+    
+    def test_unknown_prefix_passes(self):
+        """Test that unassigned prefixes are not rejected."""
+        valid, error = validate_zip_state('00001', 'MO')
+        assert valid is True
+
 class TestValidateAptUnit:
     """Test apartment/unit validation."""
     
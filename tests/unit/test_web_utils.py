@@ -0,0 +1,90 @@
+"""
+Unit tests for services/web_utils.py
+"""
+
+import pytest
+from services import web_utils
+from services.web_utils import fetch_remote_page
+from utils.cache import TTLCache
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+
+class _FakeSession:
+    """Stand-in requests session that replays queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    """Give every test its own page caches."""
+    monkeypatch.setattr(web_utils, '_page_cache', TTLCache(maxsize=64, ttl=300))
+    monkeypatch.setattr(web_utils, '_validator_cache', TTLCache(maxsize=64, ttl=300))
+
+
+class TestFetchRemotePage:
+    """Test caching and revalidation of remote pages."""
+
+    def test_repeat_fetch_hits_cache(self, monkeypatch):
+        """Test that a fresh page is only downloaded once."""
+        session = _FakeSession(_FakeResponse(content=b'<html>bills</html>'))
+        monkeypatch.setattr(web_utils, '_session', session)
+
+        assert fetch_remote_page('https://example.test/bills') == '<html>bills</html>'
+        assert fetch_remote_page('https://example.test/bills') == '<html>bills</html>'
+        assert len(session.requests) == 1
+
+    def test_stale_page_revalidated_with_etag(self, monkeypatch):
+        """Test that an expired page is revalidated and a 304 reuses it."""
+        session = _FakeSession(
+            _FakeResponse(content=b'caf\xe9', headers={'ETag': '"v1"'}),
+            _FakeResponse(status_code=304),
+        )
+        monkeypatch.setattr(web_utils, '_session', session)
+
+        assert fetch_remote_page('https://example.test/page') == 'caf\xe9'
+        web_utils._page_cache.clear()
+        assert fetch_remote_page('https://example.test/page') == 'caf\xe9'
+        assert session.requests[1] == {'If-None-Match': '"v1"'}
+
+    def test_declared_charset_decoded_once(self, monkeypatch):
+        """Test that the Content-Type charset is used and bad bytes are replaced."""
+        session = _FakeSession(_FakeResponse(
+            content=b'\xfcber \xff',
+            headers={'Content-Type': 'text/html; charset="cp1252"'},
+        ))
+        monkeypatch.setattr(web_utils, '_session', session)
+
+        assert fetch_remote_page('https://example.test/cp1252') == '\xfcber \xff'
+
+    def test_invalid_bytes_replaced_for_utf8_pages(self, monkeypatch):
+        """Test that a page declaring utf-8 keeps its text around invalid bytes."""
+        session = _FakeSession(_FakeResponse(
+            content=b'ok \xe9',
+            headers={'Content-Type': 'text/html; charset=utf-8'},
+        ))
+        monkeypatch.setattr(web_utils, '_session', session)
+
+        assert fetch_remote_page('https://example.test/utf8') == 'ok \ufffd'
+
+    def test_http_error_returns_none(self, monkeypatch):
+        """Test that error statuses are reported as a failed fetch."""
+        monkeypatch.setattr(web_utils, '_session', _FakeSession(_FakeResponse(status_code=500)))
+
+        assert fetch_remote_page('https://example.test/down') is None
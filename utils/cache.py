@@ -0,0 +1,110 @@
+"""
+Caching helpers.
+
+A small thread-safe TTL + LRU cache used to memoize results of slow external
+calls (USPS, representative lookups, remote pages). Kept dependency-free so
+it works in every environment the app runs in.
+
+shared_get/shared_set/shared_incr front the app's Flask-Caching backend,
+which every worker sees. They quietly do nothing when Flask-Caching is not installed or
+there is no app context, so callers keep their in-process cache either way.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import has_app_context
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after being set.
+
+    When full, the least recently used entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove ``key`` and return its value (or ``default``)."""
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+            return default if entry is _MISSING else entry[1]
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return len(self._data)
+
+
+def shared_get(key):
+    """Return ``key`` from the shared cache, or None if missing/unavailable."""
+    from extensions import cache
+    if cache is None or not has_app_context():
+        return None
+    try:
+        return cache.get(key)
+    except Exception:
+        return None
+
+
+def shared_set(key, value, timeout=None):
+    """Store ``value`` in the shared cache if one is available."""
+    from extensions import cache
+    if cache is None or not has_app_context():
+        return
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception:
+        pass
+
+
+def shared_incr(key, timeout):
+    """Atomically increment the counter ``key`` in the shared cache.
+
+    A new counter starts at 0 and expires ``timeout`` seconds after it is
+    created. Returns the incremented value, or None if no shared cache is
+    available.
+    """
+    from extensions import cache
+    if cache is None or not has_app_context():
+        return None
+    try:
+        cache.add(key, 0, timeout=timeout)
+        return cache.inc(key)
+    except Exception:
+        return None
@@ -16,8 +16,13 @@ class DataFetcher:
     
     MOCK_DATA_FILE = Path(__file__).parent.parent / 'data' / 'mock_data.json'
     
-    def __init__(self):
-        self.is_production = os.environ.get('FLASK_ENV') == 'production'
+    def __init__(self, mode=None):
+        """
+        Args:
+            mode (str): 'production' or 'development'; defaults to FLASK_ENV
+        """
+        mode = mode or os.environ.get('FLASK_ENV')
+        self.is_production = mode == 'production'
         self.mock_data = None
         
     def fetch_bills(self):
@@ -42,11 +47,46 @@ class DataFetcher:
         else:
             return self._get_mock_reps(address_data)
     
+    def fetch_representatives_batch(self, addresses):
+        """
+        Fetch representatives for many addresses with one upstream call per
+        distinct address.
+        
+        Args:
+            addresses (list): Address dicts (street, city, state, zip) with an
+                optional 'id' key
+        
+        Returns:
+            dict: Representative information keyed by each input's 'id'
+                (or its list index when no id is given)
+        """
+        by_address = {}
+        results = {}
+        for index, address_data in enumerate(addresses):
+            key = self.address_key(address_data)
+            if key not in by_address:
+                by_address[key] = self.fetch_representatives(address_data)
+            results[address_data.get('id', index)] = by_address[key]
+        return results
+    
+    @staticmethod
+    def address_key(address_data):
+        """Normalized (street, city, state, zip5) key for an address dict."""
+        def norm(value):
+            return ' '.join((value or '').split()).lower()
+        return (
+            norm(address_data.get('street')),
+            norm(address_data.get('city')),
+            norm(address_data.get('state') or 'MO'),
+            norm(address_data.get('zip'))[:5],
+        )
+    
     def _fetch_real_bills(self):
         """Fetch real bills data from Missouri Legislature website"""
         try:
             from urllib.request import urlopen, Request
             from bs4 import BeautifulSoup
+            from services.web_utils import HTML_PARSER
             
             url = "https://house.mo.gov/BillList.aspx"
             headers = {
@@ -55,7 +95,7 @@ class DataFetcher:
             
             request = Request(url, headers=headers)
             page = urlopen(request, timeout=15)
-            soup = BeautifulSoup(page, 'html.parser')
+            soup = BeautifulSoup(page, HTML_PARSER, from_encoding='utf-8')
             
             bills = []
             # Find all table rows - each bill has a 2-row pattern
@@ -326,10 +366,20 @@ class DataFetcher:
 
 # Singleton instance
 _data_fetcher = None
+_mode_fetchers = {}
 
-def get_data_fetcher():
-    """Get the singleton DataFetcher instance"""
+def get_data_fetcher(mode=None):
+    """Get the shared DataFetcher instance
+    
+    Args:
+        mode (str): Optional 'production' or 'development' to get the shared
+            fetcher for that mode instead of the one for FLASK_ENV
+    """
     global _data_fetcher
+    if mode is not None:
+        if mode not in _mode_fetchers:
+            _mode_fetchers[mode] = DataFetcher(mode)
+        return _mode_fetchers[mode]
     if _data_fetcher is None:
         _data_fetcher = DataFetcher()
     return _data_fetcher
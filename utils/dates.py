@@ -0,0 +1,14 @@
+"""
+Date helpers.
+"""
+from datetime import datetime, timezone
+
+
+def utcnow():
+    """Current UTC time as a naive datetime.
+
+    Replacement for the deprecated datetime.utcnow(). DateTime columns are
+    stored without a timezone, so the tzinfo is dropped to keep comparisons
+    with loaded values working.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,46 @@
+"""
+Flask JSON provider backed by orjson.
+
+jsonify() output is the same JSON the stdlib provider produces (sorted
+keys, HTTP-date datetimes, Decimal as string), just encoded in C. Values
+orjson can't encode, and dumps() calls with other json.dumps options, go
+through Flask's default provider.
+"""
+
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # pragma: no cover
+    orjson = None
+    DefaultJSONProvider = object
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding."""
+
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.pop('indent', None)
+        # Compact output is orjson's only format
+        if kwargs.get('separators') == (',', ':'):
+            kwargs.pop('separators')
+        if kwargs or indent not in (None, 2):
+            return super().dumps(obj, indent=indent, **kwargs)
+
+        # Datetimes go through default() to keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj, indent=indent)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -0,0 +1,125 @@
+"""
+Password hashing policy.
+
+New hashes use Argon2id (via `argon2-cffi`) tuned to roughly 50 ms per hash.
+Legacy Werkzeug `pbkdf2:sha256` hashes still verify and are flagged for
+upgrade so they get rehashed on the user's next successful login. If
+`argon2-cffi` is not installed we fall back to Werkzeug scrypt with pinned
+parameters (~100 ms) rather than Werkzeug's default pbkdf2, which costs
+over 300 ms per hash and ties up a worker for that long on every login.
+
+Successful checks are remembered for a few minutes so re-entering the
+same password (re-auth, password change forms) skips the KDF. At most
+PASSWORD_KDF_CONCURRENCY hashes (default: one per CPU) run at once in a
+process, so a burst of logins queues instead of taking every core and
+32 MiB per hash away from the other requests' threads.
+"""
+
+import functools
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+from typing import Optional, Tuple
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from utils.cache import TTLCache
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    _argon2 = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+except ImportError:  # pragma: no cover
+    _argon2 = None
+
+_ARGON2_PREFIX = '$argon2'
+
+# N=2**15, r=8, p=1: 32 MiB of memory per hash
+_FALLBACK_METHOD = 'scrypt:32768:8:1'
+
+# Keys of recently verified (hash, password) pairs. Keys are HMACs under a
+# per-process random pepper, so neither passwords nor anything that can be
+# brute-forced offline is kept. Failures are never cached, and a changed
+# hash (new password or rehash) simply misses.
+_VERIFY_PEPPER = secrets.token_bytes(32)
+_verified = TTLCache(maxsize=4096, ttl=300)
+
+# Held around every KDF call (hash or verify). The hashers release the GIL,
+# so without a bound each request thread would run its own hash in parallel
+_kdf_slots = threading.BoundedSemaphore(
+    int(os.environ.get('PASSWORD_KDF_CONCURRENCY', 0)) or os.cpu_count() or 1
+)
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the preferred scheme."""
+    with _kdf_slots:
+        if _argon2 is not None:
+            return _argon2.hash(password)
+        return generate_password_hash(password, method=_FALLBACK_METHOD, salt_length=16)
+
+
+def _verify_key(password_hash: str, password: str) -> bytes:
+    return hmac.new(_VERIFY_PEPPER, f'{password_hash}\0{password}'.encode(), hashlib.sha256).digest()
+
+
+def verify_password(password_hash: Optional[str], password: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password against a stored hash.
+
+    Returns:
+        (is_valid, new_hash) where new_hash is a replacement hash when the
+        stored one uses a deprecated scheme or parameters, else None.
+    """
+    if not password_hash or password is None:
+        return False, None
+
+    key = _verify_key(password_hash, password)
+    if _verified.get(key):
+        return True, None
+
+    is_valid, new_hash = _check_password(password_hash, password)
+    if is_valid and new_hash is None:
+        _verified.set(key, True)
+    return is_valid, new_hash
+
+
+def _check_password(password_hash: str, password: str) -> Tuple[bool, Optional[str]]:
+    """verify_password without the cache; always pays for the KDF."""
+    if password_hash.startswith(_ARGON2_PREFIX):
+        if _argon2 is None:
+            return False, None
+        try:
+            with _kdf_slots:
+                _argon2.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False, None
+        if _argon2.check_needs_rehash(password_hash):
+            return True, hash_password(password)
+        return True, None
+
+    with _kdf_slots:
+        is_valid = check_password_hash(password_hash, password)
+    if not is_valid:
+        return False, None
+    return True, hash_password(password) if _argon2 is not None else None
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return hash_password('not-a-real-password')
+
+
+def dummy_verify(password: Optional[str]) -> bool:
+    """
+    Burn the same KDF work as a real check against a throwaway hash.
+
+    Used when a login names an unknown user so the response costs the same
+    as a wrong password for an existing one. Always returns False.
+    """
+    # Bypasses the cache: a cached hit would make unknown users fast again
+    _check_password(_dummy_hash(), password or '')
+    return False
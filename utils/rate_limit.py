@@ -0,0 +1,137 @@
+"""
+Client-side rate limiting helpers.
+
+Used to pace calls to external APIs that enforce request quotas so that a
+burst of traffic does not exhaust the quota and trigger cascading 429s.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter enforcing one or more ``(limit, period)`` rates.
+
+    Example: ``RateLimiter((5, 60), (60, 3600))`` allows at most 5 calls per
+    minute and 60 per hour.
+    """
+
+    def __init__(self, *rates):
+        now = time.monotonic()
+        # Each bucket: [capacity, refill tokens/sec, available tokens, last refill]
+        self._buckets = [[limit, limit / period, float(limit), now] for limit, period in rates]
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        for bucket in self._buckets:
+            capacity, rate, tokens, last = bucket
+            bucket[2] = min(capacity, tokens + (now - last) * rate)
+            bucket[3] = now
+
+    def try_acquire(self):
+        """Take one token from every bucket.
+
+        Returns:
+            0.0 if the call may proceed, otherwise the number of seconds
+            until a token becomes available (nothing is consumed).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(
+                ((1 - tokens) / rate for _, rate, tokens, _ in self._buckets if tokens < 1),
+                default=0.0,
+            )
+            if wait:
+                return wait
+            for bucket in self._buckets:
+                bucket[2] -= 1
+            return 0.0
+
+
+class FixedWindowLimiter:
+    """Per-key fixed-window counter enforcing one or more ``(limit, period)`` rates.
+
+    Used for inbound throttling (e.g. per client IP). A key is admitted while
+    its hit count in the current window of every rate is below the limit.
+    hit() keeps state per process, tracking at most ``maxsize`` keys;
+    hit_shared() keeps it in a store every process sees, under ``name``.
+    """
+
+    def __init__(self, *rates, name='default', maxsize=10_000):
+        self._rates = rates
+        self.name = name
+        self._maxsize = maxsize
+        # key -> list of [window start, hits] aligned with self._rates
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key):
+        """Record a hit for ``key``.
+
+        Returns:
+            0.0 if the hit is admitted, otherwise the number of seconds until
+            the blocking window resets (the hit is not counted).
+        """
+        with self._lock:
+            now = time.monotonic()
+            windows = self._windows.get(key)
+            if windows is None:
+                if len(self._windows) >= self._maxsize:
+                    self._prune(now)
+                windows = self._windows[key] = [[now, 0] for _ in self._rates]
+            for window, (_, period) in zip(windows, self._rates):
+                if now - window[0] >= period:
+                    window[0], window[1] = now, 0
+            wait = max(
+                (window[0] + period - now
+                 for window, (limit, period) in zip(windows, self._rates)
+                 if window[1] >= limit),
+                default=0.0,
+            )
+            if wait:
+                return wait
+            for window in windows:
+                window[1] += 1
+            return 0.0
+
+    def hit_shared(self, key, incr):
+        """Record a hit for ``key`` in a store shared by every process.
+
+        ``incr(store_key, timeout)`` must atomically increment a counter that
+        expires after ``timeout`` seconds and return its new value (e.g. Redis
+        INCR), or None when the store is unavailable, in which case the hit
+        falls back to the in-process hit(). Windows are aligned to the wall
+        clock so every process agrees on them. Unlike hit(), a rejected hit
+        is still counted.
+
+        Returns:
+            0.0 if the hit is admitted, otherwise the number of seconds until
+            the blocking window resets.
+        """
+        now = time.time()
+        wait = 0.0
+        for limit, period in self._rates:
+            window = int(now // period)
+            count = incr(f'ratelimit:{self.name}:{period}:{key}:{window}', period)
+            if count is None:
+                return self.hit(key)
+            if count > limit:
+                wait = max(wait, (window + 1) * period - now)
+        return wait
+
+    def reset(self):
+        """Forget all tracked keys (in this process)."""
+        with self._lock:
+            self._windows.clear()
+
+    def _prune(self, now):
+        """Drop keys whose windows have all expired, or the oldest if none have."""
+        expired = [
+            key for key, windows in self._windows.items()
+            if all(now - window[0] >= period for window, (_, period) in zip(windows, self._rates))
+        ]
+        for key in expired:
+            del self._windows[key]
+        if len(self._windows) >= self._maxsize:
+            del self._windows[next(iter(self._windows))]
@@ -5,6 +5,47 @@ import re
 import os
 from typing import Tuple, Set, Optional
 
+# Precompiled patterns used on every form submission
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+_ANGLE_BRACKET_RE = re.compile(r'[<>]')
+_STATE_RE = re.compile(r'^[A-Z]{2}$')
+_ZIP_RE = re.compile(r'^\d{5}(-\d{4})?$')
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_RE = re.compile(r'[^A-Za-z0-9]')
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_SCRIPT_RE = re.compile(r'<script.*?>.*?</script>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# First three ZIP digits -> state, from USPS prefix allocations. Prefixes
+# shared by several states/territories (967, 969) or unassigned are left
+# out and never rejected.
+_ZIP3_RANGES = (
+    (5, 5, 'NY'), (6, 7, 'PR'), (8, 8, 'VI'), (9, 9, 'PR'),
+    (10, 27, 'MA'), (28, 29, 'RI'), (30, 38, 'NH'), (39, 49, 'ME'),
+    (50, 54, 'VT'), (55, 55, 'MA'), (56, 59, 'VT'), (60, 69, 'CT'),
+    (70, 89, 'NJ'), (90, 98, 'AE'), (100, 149, 'NY'), (150, 196, 'PA'),
+    (197, 199, 'DE'), (200, 200, 'DC'), (201, 201, 'VA'), (202, 205, 'DC'),
+    (206, 219, 'MD'), (220, 246, 'VA'), (247, 268, 'WV'), (270, 289, 'NC'),
+    (290, 299, 'SC'), (300, 319, 'GA'), (320, 339, 'FL'), (340, 340, 'AA'),
+    (341, 349, 'FL'), (350, 369, 'AL'), (370, 385, 'TN'), (386, 397, 'MS'),
+    (398, 399, 'GA'), (400, 427, 'KY'), (430, 459, 'OH'), (460, 479, 'IN'),
+    (480, 499, 'MI'), (500, 528, 'IA'), (530, 549, 'WI'), (550, 567, 'MN'),
+    (569, 569, 'DC'), (570, 577, 'SD'), (580, 588, 'ND'), (590, 599, 'MT'),
+    (600, 629, 'IL'), (630, 658, 'MO'), (660, 679, 'KS'), (680, 693, 'NE'),
+    (700, 714, 'LA'), (716, 729, 'AR'), (730, 731, 'OK'), (733, 733, 'TX'),
+    (734, 749, 'OK'), (750, 799, 'TX'), (800, 816, 'CO'), (820, 831, 'WY'),
+    (832, 838, 'ID'), (840, 847, 'UT'), (850, 865, 'AZ'), (870, 884, 'NM'),
+    (885, 885, 'TX'), (889, 898, 'NV'), (900, 961, 'CA'), (962, 966, 'AP'),
+    (968, 968, 'HI'), (970, 979, 'OR'), (980, 994, 'WA'), (995, 999, 'AK'),
+)
+_ZIP3_TO_STATE = {
+    f'{prefix:03d}': state
+    for low, high, state in _ZIP3_RANGES
+    for prefix in range(low, high + 1)
+}
+
 # Load common passwords list
 _COMMON_PASSWORDS: Set[str] = set()
 _COMMON_PASSWORDS_FILE = os.path.join(os.path.dirname(__file__), 'common_passwords.txt')
@@ -48,7 +89,7 @@ def validate_username(username: Optional[str]) -> Tuple[bool, Optional[str]]:
     if len(username) > 50:
         return False, "Username must be no more than 50 characters."
     
-    if not re.match(r'^[a-zA-Z0-9_]+$', username):
+    if not _USERNAME_RE.match(username):
         return False, "Username must be alphanumeric (letters, numbers, underscores only)."
     
     return True, None
@@ -74,15 +115,15 @@ def validate_password(password: Optional[str]) -> Tuple[bool, Optional[str]]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long."
     
-    if not re.search(r'[A-Z]', password):
+    if not _UPPER_RE.search(password):
         return False, "Password must contain at least one uppercase letter."
     
-    if not re.search(r'[a-z]', password):
+    if not _LOWER_RE.search(password):
         return False, "Password must contain at least one lowercase letter."
     
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "Password must contain at least one digit."
-    if not re.search(r'[^A-Za-z0-9]', password):
+    if not _SPECIAL_RE.search(password):
         return False, "Password must contain at least one special character."
     
     # Check against common passwords list (case-insensitive)
@@ -107,7 +148,7 @@ def validate_address(street_address: Optional[str], city: Optional[str]=None, st
     if len(sa) > 200:
         return False, "Street address must be no more than 200 characters."
     # Basic invalid character check: disallow angle brackets
-    if re.search(r'[<>]', sa):
+    if _ANGLE_BRACKET_RE.search(sa):
         return False, "Street address contains invalid characters."
     
     if city is not None:
@@ -120,18 +161,34 @@ def validate_address(street_address: Optional[str], city: Optional[str]=None, st
         if not state.strip():
             return False, "State is required."
         state_clean = state.strip().upper()
-        if not re.match(r'^[A-Z]{2}$', state_clean):
+        if not _STATE_RE.match(state_clean):
             return False, "State must be a 2-letter code (e.g., MO)."
     
     if zipcode is not None:
         if not zipcode.strip():
             return False, "Zip code is required."
         zipcode_clean = zipcode.strip()
-        if not re.match(r'^\d{5}(-\d{4})?$', zipcode_clean):
+        if not _ZIP_RE.match(zipcode_clean):
             return False, "Zip code must be 5 digits or 9 digits with hyphen (e.g., 12345 or 12345-6789)."
     return True, None
 
 
+def validate_zip_state(zipcode: Optional[str], state: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    Check that a ZIP code's prefix belongs to the given state.
+    
+    Offline sanity check that runs before address verification; unknown
+    prefixes pass.
+    
+    Returns:
+        (is_valid, error_message)
+    """
+    expected = _ZIP3_TO_STATE.get((zipcode or '').strip()[:3])
+    if expected and expected != (state or '').strip().upper():
+        return False, "Zip code does not match the selected state."
+    return True, None
+
+
 def validate_apt_unit(apt_unit: Optional[str]) -> Tuple[bool, Optional[str]]:
     """
     Validate apartment/unit number (optional field).
@@ -142,7 +199,7 @@ def validate_apt_unit(apt_unit: Optional[str]) -> Tuple[bool, Optional[str]]:
     if apt_unit and len(apt_unit.strip()) > 50:
         return False, "Apt/Unit must be no more than 50 characters."
     # Detect obvious HTML/script injection
-    if apt_unit and re.search(r'<[^>]*>', apt_unit):
+    if apt_unit and _HTML_TAG_RE.search(apt_unit):
         return False, "Apt/Unit contains invalid characters."
     return True, None
 
@@ -162,10 +219,12 @@ def sanitize_input(text: Optional[str], max_length: int = None) -> str:
         return ""
     
     sanitized = text.strip()
-    # Remove script tags entirely
-    sanitized = re.sub(r'<script.*?>.*?</script>', '', sanitized, flags=re.IGNORECASE|re.DOTALL)
-    # Remove other HTML tags but keep their inner text
-    sanitized = re.sub(r'<[^>]+>', '', sanitized)
+    # Tags need a '<'; most input has none, so skip the regex passes
+    if '<' in sanitized:
+        # Remove script tags entirely
+        sanitized = _SCRIPT_RE.sub('', sanitized)
+        # Remove other HTML tags but keep their inner text
+        sanitized = _TAG_RE.sub('', sanitized)
     
     if max_length and len(sanitized) > max_length:
         sanitized = sanitized[:max_length]